@@ -0,0 +1,85 @@
+# Microbenchmark of the acknowledgment life cycle on asynchronous boundaries: create an acknowledgment, register
+# a callback and complete it. The native Ack is compared with the former implementation, an rx AsyncSubject.
+import timeit
+import tracemalloc
+
+from rx.concurrency import immediate_scheduler
+from rx.subjects import AsyncSubject
+
+from rxbackpressure.ack import Ack, continue_ack
+
+n_acks = 100000
+
+
+class AsyncSubjectAck(AsyncSubject):
+    pass
+
+
+def noop(v):
+    pass
+
+
+def native_life_cycle():
+    ack = Ack()
+    ack.on_complete(noop)
+    ack.on_next(continue_ack)
+    ack.on_completed()
+
+
+def native_life_cycle_scheduled():
+    ack = Ack()
+    ack.on_complete(noop, scheduler=immediate_scheduler)
+    ack.on_next(continue_ack)
+    ack.on_completed()
+
+
+def legacy_life_cycle():
+    ack = AsyncSubjectAck()
+    ack.subscribe(on_next=noop)
+    ack.on_next(continue_ack)
+    ack.on_completed()
+
+
+def legacy_life_cycle_scheduled():
+    ack = AsyncSubjectAck()
+    ack.observe_on(immediate_scheduler).subscribe(on_next=noop)
+    ack.on_next(continue_ack)
+    ack.on_completed()
+
+
+def allocations(factory, register):
+    """ returns the number of memory blocks and bytes held by a single pending acknowledgment with one callback
+    """
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    acks = []
+    for _ in range(n_acks):
+        ack = factory()
+        register(ack)
+        acks.append(ack)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(s.count_diff for s in stats)
+    size = sum(s.size_diff for s in stats)
+    return blocks / n_acks, size / n_acks
+
+
+def per_element(func):
+    return min(timeit.repeat(func, number=n_acks, repeat=5)) / n_acks * 1e6
+
+
+if __name__ == '__main__':
+    print('{:<28}{:>14}{:>14}'.format('', 'native Ack', 'AsyncSubject'))
+
+    for name, native, legacy in [('life cycle [us]', native_life_cycle, legacy_life_cycle),
+                                 ('scheduled life cycle [us]', native_life_cycle_scheduled,
+                                  legacy_life_cycle_scheduled)]:
+        print('{:<28}{:>14.3f}{:>14.3f}'.format(name, per_element(native), per_element(legacy)))
+
+    native_blocks, native_size = allocations(Ack, lambda ack: ack.on_complete(noop))
+    legacy_blocks, legacy_size = allocations(AsyncSubjectAck, lambda ack: ack.subscribe(on_next=noop))
+    print('{:<28}{:>14.1f}{:>14.1f}'.format('allocated blocks per ack', native_blocks, legacy_blocks))
+    print('{:<28}{:>14.0f}{:>14.0f}'.format('allocated bytes per ack', native_size, legacy_size))
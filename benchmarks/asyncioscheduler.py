@@ -0,0 +1,91 @@
+# Scheduling throughput of the asyncio scheduler, for actions scheduled from the loop itself (attached to a running
+# loop) and from another thread (loop running on its own thread). The raw loop calls are given as reference.
+import asyncio
+import threading
+import time
+
+from rxbackpressure.schedulers.asyncioscheduler import AsyncIOScheduler
+
+n_actions = 100000
+
+
+def run_chain(schedule, loop):
+    """ schedules `n_actions` actions one after another, each action schedules the next one
+    """
+
+    done = threading.Event()
+    count = [0]
+
+    def action(_, __):
+        count[0] += 1
+        if count[0] < n_actions:
+            schedule(action)
+        else:
+            done.set()
+
+    start = time.perf_counter()
+    schedule(action)
+    if loop is not None:
+        loop.run_until_complete(wait(done))
+    else:
+        done.wait()
+    return (time.perf_counter() - start) / n_actions * 1e6
+
+
+async def wait(done: threading.Event):
+    while not done.is_set():
+        await asyncio.sleep(0.001)
+
+
+def run_burst(schedule):
+    """ schedules `n_actions` actions from the current thread and waits for the last one
+    """
+
+    done = threading.Event()
+    count = [0]
+
+    def action(_, __):
+        count[0] += 1
+        if count[0] == n_actions:
+            done.set()
+
+    start = time.perf_counter()
+    for _ in range(n_actions):
+        schedule(action)
+    done.wait()
+    return (time.perf_counter() - start) / n_actions * 1e6
+
+
+def same_loop():
+    loop = asyncio.new_event_loop()
+
+    async def attach():
+        return AsyncIOScheduler(loop=loop)
+
+    scheduler = loop.run_until_complete(attach())
+
+    def threadsafe(action):
+        loop.call_soon_threadsafe(action, scheduler, None)
+
+    results = (min(run_chain(scheduler.schedule, loop) for _ in range(5)),
+               min(run_chain(threadsafe, loop) for _ in range(5)))
+    loop.close()
+    return results
+
+
+def other_thread():
+    scheduler = AsyncIOScheduler()
+
+    def threadsafe(action):
+        scheduler.loop.call_soon_threadsafe(action, scheduler, None)
+
+    results = (min(run_burst(scheduler.schedule) for _ in range(5)),
+               min(run_burst(threadsafe) for _ in range(5)))
+    scheduler.dispose()
+    return results
+
+
+if __name__ == '__main__':
+    print('{:<28}{:>14}{:>26}'.format('[us per action]', 'scheduler', 'call_soon_threadsafe'))
+    print('{:<28}{:>14.3f}{:>26.3f}'.format('same loop (attached)', *same_loop()))
+    print('{:<28}{:>14.3f}{:>26.3f}'.format('other thread', *other_thread()))
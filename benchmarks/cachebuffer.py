@@ -0,0 +1,79 @@
+# Scaling of the buffer of CachedServeFirstSubject with the buffer depth and the number of subscribers. The ring
+# buffer and the index counter are compared with the former list buffer and the minimum search over all indices.
+import timeit
+
+from rxbackpressure.subjects.cachedservefirstsubject import CachedServeFirstSubject
+
+n_items = 20000
+
+
+class ListBuffer:
+    def __init__(self):
+        self.first_idx = 0
+        self.queue = []
+
+    def append(self, value):
+        self.queue.append(value)
+
+    def get(self, idx):
+        return self.queue[idx - self.first_idx]
+
+    def dequeue(self, idx):
+        while self.first_idx <= idx and len(self.queue) > 0:
+            self.first_idx += 1
+            self.queue.pop(0)
+
+
+def buffer_depth(factory, depth: int):
+    """ the slowest subscriber lags `depth` items behind, each item is appended, read and dequeued once
+    """
+
+    def func():
+        buffer = factory()
+        for idx in range(depth):
+            buffer.append(idx)
+        for idx in range(depth, depth + n_items):
+            buffer.append(idx)
+            buffer.get(idx - depth)
+            buffer.dequeue(idx - depth)
+
+    return min(timeit.repeat(func, number=1, repeat=5)) / n_items * 1e6
+
+
+def slowest_index_min(n_subscribers: int):
+    def func():
+        current_index = {s: 0 for s in range(n_subscribers)}
+        for idx in range(1, n_items // n_subscribers + 1):
+            for s in range(n_subscribers):
+                current_index[s] = idx
+                min(current_index.values()) == idx
+
+    return min(timeit.repeat(func, number=1, repeat=5)) / n_items * 1e6
+
+
+def slowest_index_counter(n_subscribers: int):
+    def func():
+        counter = CachedServeFirstSubject.IndexCounter()
+        for s in range(n_subscribers):
+            counter.add(0)
+        for idx in range(1, n_items // n_subscribers + 1):
+            for s in range(n_subscribers):
+                counter.move(idx - 1, idx)
+                counter.min_idx == idx
+
+    return min(timeit.repeat(func, number=1, repeat=5)) / n_items * 1e6
+
+
+if __name__ == '__main__':
+    print('{:<28}{:>14}{:>14}'.format('[us per item]', 'list', 'ring buffer'))
+    for depth in [10, 1000, 10000, 100000]:
+        print('{:<28}{:>14.3f}{:>14.3f}'.format('buffer depth {}'.format(depth),
+                                                buffer_depth(ListBuffer, depth),
+                                                buffer_depth(CachedServeFirstSubject.DequeuableBuffer, depth)))
+
+    print()
+    print('{:<28}{:>14}{:>14}'.format('[us per index update]', 'min', 'counter'))
+    for n_subscribers in [1, 10, 100, 1000]:
+        print('{:<28}{:>14.3f}{:>14.3f}'.format('{} subscribers'.format(n_subscribers),
+                                                slowest_index_min(n_subscribers),
+                                                slowest_index_counter(n_subscribers)))
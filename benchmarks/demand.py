@@ -0,0 +1,44 @@
+# Throughput benchmark of an `observe_on` thread hop. In acknowledgment mode the producer waits for the
+# acknowledgment of every item sent to the other thread; in demand mode the consumer requests items in advance
+# and tops up its credits at a low watermark.
+import threading
+import time
+
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.schedulers.eventloopscheduler import EventLoopScheduler
+
+n_items = 200000
+
+
+def throughput(request_size, producer_thread: bool):
+    """ returns the number of items per second received by the consumer thread
+    """
+
+    is_completed = threading.Event()
+    received = [0]
+
+    def on_next(v):
+        received[0] += 1
+
+    source = ObservableOp.from_(range(n_items))
+    if producer_thread:
+        source = source.execute_on(EventLoopScheduler())
+
+    start = time.perf_counter()
+    source.observe_on(EventLoopScheduler(), request_size=request_size) \
+        .subscribe_with(on_next=on_next, on_completed=is_completed.set)
+    is_completed.wait()
+    elapsed = time.perf_counter() - start
+
+    assert received[0] == n_items
+    return n_items / elapsed
+
+
+if __name__ == '__main__':
+    modes = [('ack mode', None), ('demand mode, request 16', 16), ('demand mode, request 128', 128),
+             ('demand mode, request 1024', 1024)]
+
+    print('{:<28}{:>18}{:>18}'.format('[items/s]', 'current thread', 'producer thread'))
+    for name, request_size in modes:
+        print('{:<28}{:>18.0f}{:>18.0f}'.format(name, throughput(request_size, producer_thread=False),
+                                                throughput(request_size, producer_thread=True)))
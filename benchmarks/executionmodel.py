@@ -0,0 +1,53 @@
+# Longest frame (time between two reschedules) and per-item cost of from_ with a fixed batched execution, an
+# adaptive execution that targets frames of 1 ms, a time budget of 1 ms per frame and an always asynchronous
+# execution, for cheap items and for items that take about 50 us.
+import time
+
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.scheduler import BatchedExecution, AdaptiveExecution, TimeBudgetExecution, \
+    AlwaysAsyncExecution
+from rxbackpressure.schedulers.trampolinescheduler import TrampolineScheduler
+
+n_items = 20000
+
+
+class RecordingScheduler(TrampolineScheduler):
+    def __init__(self, execution_model):
+        super().__init__(execution_model=execution_model)
+        self.times = []
+
+    def schedule(self, action, state=None):
+        self.times.append(time.perf_counter())
+        return super().schedule(action, state)
+
+
+def busy(duration: float):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+
+def run(execution_model, item_cost: float, n: int):
+    scheduler = RecordingScheduler(execution_model)
+
+    def on_next(v):
+        if item_cost:
+            busy(item_cost)
+
+    start = time.perf_counter()
+    ObservableOp.from_(range(n)).subscribe_with(on_next=on_next, scheduler=scheduler, subscribe_scheduler=scheduler)
+    end = time.perf_counter()
+
+    times = scheduler.times + [end]
+    longest_frame = max(b - a for a, b in zip(times, times[1:]))
+    return (end - start) / n * 1e6, longest_frame * 1e3
+
+
+if __name__ == '__main__':
+    print('{:<36}{:>16}{:>20}'.format('', 'us per item', 'longest frame [ms]'))
+    for name, cost, n in [('cheap items', 0, n_items), ('items of 50 us', 50e-6, n_items // 10)]:
+        for em_name, em in [('batched (256)', BatchedExecution(256)), ('adaptive (1 ms)', AdaptiveExecution()),
+                            ('time budget (1 ms)', TimeBudgetExecution()), ('always async', AlwaysAsyncExecution())]:
+            results = [run(em, cost, n) for _ in range(5)]
+            print('{:<36}{:>16.3f}{:>20.3f}'.format(name + ', ' + em_name, min(r[0] for r in results),
+                                                    min(r[1] for r in results)))
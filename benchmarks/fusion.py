@@ -0,0 +1,43 @@
+# Per-item overhead of a chain of synchronous operators. The fused chain is created by ObservableOp and runs in a
+# single observer; the unfused chain nests the operator observables directly.
+import timeit
+
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.observables.filterobservable import FilterObservable
+from rxbackpressure.observables.mapobservable import MapObservable
+from rxbackpressure.observables.pairwiseobservable import PairwiseObservable
+from rxbackpressure.observables.zipwithindexobservable import ZipWithIndexObservable
+
+n_items = 100000
+
+
+def fused_chain(source):
+    return source \
+        .map(lambda v: v + 1) \
+        .filter(lambda v: v % 7 != 0) \
+        .map_count(lambda v, i: v * i) \
+        .pairwise(lambda v1, v2: v2 - v1) \
+        .map(lambda v: v // 2)
+
+
+def unfused_chain(source):
+    observable = MapObservable(source, lambda v: v + 1)
+    observable = FilterObservable(observable, lambda v: v % 7 != 0)
+    observable = ZipWithIndexObservable(observable, lambda v, i: v * i)
+    observable = PairwiseObservable(observable, lambda v1, v2: v2 - v1)
+    return MapObservable(observable, lambda v: v // 2)
+
+
+def run(chain, batch_size=None):
+    def func():
+        received = []
+        chain(ObservableOp.from_(range(n_items), batch_size=batch_size)).subscribe_with(on_next=received.append)
+
+    return min(timeit.repeat(func, number=1, repeat=15)) / n_items * 1e6
+
+
+if __name__ == '__main__':
+    print('{:<28}{:>14}{:>14}'.format('[us per item]', 'unfused', 'fused'))
+    print('{:<28}{:>14.3f}{:>14.3f}'.format('source only', run(lambda s: s), run(lambda s: s)))
+    print('{:<28}{:>14.3f}{:>14.3f}'.format('on_next', run(unfused_chain), run(fused_chain)))
+    print('{:<28}{:>14.3f}{:>14.3f}'.format('on_next_batch (256)', run(unfused_chain, 256), run(fused_chain, 256)))
@@ -0,0 +1,34 @@
+# Per-item cost of pipelines on the current thread scheduler with locks (default) and with the no-op locks of the
+# single-threaded mode.
+import timeit
+
+from rxbackpressure.observableop import ObservableOp
+
+n_items = 20000
+
+
+def from_range():
+    return ObservableOp.from_(range(n_items))
+
+
+pipelines = [
+    ('from_', lambda st: from_range()),
+    ('zip', lambda st: from_range().zip(from_range())),
+    ('share + zip', lambda st: from_range().share(single_threaded=st).map(lambda v: v + 1).zip(from_range())),
+    ('cache', lambda st: from_range().cache(single_threaded=st)),
+]
+
+
+def run(pipeline, single_threaded: bool):
+    def func():
+        received = []
+        pipeline(single_threaded).subscribe_with(on_next=received.append, single_threaded=single_threaded)
+        assert len(received) == n_items
+
+    return min(timeit.repeat(func, number=1, repeat=5)) / n_items * 1e6
+
+
+if __name__ == '__main__':
+    print('{:<28}{:>14}{:>18}'.format('[us per item]', 'locks', 'single-threaded'))
+    for name, pipeline in pipelines:
+        print('{:<28}{:>14.3f}{:>18.3f}'.format(name, run(pipeline, False), run(pipeline, True)))
@@ -0,0 +1,37 @@
+# Per-item cost of zipping k observables with chained zip (k - 1 nested Zip2Observable) and with zip_all (a single
+# ZipNObservable).
+import timeit
+
+from rxbackpressure.observableop import ObservableOp
+
+n_items = 5000
+
+
+def from_range():
+    return ObservableOp.from_(range(n_items))
+
+
+def chained_zip(k: int):
+    zipped = from_range()
+    for _ in range(k - 1):
+        zipped = zipped.zip(from_range())
+    return zipped
+
+
+def zip_all(k: int):
+    return ObservableOp.zip_all(*[from_range() for _ in range(k)])
+
+
+def run(pipeline, k: int):
+    def func():
+        received = []
+        pipeline(k).subscribe_with(on_next=received.append)
+        assert len(received) == n_items
+
+    return min(timeit.repeat(func, number=1, repeat=5)) / n_items * 1e6
+
+
+if __name__ == '__main__':
+    print('{:<12}{:>16}{:>16}'.format('[us per item]', 'chained zip', 'zip_all'))
+    for k in (2, 4, 8, 16):
+        print('{:<12}{:>16.3f}{:>16.3f}'.format('k={}'.format(k), run(chained_zip, k), run(zip_all, k)))
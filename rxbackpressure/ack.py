@@ -1,4 +1,7 @@
-from rx.subjects import AsyncSubject
+from typing import Callable, Any
+
+from rx import config
+
 
 class Success:
     def __init__(self, next):
@@ -8,7 +11,92 @@ class Failure:
     pass
 
 
-class Ack(AsyncSubject):
+# completing an acknowledgment and registering a callback on it is serialized by a single lock shared by all
+# acknowledgments; the critical sections are tiny and it saves a lock allocation per acknowledgment
+_lock = config['concurrency'].Lock()
+
+
+class Ack:
+    """ A promise that is completed exactly once with either `Continue` or `Stop`, or with an exception.
+
+    An acknowledgment is completed the same way as an rx AsyncSubject: `on_next` stores the value and
+    `on_completed` completes the acknowledgment with it.
+    """
+
+    __slots__ = ('has_value', 'value', 'exception', 'is_stopped', '_next_value', '_callbacks')
+
+    def __init__(self):
+        self.has_value = False
+        self.value = None
+        self.exception = None
+        self.is_stopped = False
+
+        self._next_value = None
+        self._callbacks = None
+
+    def on_next(self, value: 'Ack'):
+        self._next_value = value
+
+    def on_completed(self):
+        self._complete(self._next_value, None)
+
+    def on_error(self, exc: Exception):
+        self._complete(None, exc)
+
+    def _complete(self, value, exc):
+        with _lock:
+            if self.is_stopped:
+                return
+
+            self.value = value
+            self.has_value = exc is None
+            self.exception = exc
+            self.is_stopped = True
+
+            callbacks = self._callbacks
+            self._callbacks = None
+
+        if callbacks is not None:
+            for callback, scheduler, on_error in callbacks:
+                self._dispatch(callback, scheduler, on_error)
+
+    def _dispatch(self, callback, scheduler, on_error):
+        if self.exception is None:
+            func, arg = callback, self.value
+        elif on_error is not None:
+            func, arg = on_error, self.exception
+        else:
+            return
+
+        if scheduler is None:
+            func(arg)
+        else:
+            def action(_, __):
+                func(arg)
+
+            scheduler.schedule(action)
+
+    def on_complete(self, callback: Callable[['Ack'], Any], scheduler=None,
+                    on_error: Callable[[Exception], Any] = None):
+        """ Calls `callback` with the value of the acknowledgment once it is completed, replaces
+        `ack.observe_on(scheduler).subscribe(...)`
+
+        :param callback: function that takes `Continue` or `Stop`
+        :param scheduler: (optional) the callback is scheduled on this scheduler instead of being called directly
+        :param on_error: (optional) function called if the acknowledgment is completed with an exception
+        """
+
+        if not self.is_stopped:
+            with _lock:
+                if not self.is_stopped:
+                    if self._callbacks is None:
+                        self._callbacks = [(callback, scheduler, on_error)]
+                    else:
+                        self._callbacks.append((callback, scheduler, on_error))
+                    return
+
+        self._dispatch(callback, scheduler, on_error)
+
     def merge_ack(self, ack2: 'Ack'):
         if isinstance(ack2, Continue):
             return_ack = self
@@ -16,72 +104,121 @@ class Ack(AsyncSubject):
             return_ack = ack2
         else:
             return_ack = Ack()
+            values = []
+
+            def _(v):
+                with _lock:
+                    values.append(v)
+                    is_last = len(values) == 2
 
-            def _(v1, v2):
-                if isinstance(v1, Stop) or isinstance(v2, Stop):
-                    return Stop()
-                else:
-                    return Continue()
+                if is_last:
+                    if any(isinstance(v, Stop) for v in values):
+                        return_ack.on_next(stop_ack)
+                    else:
+                        return_ack.on_next(continue_ack)
+                    return_ack.on_completed()
 
-            self.zip(ack2, _).subscribe(return_ack)
+            self.on_complete(_, on_error=return_ack.on_error)
+            ack2.on_complete(_, on_error=return_ack.on_error)
 
         return return_ack
 
-    def print_sth(self):
-        print('ok')
+    def connect_ack(self, next_ack: 'Ack', scheduler=None):
+        def _(v):
+            next_ack.on_next(v)
+            next_ack.on_completed()
 
-    def connect_ack(self, next_ack: 'Ack'):
-        self.subscribe(next_ack)
+        self.on_complete(_, scheduler=scheduler, on_error=next_ack.on_error)
 
     def connect_ack_2(self, ack2: 'Ack', next_ack: 'Ack'):
         if isinstance(ack2, Stop):
             next_ack.on_next(ack2)
             next_ack.on_completed()
         elif isinstance(ack2, Continue):
-            self.subscribe(next_ack)
+            self.connect_ack(next_ack)
         else:
-            def _(v1, v2):
-                if isinstance(v1, Stop) or isinstance(v2, Stop):
-                    raise NotImplementedError
-                    # return Stop()
-                else:
-                    return Continue()
+            values = []
+
+            def _(v):
+                with _lock:
+                    values.append(v)
+                    is_last = len(values) == 2
 
-            self.zip(ack2, _).subscribe(next_ack)
+                if is_last:
+                    if any(isinstance(v, Stop) for v in values):
+                        raise NotImplementedError
+                        # return Stop()
+                    else:
+                        next_ack.on_next(continue_ack)
+                        next_ack.on_completed()
+
+            self.on_complete(_, on_error=next_ack.on_error)
+            ack2.on_complete(_, on_error=next_ack.on_error)
 
 
 class Continue(Ack):
-    def __init__(self):
-        super().__init__()
+    """ Synchronous acknowledgment; `Continue()` always returns the same completed instance
+    """
+
+    __slots__ = ()
+
+    def __new__(cls):
+        try:
+            return cls.__dict__['_instance']
+        except KeyError:
+            instance = super().__new__(cls)
+            Ack.__init__(instance)
+            instance.has_value = True
+            instance.value = instance
+            instance.is_stopped = True
+            cls._instance = instance
+            return instance
 
-        self.has_value = True
-        self.value = self
-        self.is_stopped = True
+    def __init__(self):
+        pass
 
     def merge_ack(self, ack2: 'Ack'):
         return ack2
 
-    def connect_ack(self, next_ack: 'Ack'):
-        self.subscribe(next_ack)
+    def connect_ack(self, next_ack: 'Ack', scheduler=None):
+        next_ack.on_next(self)
+        next_ack.on_completed()
 
     def connect_ack_2(self, ack2: 'Ack', next_ack: 'Ack'):
-        ack2.subscribe(next_ack)
+        ack2.connect_ack(next_ack)
 
 
 continue_ack = Continue()
 
 class Stop(Ack):
-    def __init__(self):
-        super().__init__()
+    """ Synchronous acknowledgment; `Stop()` always returns the same completed instance
+    """
+
+    __slots__ = ()
+
+    def __new__(cls):
+        try:
+            return cls.__dict__['_instance']
+        except KeyError:
+            instance = super().__new__(cls)
+            Ack.__init__(instance)
+            instance.has_value = True
+            instance.value = instance
+            instance.is_stopped = True
+            cls._instance = instance
+            return instance
 
-        self.has_value = True
-        self.value = self
-        self.is_stopped = True
+    def __init__(self):
+        pass
 
     def merge_ack(self, ack2: 'Ack'):
         return self
 
+    def connect_ack(self, next_ack: 'Ack', scheduler=None):
+        next_ack.on_next(self)
+        next_ack.on_completed()
+
     def connect_ack_2(self, ack2: 'Ack', next_ack: 'Ack'):
-        self.subscribe(next_ack)
+        self.connect_ack(next_ack)
 
-stop_ack = Stop()
\ No newline at end of file
+stop_ack = Stop()
@@ -0,0 +1,154 @@
+import asyncio
+from collections import deque
+
+from rx import config
+
+from rxbackpressure.ack import Ack, continue_ack, stop_ack
+from rxbackpressure.observers.anonymousobserver import AnonymousObserver
+from rxbackpressure.schedulers.currentthreadscheduler import CurrentThreadScheduler
+
+
+def to_async_iterable(source, scheduler=None, prefetch: int = 0):
+    """ Converts an observable into an async iterable. The observable is back-pressured once more than `prefetch`
+    items are buffered and acknowledged again when the consumer awaits the next item and at most half of the
+    prefetched items are left.
+
+    The observable is subscribed when the iteration starts and stopped when the async iterator is closed.
+
+    :param source: the observable
+    :param scheduler: (optional) scheduler on which the observable emits its items, by default the items are
+    emitted on the event loop when the consumer awaits the next item
+    :param prefetch: number of items buffered in advance to hide the latency of the observable
+    :return: an async iterable
+    """
+
+    lock = config['concurrency'].RLock()
+    queue = deque()
+
+    # the error or completion, set only once
+    is_done = [False]
+    error_thrown = [None]
+
+    # acknowledgment returned to the observable while the buffer is full
+    back_pressured = [None]
+
+    # the loop and the future on which the consumer waits for an item
+    waiter = [None]
+
+    def wake_consumer():
+        with lock:
+            current = waiter[0]
+            waiter[0] = None
+
+        if current is not None:
+            loop, future = current
+
+            def set_result():
+                if not future.done():
+                    future.set_result(None)
+
+            loop.call_soon_threadsafe(set_result)
+
+    def check_back_pressure():
+        if len(queue) <= prefetch:
+            ack = continue_ack
+        else:
+            with lock:
+                # the consumer could have taken the items in the meantime
+                if len(queue) <= prefetch:
+                    ack = continue_ack
+                else:
+                    ack = Ack()
+                    back_pressured[0] = ack
+
+        wake_consumer()
+        return ack
+
+    def on_next(v):
+        if is_done[0]:
+            return stop_ack
+
+        queue.append(v)
+        return check_back_pressure()
+
+    def on_next_batch(items):
+        if is_done[0]:
+            return stop_ack
+
+        queue.extend(items)
+        return check_back_pressure()
+
+    def on_error(exc):
+        error_thrown[0] = exc
+        is_done[0] = True
+        wake_consumer()
+
+    def on_completed():
+        is_done[0] = True
+        wake_consumer()
+
+    def complete_ack(ack, value):
+        ack.on_next(value)
+        ack.on_completed()
+
+    async def gen():
+        loop = asyncio.get_running_loop()
+
+        observer = AnonymousObserver(on_next=on_next, on_error=on_error, on_completed=on_completed,
+                                     on_next_batch=on_next_batch)
+        subscribe_scheduler = CurrentThreadScheduler()
+
+        # the disposable of the subscription itself, `subscribe` only returns the disposable of the scheduled action
+        disposable = [None]
+
+        def subscribe(_, __):
+            disposable[0] = source.unsafe_subscribe(observer, scheduler or subscribe_scheduler, subscribe_scheduler)
+
+        subscribe_scheduler.schedule(subscribe)
+
+        try:
+            while True:
+                future = None
+                with lock:
+                    # the consumer awaits the next item, the observable is resumed once half of the buffer is taken
+                    ack = back_pressured[0]
+                    if ack is not None and len(queue) <= prefetch // 2:
+                        back_pressured[0] = None
+                    else:
+                        ack = None
+
+                    if queue:
+                        has_value = True
+                        value = queue.popleft()
+                    else:
+                        has_value = False
+                        if not is_done[0] and ack is None:
+                            future = loop.create_future()
+                            waiter[0] = (loop, future)
+
+                if ack is not None:
+                    # resuming the observable could emit the next item synchronously
+                    complete_ack(ack, continue_ack)
+
+                if has_value:
+                    yield value
+                elif future is not None:
+                    await future
+                elif is_done[0] and not queue:
+                    if error_thrown[0] is not None:
+                        raise error_thrown[0]
+                    return
+        finally:
+            is_done[0] = True
+            with lock:
+                queue.clear()
+                ack = back_pressured[0]
+                back_pressured[0] = None
+
+            if ack is not None:
+                complete_ack(ack, stop_ack)
+
+            if disposable[0] is not None:
+                disposable[0].dispose()
+
+    return gen()
@@ -1,50 +1,128 @@
+from collections import deque
+
 from rx import config
-from rx.concurrency import CurrentThreadScheduler
 from rx.internal import Enumerator
 
-from rxbackpressure.ack import Continue
+from rxbackpressure.ack import Ack, continue_ack
 from rxbackpressure.observers.anonymousobserver import AnonymousObserver
+from rxbackpressure.schedulers.currentthreadscheduler import CurrentThreadScheduler
+
+
+def to_iterable(source, scheduler=None, prefetch: int = 1000, batch_size: int = None):
+    """ Converts an observable into a blocking iterable. The observable is back-pressured once `prefetch` items
+    are buffered and acknowledged again when the consumer takes the buffered items.
 
+    :param source: the observable
+    :param scheduler: (optional) scheduler on which the observable emits its items, by default the items are
+    emitted on the consuming thread when the consumer takes the buffered items
+    :param prefetch: number of buffered items after which the observable is back-pressured; with 0 (or less) the
+    items are handed over one at a time, as with 1
+    :param batch_size: (optional) if set, lists of up to `batch_size` items are returned instead of single
+    items; a list contains the items buffered when it is taken, the consumer does not wait for a full batch
+    :return: an iterable
+    """
+
+    # an empty buffer can not hand over any item, the observable is back-pressured after each item instead
+    prefetch = max(prefetch, 1)
 
-def to_iterable(source, scheduler):
     condition = config["concurrency"].Condition()
-    notifications = []
+    queue = deque()
+
+    # the error or completion, set only once
+    is_done = [False]
+    error_thrown = [None]
+
+    # acknowledgment returned to the observable while the buffer is full
+    back_pressured = [None]
+
+    # set while the consumer waits for an item
+    is_waiting = [False]
+
+    def notify_consumer():
+        # an item is appended before the flag is read, the consumer sets the flag before checking the queue again
+        if is_waiting[0]:
+            with condition:
+                condition.notify()
+
+    def check_back_pressure():
+        if len(queue) < prefetch:
+            return continue_ack
+
+        with condition:
+            # the consumer could have taken the items in the meantime
+            if len(queue) < prefetch:
+                return continue_ack
 
-    def send_notification(n):
-        condition.acquire()
-        notifications.append(n)
-        condition.notify()  # signal that a new item is available
-        condition.release()
+            back_pressured[0] = Ack()
+            return back_pressured[0]
 
     def on_next(v):
-        send_notification(('N', v))
-        return Continue()
+        queue.append(v)
+        notify_consumer()
+        return check_back_pressure()
+
+    def on_next_batch(items):
+        queue.extend(items)
+        notify_consumer()
+        return check_back_pressure()
 
     def on_error(exc):
-        send_notification(('E', exc))
+        error_thrown[0] = exc
+        is_done[0] = True
+        notify_consumer()
 
     def on_completed():
-        send_notification(('C', None))
+        is_done[0] = True
+        notify_consumer()
 
-    observer = AnonymousObserver(on_next=on_next, on_error=on_error, on_completed=on_completed)
+    observer = AnonymousObserver(on_next=on_next, on_error=on_error, on_completed=on_completed,
+                                 on_next_batch=on_next_batch)
 
     source.subscribe(observer, scheduler, CurrentThreadScheduler())
 
-    def gen():
+    def take_items():
+        """ waits for at least one item and takes the buffered items
+        """
 
-        while True:
-            condition.acquire()
-            while not len(notifications):
+        with condition:
+            while not queue and not is_done[0]:
+                is_waiting[0] = True
+                if queue or is_done[0]:
+                    break
                 condition.wait()
-            kind, value = notifications.pop(0)
+            is_waiting[0] = False
+
+            if batch_size is None:
+                items = list(queue)
+                queue.clear()
+            else:
+                items = [queue.popleft() for _ in range(min(batch_size, len(queue)))]
+
+            ack = back_pressured[0]
+            if len(queue) < prefetch:
+                back_pressured[0] = None
+            else:
+                ack = None
 
-            if kind == "E":
-                raise value
+        # resuming the observable could emit the next items synchronously
+        if ack is not None:
+            ack.on_next(continue_ack)
+            ack.on_completed()
+
+        return items
+
+    def gen():
+        while True:
+            items = take_items()
 
-            if kind == "C":
+            if not items:
+                if error_thrown[0] is not None:
+                    raise error_thrown[0]
                 return  # StopIteration
 
-            condition.release()
-            yield value
+            if batch_size is None:
+                yield from items
+            else:
+                yield items
 
-    return Enumerator(gen())
\ No newline at end of file
+    return Enumerator(gen())
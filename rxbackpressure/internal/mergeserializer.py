@@ -0,0 +1,195 @@
+from collections import deque
+from typing import Callable
+
+from rx import config
+
+from rxbackpressure.ack import Ack, Continue, Stop, continue_ack, stop_ack
+from rxbackpressure.observer import Observer
+from rxbackpressure.scheduler import SchedulerBase
+
+
+class MergeSerializer:
+    """ Serializes the items of several sources that emit concurrently into a single observer.
+
+    The source that finds the observer idle sends its item directly and gets the acknowledgment of the observer;
+    the sources that find the observer busy queue their item and get an acknowledgment that is completed once the
+    item is sent and acknowledged. Hence, each source is back-pressured only by its own items.
+
+    The right to send items to the observer is a token taken without blocking; the source that releases the token
+    checks the queue again, so that no item is left behind.
+    """
+
+    def __init__(self, observer: Observer, scheduler: SchedulerBase, on_stop: Callable[[], None] = None):
+        """
+        :param observer: downstream observer
+        :param scheduler: scheduler on which the queued items are sent
+        :param on_stop: (optional) called once if the observer stops the stream
+        """
+
+        self.observer = observer
+        self.scheduler = scheduler
+        self.em = scheduler.get_execution_model().create_loop_state()
+        self.on_stop = on_stop
+
+        self.token = config['concurrency'].Lock()
+        self.queue = deque()
+
+        # number of sources that are not completed
+        self.lock = config['concurrency'].RLock()
+        self.n_sources = 0
+
+        self.is_done = False
+        self.is_stopped = False
+        self.error_thrown = None
+
+    def add_source(self):
+        with self.lock:
+            self.n_sources += 1
+
+    def complete_source(self):
+        with self.lock:
+            self.n_sources -= 1
+            is_done = self.n_sources == 0 and not self.is_done
+            if is_done:
+                self.is_done = True
+
+        if is_done and self.token.acquire(False):
+            self.drain(0)
+
+    def on_error(self, exc: Exception):
+        with self.lock:
+            if self.is_done:
+                return
+            self.is_done = True
+            self.error_thrown = exc
+
+        if self.token.acquire(False):
+            self.drain(0)
+
+    def signal_next(self, v, is_batch: bool):
+        if is_batch:
+            return self.observer.on_next_batch(v)
+        else:
+            return self.observer.on_next(v)
+
+    def send(self, v, is_batch: bool = False):
+        """ sends an item, or a batch of items if `is_batch` is True, on behalf of a source
+
+        :return: the acknowledgment for the source
+        """
+
+        if self.is_done or self.is_stopped:
+            return stop_ack
+
+        if self.token.acquire(False):
+            if not self.queue:
+                ack = self.signal_next(v, is_batch)
+
+                if isinstance(ack, Continue):
+                    self.release()
+                elif isinstance(ack, Stop):
+                    self.stop()
+                else:
+                    def on_next(next):
+                        if isinstance(next, Continue):
+                            self.drain(0)
+                        else:
+                            self.stop()
+
+                    ack.on_complete(on_next, scheduler=self.scheduler, on_error=lambda err: self.stop())
+                return ack
+
+            source_ack = Ack()
+            self.queue.append((v, is_batch, source_ack))
+            self.drain(0)
+            return source_ack
+
+        source_ack = Ack()
+        self.queue.append((v, is_batch, source_ack))
+
+        # the token could have been released before the item was queued
+        if self.token.acquire(False):
+            self.drain(0)
+        return source_ack
+
+    def release(self):
+        self.token.release()
+
+        if (self.queue or self.is_done) and self.token.acquire(False):
+            self.drain(0)
+
+    def stop(self):
+        """ stops all sources, the token is kept
+        """
+
+        with self.lock:
+            if self.is_stopped:
+                return
+            self.is_stopped = True
+
+        while self.queue:
+            _, _, source_ack = self.queue.popleft()
+            source_ack.on_next(stop_ack)
+            source_ack.on_completed()
+
+        if self.on_stop is not None:
+            self.on_stop()
+
+    def drain(self, frame_index: int):
+        """ sends the queued items, the caller holds the token
+        """
+
+        while not self.is_stopped:
+            try:
+                v, is_batch, source_ack = self.queue.popleft()
+            except IndexError:
+                if self.is_done:
+                    # the token is kept, the observer does not receive any more items
+                    self.is_stopped = True
+                    if self.error_thrown is None:
+                        self.observer.on_completed()
+                    else:
+                        self.observer.on_error(self.error_thrown)
+                    return
+
+                self.token.release()
+
+                # an item could have been queued before the token was released
+                if (self.queue or self.is_done) and self.token.acquire(False):
+                    continue
+                return
+
+            ack = self.signal_next(v, is_batch)
+
+            if isinstance(ack, Continue):
+                source_ack.on_next(continue_ack)
+                source_ack.on_completed()
+
+                frame_index = self.em.next_frame_index(frame_index)
+                if frame_index == 0:
+                    def action(_, __):
+                        self.drain(0)
+
+                    self.scheduler.schedule(action)
+                    return
+            elif isinstance(ack, Stop):
+                source_ack.on_next(stop_ack)
+                source_ack.on_completed()
+                self.stop()
+                return
+            else:
+                def on_next(next, source_ack=source_ack):
+                    source_ack.on_next(next)
+                    source_ack.on_completed()
+
+                    if isinstance(next, Continue):
+                        self.drain(0)
+                    else:
+                        self.stop()
+
+                def on_error(err, source_ack=source_ack):
+                    source_ack.on_error(err)
+                    self.stop()
+
+                ack.on_complete(on_next, scheduler=self.scheduler, on_error=on_error)
+                return
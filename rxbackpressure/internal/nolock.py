@@ -0,0 +1,35 @@
+from rx import config
+
+
+class NoLock:
+    """ A lock that does nothing. It replaces the locks of operators whose pipeline is confined to a single thread.
+    """
+
+    __slots__ = ()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1):
+        return True
+
+    def release(self):
+        pass
+
+    def __enter__(self):
+        return True
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+no_lock = NoLock()
+
+
+def create_lock(single_threaded: bool = False):
+    """ :param single_threaded: if True, the owner of the lock, its source and its observers are confined to a
+    single thread
+    :return: a reentrant lock, or the no-op lock if single_threaded is True
+    """
+
+    if single_threaded:
+        return no_lock
+    else:
+        return config['concurrency'].RLock()
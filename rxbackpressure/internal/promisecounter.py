@@ -1,4 +1,4 @@
-from rx import config, Observable
+from rx import config
 
 from rxbackpressure.ack import Ack
 
@@ -21,5 +21,6 @@ class PromiseCounter:
             counter = self.counter
 
         if counter == 0:
-            Observable.just(self.value).subscribe(self.promise)
+            self.promise.on_next(self.value)
+            self.promise.on_completed()
 
@@ -0,0 +1,140 @@
+import datetime
+import sys
+from collections import deque
+from typing import Callable, Any, Union, List
+
+
+class ReplayBuffer:
+    """ Append-only buffer of a replay subject that evicts the oldest items by count, age and size.
+
+    The items are stored in fixed-size chunks that are never modified except by appending. A snapshot therefore
+    only copies the references to the chunks and stays valid while new items are appended and old items are
+    evicted.
+    """
+
+    def __init__(self, buffer_size: int = None, window: Union[float, datetime.timedelta] = None,
+                 max_bytes: int = None, size_of: Callable[[Any], int] = None, chunk_size: int = 256):
+        """
+        :param buffer_size: (optional) maximum number of items kept in the buffer
+        :param window: (optional) maximum age of the items kept in the buffer, in seconds or as timedelta
+        :param max_bytes: (optional) maximum total size of the items kept in the buffer
+        :param size_of: (optional) function that returns the size of an item, by default `sys.getsizeof`
+        :param chunk_size: number of items per chunk
+        """
+
+        self.buffer_size = buffer_size
+        self.window = window.total_seconds() if isinstance(window, datetime.timedelta) else window
+        self.max_bytes = max_bytes
+        self.size_of = size_of or sys.getsizeof
+        self.chunk_size = chunk_size
+
+        self.chunks = deque()
+
+        # global index of the first item of the first chunk, the first item and the item after the last item
+        self.chunk_offset = 0
+        self.first_idx = 0
+        self.last_idx = 0
+
+        # time stamps and sizes of the items in the buffer
+        self.times = deque() if window is not None else None
+        self.sizes = deque() if max_bytes is not None else None
+        self.n_bytes = 0
+
+    class Snapshot:
+        """ An immutable view on the items of the buffer at the time the snapshot was taken
+        """
+
+        def __init__(self, chunks: List[List], chunk_offset: int, first_idx: int, last_idx: int, chunk_size: int):
+            self.chunks = chunks
+            self.chunk_offset = chunk_offset
+            self.first_idx = first_idx
+            self.last_idx = last_idx
+            self.chunk_size = chunk_size
+
+        def __len__(self):
+            return self.last_idx - self.first_idx
+
+        def __iter__(self):
+            idx = self.first_idx - self.chunk_offset
+            end = self.last_idx - self.chunk_offset
+
+            while idx < end:
+                chunk = self.chunks[idx // self.chunk_size]
+                start = idx % self.chunk_size
+                stop = min(self.chunk_size, start + end - idx)
+                yield from chunk[start:stop]
+                idx += stop - start
+
+    @staticmethod
+    def to_seconds(now) -> float:
+        """ converts the clock value of a scheduler into seconds
+        """
+
+        if isinstance(now, datetime.datetime):
+            return now.timestamp()
+        else:
+            return now
+
+    def __len__(self):
+        return self.last_idx - self.first_idx
+
+    def append(self, elem, now=None):
+        """ appends an item and evicts the items that exceed the limits
+
+        :param elem: the appended item
+        :param now: clock value of the scheduler, required if the buffer evicts by age
+        """
+
+        chunks = self.chunks
+        if not chunks or len(chunks[-1]) == self.chunk_size:
+            chunks.append([])
+        chunks[-1].append(elem)
+        self.last_idx += 1
+
+        if self.times is not None:
+            self.times.append(self.to_seconds(now))
+
+        if self.sizes is not None:
+            size = self.size_of(elem)
+            self.sizes.append(size)
+            self.n_bytes += size
+
+        self.evict(now)
+
+    def evict(self, now=None):
+        if self.buffer_size is not None:
+            while self.buffer_size < len(self):
+                self.drop_first()
+
+        if self.times is not None and now is not None:
+            oldest = self.to_seconds(now) - self.window
+            while self.times and self.times[0] < oldest:
+                self.drop_first()
+
+        if self.sizes is not None:
+            while self.max_bytes < self.n_bytes:
+                self.drop_first()
+
+    def drop_first(self):
+        self.first_idx += 1
+
+        if self.times is not None:
+            self.times.popleft()
+
+        if self.sizes is not None:
+            self.n_bytes -= self.sizes.popleft()
+
+        # release a chunk once all its items are evicted, snapshots keep their own reference
+        if self.first_idx - self.chunk_offset == self.chunk_size:
+            self.chunks.popleft()
+            self.chunk_offset += self.chunk_size
+
+    def snapshot(self, now=None) -> 'ReplayBuffer.Snapshot':
+        """ evicts the items that are too old and returns a view on the remaining items
+
+        :param now: (optional) clock value of the scheduler
+        """
+
+        self.evict(now)
+        return self.Snapshot(chunks=list(self.chunks), chunk_offset=self.chunk_offset, first_idx=self.first_idx,
+                             last_idx=self.last_idx, chunk_size=self.chunk_size)
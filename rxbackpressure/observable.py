@@ -3,8 +3,11 @@ from typing import Callable, Any
 from rxbackpressure.ack import Continue, continue_ack
 from rxbackpressure.observer import Observer
 from rxbackpressure.observers.anonymousobserver import AnonymousObserver
+from rxbackpressure.observers.demandobserver import DemandObserver
 from rxbackpressure.scheduler import Scheduler
-from rxbackpressure.schedulers.currentthreadscheduler import CurrentThreadScheduler
+from rxbackpressure.subscriber import Subscriber
+from rxbackpressure.schedulers.trampolinescheduler import trampoline_scheduler, \
+    single_threaded_trampoline_scheduler
 
 
 class Observable:
@@ -13,8 +16,24 @@ class Observable:
         raise NotImplementedError
 
     def subscribe(self, observer: Observer, scheduler: Scheduler = None,
-                  subscribe_scheduler: Scheduler = None):
-        subscribe_scheduler_ = subscribe_scheduler or CurrentThreadScheduler()
+                  subscribe_scheduler: Scheduler = None, single_threaded: bool = False):
+        """ Subscribes an observer
+
+        :param observer:
+        :param scheduler: (optional) scheduler on which the observer receives the items
+        :param subscribe_scheduler: (optional) scheduler on which the observable is subscribed, by default
+        the trampoline scheduler of the current thread
+        :param single_threaded: (optional) if True and no subscribe scheduler is given, the pipeline is promised
+        to be confined to the current thread and the operators use no-op locks
+        :return: a disposable
+        """
+
+        if subscribe_scheduler is not None:
+            subscribe_scheduler_ = subscribe_scheduler
+        elif single_threaded:
+            subscribe_scheduler_ = single_threaded_trampoline_scheduler
+        else:
+            subscribe_scheduler_ = trampoline_scheduler
         scheduler_ = scheduler or subscribe_scheduler_
 
         def action(_, __):
@@ -22,12 +41,24 @@ class Observable:
 
         return subscribe_scheduler_.schedule(action)
 
+    def subscribe_demand(self, subscriber: Subscriber, scheduler: Scheduler = None,
+                         subscribe_scheduler: Scheduler = None):
+        """ Subscribes a subscriber in demand mode; the observable emits only the items requested by the
+        subscriber through its subscription
+
+        :param subscriber: a subscriber in demand mode
+        :return: a disposable
+        """
+
+        return self.subscribe(DemandObserver(subscriber), scheduler=scheduler, subscribe_scheduler=subscribe_scheduler)
+
     def subscribe_with(self,
                        on_next: Callable[[Any], None] = None,
                        on_error: Callable[[Any], None] = None,
                        on_completed: Callable[[], None] = None,
                        scheduler: Scheduler = None,
-                       subscribe_scheduler: Scheduler = None):
+                       subscribe_scheduler: Scheduler = None,
+                       single_threaded: bool = False):
         def on_next_with_ack(v):
             on_next(v)
             return continue_ack
@@ -38,4 +69,5 @@ class Observable:
 
         observer = AnonymousObserver(on_next=on_next_, on_error=on_error_, on_completed=on_completed_)
 
-        return self.subscribe(observer=observer, scheduler=scheduler, subscribe_scheduler=subscribe_scheduler)
+        return self.subscribe(observer=observer, scheduler=scheduler, subscribe_scheduler=subscribe_scheduler,
+                              single_threaded=single_threaded)
@@ -1,42 +1,79 @@
-from typing import Callable, Any, Iterator, Iterable
+import os
+from typing import Callable, Any, Iterator, Iterable, AsyncIterable
 
 from rx import AnonymousObservable
 from rx.concurrency.schedulerbase import SchedulerBase
 from rx.disposables import CompositeDisposable
 
 from rxbackpressure.ack import Continue
+from rxbackpressure.asyncio.toasynciterable import to_async_iterable
+from rxbackpressure.blocking.toiterable import to_iterable
 from rxbackpressure.observables.RepeatFirstobservable import RepeatFirstObservable
 from rxbackpressure.observables.controlledzipobservable import ControlledZipObservable
 from rxbackpressure.observers.bufferedsubscriber import BufferedSubscriber
 from rxbackpressure.schedulers.currentthreadscheduler import current_thread_scheduler
+from rxbackpressure.schedulers.processpoolscheduler import ProcessPoolScheduler
 from rxbackpressure.subjects.cachedservefirstsubject import CachedServeFirstSubject
 from rxbackpressure.observables.flatmapobservable import FlatMapObservable
 from rxbackpressure.observables.connectableobservable import ConnectableObservable
 from rxbackpressure.observables.flatzipobservable import FlatZipObservable
+from rxbackpressure.observables.fusedobservable import FusedObservable
 from rxbackpressure.subjects.publishsubject import PublishSubject
 from rxbackpressure.subjects.replaysubject import ReplaySubject
 from rxbackpressure.testing.debugobservable import DebugObservable
 from rxbackpressure.observables.filterobservable import FilterObservable
+from rxbackpressure.observables.filterchunksobservable import FilterChunksObservable
 from rxbackpressure.observables.iteratorasobservable import IteratorAsObservable
+from rxbackpressure.observables.asynciteratorasobservable import AsyncIteratorAsObservable
 from rxbackpressure.observables.nowobservable import NowObservable
 from rxbackpressure.scheduler import SchedulerBase, Scheduler
 from rxbackpressure.observables.window import window
+from rxbackpressure.observables.windowtochunksobservable import WindowToChunksObservable
 from rxbackpressure.observables.zipwithindexobservable import ZipWithIndexObservable
 from rxbackpressure.observables.mapobservable import MapObservable
+from rxbackpressure.observables.mapinprocessesobservable import MapInProcessesObservable
+from rxbackpressure.observables.mapparallelobservable import MapParallelObservable
+from rxbackpressure.observables.mergemapobservable import MergeMapObservable
+from rxbackpressure.observables.mergeobservable import MergeObservable
+from rxbackpressure.observables.mergesortedobservable import MergeSortedObservable
 from rxbackpressure.observable import Observable
 from rxbackpressure.observables.observeonobservable import ObserveOnObservable
 from rxbackpressure.observer import Observer
 from rxbackpressure.observables.pairwiseobservable import PairwiseObservable
 from rxbackpressure.observables.zip2observable import Zip2Observable
+from rxbackpressure.observables.zipnobservable import ZipNObservable
 
 
 class ObservableOp(Observable):
     def __init__(self, observable):
         self.observable = observable
 
+    # synchronous operators that are fused into a single observer when chained
+    fusible_operators = (MapObservable, FilterObservable, FilterChunksObservable, ZipWithIndexObservable,
+                         PairwiseObservable)
+
     def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
                          subscribe_scheduler: SchedulerBase):
-        return self.observable.unsafe_subscribe(observer, scheduler, subscribe_scheduler)
+        return self.fuse().unsafe_subscribe(observer, scheduler, subscribe_scheduler)
+
+    def fuse(self) -> Observable:
+        """ Collects the chain of consecutive synchronous operators ending in this observable and fuses them
+        into a single observable
+
+        :return: the fused observable or the wrapped observable if there is nothing to fuse
+        """
+
+        operators = []
+        observable = self.observable
+        while isinstance(observable, self.fusible_operators):
+            operators.append(observable)
+            source = observable.source
+            observable = source.observable if isinstance(source, ObservableOp) else source
+
+        if len(operators) < 2:
+            return self.observable
+        else:
+            return FusedObservable(source=observable, operators=operators[::-1])
 
     # def buffer(self):
     #     class ToBackpressureObservable(Observable):
@@ -48,16 +85,19 @@ class ObservableOp(Observable):
     #
     #     return ObservableOp(ToBackpressureObservable())
 
-    def cache(self):
+    def cache(self, single_threaded: bool = False):
         """ Converts this observable into a multicast observable that caches the items that the fastest observer has
         already received and the slowest observer has not yet requested. Note that this observable is subscribed when
         the multicast observable is subscribed for the first time. Therefore, this observable is never subscribed more
         than once.
 
+        :param single_threaded: (optional) if True, the multicast observable does not lock, this observable and the
+        observers must be confined to a single thread
         :return: multicast observable
         """
 
-        observable = ConnectableObservable(source=self, subject=CachedServeFirstSubject()).ref_count()
+        subject = CachedServeFirstSubject(single_threaded=single_threaded)
+        observable = ConnectableObservable(source=self, subject=subject).ref_count()
         return ObservableOp(observable)
 
     def flat_map(self, selector):
@@ -73,6 +113,46 @@ class ObservableOp(Observable):
                                        selector=selector)
         return ObservableOp(observable)
 
+    def merge(self, *others: Observable):
+        """ Merges the items of this observable and of the other observables into a single observable. Each
+        observable is back-pressured by the acknowledgments of its own items.
+
+        Can be called as `ObservableOp.merge(o1, o2, o3)` or as `o1.merge(o2, o3)`.
+
+        :param others: other observables
+        :return: a merged observable
+        """
+
+        observable = MergeObservable(sources=[self, *others])
+        return ObservableOp(observable)
+
+    def merge_sorted(self, *others: Observable, key: Callable[[Any], Any] = None):
+        """ Merges this observable and the other observables, each emitting its items in ascending order, into a
+        single observable emitting all items in ascending order. At most one item per observable is pending.
+
+        Can be called as `ObservableOp.merge_sorted(o1, o2, o3)` or as `o1.merge_sorted(o2, o3)`.
+
+        :param others: other observables
+        :param key: (optional) function that returns the sort key of an item, by default the item itself
+        :return: a sorted merged observable
+        """
+
+        observable = MergeSortedObservable(sources=[self, *others], key=key)
+        return ObservableOp(observable)
+
+    def merge_map(self, selector: Callable[[Any], Observable], max_concurrent: int):
+        """ Applies a function to each item emitted by the source and merges the items of the returned inner
+        observables. Unlike `flat_map`, up to `max_concurrent` inner observables are subscribed at once and their
+        items are interleaved.
+
+        :param selector: A function that takes any type as input and returns an observable.
+        :param max_concurrent: maximum number of inner observables subscribed at once
+        :return: a merged observable
+        """
+
+        observable = MergeMapObservable(source=self, selector=selector, max_concurrent=max_concurrent)
+        return ObservableOp(observable)
+
     def debug(self, name, on_next=None, on_subscribe=None, on_ack=None, print_ack=None, on_ack_msg=None):
         observable = DebugObservable(self, name=name, on_next=on_next, on_subscribe=on_subscribe, on_ack=on_ack,
                                      print_ack=print_ack, on_ack_msg=on_ack_msg)
@@ -100,6 +180,17 @@ class ObservableOp(Observable):
         observable = FilterObservable(self, predicate=predicate)
         return ObservableOp(observable)
 
+    def filter_chunks(self, mask_fn: Callable[[Any], Any]):
+        """ Filters the elements of the array chunks (e.g. NumPy arrays) emitted by the source with a boolean mask;
+        chunks without any remaining element are dropped
+
+        :param mask_fn: a vectorized function that takes a chunk and returns a boolean mask, e.g. `lambda a: a > 0`
+        :return: observable emitting the filtered chunks
+        """
+
+        observable = FilterChunksObservable(self, mask_fn=mask_fn)
+        return ObservableOp(observable)
+
     def flat_zip(self, right, selector_inner, selector_left=None, selector=None):
         observable = FlatZipObservable(left=self, right=right,
                                        selector_inner=selector_inner, selector_left=selector_left,
@@ -107,10 +198,11 @@ class ObservableOp(Observable):
         return ObservableOp(observable)
 
     @classmethod
-    def from_(cls, iterable: Iterable):
+    def from_(cls, iterable: Iterable, batch_size: int = None):
         """ Converts an iterable into an observable
 
         :param iterable:
+        :param batch_size: (optional) send the items in batches of this size with a single acknowledgment per batch
         :return:
         """
 
@@ -118,21 +210,60 @@ class ObservableOp(Observable):
 
             def unsafe_subscribe(self, observer, scheduler, subscribe_scheduler):
                 iterator = iter(iterable)
-                from_iterator_obs = IteratorAsObservable(iterator=iterator)
+                from_iterator_obs = IteratorAsObservable(iterator=iterator, batch_size=batch_size)
                 disposable = from_iterator_obs.unsafe_subscribe(observer, scheduler, subscribe_scheduler)
                 return disposable
 
         return ObservableOp(ToIterableObservable())
 
     @classmethod
-    def from_iterator(cls, iterator: Iterator):
+    def from_array(cls, arr, chunk_size: int):
+        """ Converts an array (e.g. a NumPy array) into an observable emitting chunks of up to `chunk_size`
+        elements; the chunks are slices of the array, i.e. views for NumPy arrays, so no data is copied
+
+        :param arr: an array supporting `len` and slicing
+        :param chunk_size: number of elements per chunk
+        :return:
+        """
+
+        assert 0 < chunk_size, 'chunk size must be positive'
+
+        class FromArrayObservable(Observable):
+
+            def unsafe_subscribe(self, observer, scheduler, subscribe_scheduler):
+                iterator = (arr[i:i + chunk_size] for i in range(0, len(arr), chunk_size))
+                from_iterator_obs = IteratorAsObservable(iterator=iterator)
+                disposable = from_iterator_obs.unsafe_subscribe(observer, scheduler, subscribe_scheduler)
+                return disposable
+
+        return ObservableOp(FromArrayObservable())
+
+    @classmethod
+    def from_async_iterable(cls, async_iterable: AsyncIterable, loop=None, batch_size: int = None):
+        """ Converts an async iterable (e.g. an async generator) into an observable; the next item is pulled when
+        the previous item is acknowledged
+
+        :param async_iterable:
+        :param loop: (optional) event loop on which the items are pulled, by default the event loop running in the
+        thread that subscribes
+        :param batch_size: (optional) send the items in batches of up to this size with a single acknowledgment
+        per batch, a batch is sent early when the next item is not immediately available
+        :return:
+        """
+
+        observable = AsyncIteratorAsObservable(async_iterable=async_iterable, loop=loop, batch_size=batch_size)
+        return ObservableOp(observable)
+
+    @classmethod
+    def from_iterator(cls, iterator: Iterator, batch_size: int = None):
         """ Converts an iterator into an observable
 
         :param iterator:
+        :param batch_size: (optional) send the items in batches of this size with a single acknowledgment per batch
         :return:
         """
 
-        observable = IteratorAsObservable(iterator=iterator)
+        observable = IteratorAsObservable(iterator=iterator, batch_size=batch_size)
         return ObservableOp(observable)
 
     def map(self, selector: Callable[[Any], Any]):
@@ -145,6 +276,56 @@ class ObservableOp(Observable):
         observable = MapObservable(source=self, selector=selector)
         return ObservableOp(observable)
 
+    def map_chunks(self, fn: Callable[[Any], Any]):
+        """ Applies a vectorized function to each array chunk (e.g. NumPy array) emitted by the source; each
+        chunk is acknowledged once
+
+        :param fn: a function that takes a chunk and returns the mapped chunk, e.g. `np.sqrt`
+        :return: observable emitting the mapped chunks
+        """
+
+        observable = MapObservable(self, selector=fn)
+        return ObservableOp(observable)
+
+    def map_in_processes(self, selector: Callable[[Any], Any], max_workers: int = None, max_in_flight: int = None,
+                         scheduler: ProcessPoolScheduler = None):
+        """ Maps each item in a worker process and emits the results in the order of the items; a batch of items
+        is mapped by a single task
+
+        :param selector: function that defines the mapping, it has to be picklable (e.g. a module-level function)
+        :param max_workers: (optional) number of worker processes if no scheduler is given, by default the
+        number of processors
+        :param max_in_flight: (optional) maximum number of tasks that are running or waiting to be emitted, by
+        default twice the number of worker processes
+        :param scheduler: (optional) scheduler whose worker processes are used, by default each subscription starts
+        a process pool that is shut down once the subscription terminates
+        :return: mapped observable
+        """
+
+        if scheduler is None:
+            n_workers = max_workers or os.cpu_count() or 1
+        else:
+            n_workers = scheduler.max_workers
+        max_in_flight_ = max_in_flight or 2 * n_workers
+
+        observable = MapInProcessesObservable(source=self, selector=selector, max_in_flight=max_in_flight_,
+                                              scheduler=scheduler, max_workers=max_workers)
+        return ObservableOp(observable)
+
+    def map_parallel(self, selector: Callable[[Any], Any], concurrency: int, scheduler: Scheduler = None):
+        """ Maps up to `concurrency` items at once and emits the results in the order of the items
+
+        :param selector: function that defines the mapping
+        :param concurrency: maximum number of items that are mapped or waiting to be emitted
+        :param scheduler: (optional) scheduler on which the items are mapped, by default each subscription starts
+        a pool of `concurrency` threads that is shut down once the subscription terminates
+        :return: mapped observable
+        """
+
+        observable = MapParallelObservable(source=self, selector=selector, concurrency=concurrency,
+                                           scheduler=scheduler)
+        return ObservableOp(observable)
+
     def map_count(self, selector: Callable[[Any, int], Any] = None):
         """ Zips each item emmited by the source with their indices
 
@@ -155,14 +336,18 @@ class ObservableOp(Observable):
         observable = ZipWithIndexObservable(source=self, selector=selector)
         return ObservableOp(observable)
 
-    def observe_on(self, scheduler):
+    def observe_on(self, scheduler, request_size: int = None, low_watermark: int = None):
         """ Operator that specifies a specific scheduler, on which observers will observe events
 
         :param scheduler: a rxbackpressure scheduler
+        :param request_size: (optional) if set, the items are requested in demand mode; up to this many items
+        are sent over the scheduler boundary without waiting for the acknowledgment of each item
+        :param low_watermark: (optional) number of outstanding requested items at which new items are requested,
+        by default half of the request size
         :return: an observable running on specified scheduler
         """
 
-        observable = ObserveOnObservable(self, scheduler)
+        observable = ObserveOnObservable(self, scheduler, request_size=request_size, low_watermark=low_watermark)
         return ObservableOp(observable)
 
     def pairwise(self, selector=None):
@@ -193,26 +378,36 @@ class ObservableOp(Observable):
         observable = RepeatFirstObservable(source=self)
         return ObservableOp(observable)
 
-    def replay(self):
+    def replay(self, buffer_size: int = None, window=None, max_bytes: int = None, size_of=None, scheduler=None):
         """ Converts this observable into a multicast observable that replays the item received by the source. Note
         that this observable is subscribed when the multicast observable is subscribed for the first time. Therefore,
         this observable is never subscribed more than once.
 
+        :param buffer_size: (optional) replay at most the last `buffer_size` items
+        :param window: (optional) replay only the items received within this time window, in seconds or as timedelta
+        :param max_bytes: (optional) replay at most the most recent items whose total size is below `max_bytes`
+        :param size_of: (optional) function that returns the size of an item, by default `sys.getsizeof`
+        :param scheduler: (optional) scheduler whose clock defines the age of the items
         :return: multicast observable
         """
 
-        observable = ConnectableObservable(source=self, subject=ReplaySubject()).ref_count()
+        subject = ReplaySubject(buffer_size=buffer_size, window=window, max_bytes=max_bytes, size_of=size_of,
+                                scheduler=scheduler)
+        observable = ConnectableObservable(source=self, subject=subject).ref_count()
         return ObservableOp(observable)
 
-    def share(self):
+    def share(self, single_threaded: bool = False):
         """ Converts this observable into a multicast observable that backpressures only after each subscribed
         observer backpressures. Note that this observable is subscribed when the multicast observable is subscribed for
         the first time. Therefore, this observable is never subscribed more than once.
 
+        :param single_threaded: (optional) if True, the multicast observable does not lock, this observable and the
+        observers must be confined to a single thread
         :return: multicast observable
         """
 
-        observable = ConnectableObservable(source=self, subject=PublishSubject()).ref_count()
+        subject = PublishSubject(single_threaded=single_threaded)
+        observable = ConnectableObservable(source=self, subject=subject).ref_count()
         return ObservableOp(observable)
 
     def to_rx(self, scheduler=None):
@@ -240,6 +435,29 @@ class ObservableOp(Observable):
 
         return AnonymousObservable(subscribe)
 
+    def to_async_iterable(self, scheduler=None, prefetch: int = 0):
+        """ Converts this observable to an async iterable; the items are acknowledged when the consumer awaits
+        the next item
+
+        :param scheduler: (optional) scheduler on which the items are emitted
+        :param prefetch: number of items buffered in advance
+        :return: an async iterable
+        """
+
+        return to_async_iterable(self, scheduler=scheduler, prefetch=prefetch)
+
+    def to_iterable(self, scheduler=None, prefetch: int = 1000, batch_size: int = None):
+        """ Converts this observable to a blocking iterable that buffers up to `prefetch` items
+
+        :param scheduler: (optional) scheduler on which the items are emitted
+        :param prefetch: number of buffered items after which this observable is back-pressured; with 0 (or less)
+        the items are handed over one at a time, as with 1
+        :param batch_size: (optional) if set, lists of up to `batch_size` items are returned
+        :return: an iterable
+        """
+
+        return to_iterable(self, scheduler=scheduler, prefetch=prefetch, batch_size=batch_size)
+
     def window(self, right: Observable, is_lower, is_higher):
         """ Forward each item from the left Observable by attaching an inner Observable to it. Subdivide or reject
         items from the right Observable via is_lower and is_higher functions, and emit each item of a subdivision (or window)
@@ -254,11 +472,43 @@ class ObservableOp(Observable):
         o1, o2 = window(self, right, is_lower, is_higher)
         return ObservableOp(o1).map(lambda t2: (t2[0], ObservableOp(t2[1]))), ObservableOp(o2)
 
+    def window_to_chunks(self, right: Observable, is_lower, is_higher, is_chunked: bool = False):
+        """ The same as `window`, except that the items of each window are collected and emitted together with the
+        left item as `(left_item, window)` instead of an inner Observable
+
+        :param right:
+        :param is_lower: if right is lower than left, right is dropped
+        :param is_higher: if right is higher than left, the window of left is complete
+        :param is_chunked: if True, the right Observable emits sorted chunks (e.g. NumPy arrays or `TimeValueChunk`),
+        `is_lower` and `is_higher` take a left item and a chunk and return boolean masks, and each window is a chunk
+        :return: observable emitting a window for each left item
+        """
+
+        observable = WindowToChunksObservable(left=self, right=right, is_lower=is_lower, is_higher=is_higher,
+                                              is_chunked=is_chunked)
+        return ObservableOp(observable)
+
     def controlled_zip(self, right, is_lower, is_higher, selector):
         observable = ControlledZipObservable(left=self, right=right, is_lower=is_lower, is_higher=is_higher,
                                              selector=selector)
         return ObservableOp(observable)
 
+    def controlled_zip_chunks(self, right: Observable, selector: Callable[[Any, Any], Any] = None):
+        """ Aligns two observables emitting `TimeValueChunk` with ascending timestamps; the samples with equal
+        timestamps are matched in bulk, which is the vectorized counterpart of `controlled_zip`
+
+        :param right: observable emitting chunks with ascending timestamps
+        :param selector: (optional) vectorized function that takes the matched left and right values and returns
+        the values of the emitted chunk, by default pairs of aligned left and right chunks are emitted
+        :return: observable emitting aligned chunks
+        """
+
+        # NumPy is only required by the chunk operators
+        from rxbackpressure.observables.controlledzipchunksobservable import ControlledZipChunksObservable
+
+        observable = ControlledZipChunksObservable(left=self, right=right, selector=selector)
+        return ObservableOp(observable)
+
     def zip(self, right, selector=None):
         """ Creates a new observable from two observables by combining their item in pairs in a strict sequence.
 
@@ -268,3 +518,17 @@ class ObservableOp(Observable):
 
         observable = Zip2Observable(left=self, right=right, selector=selector)
         return ObservableOp(observable)
+
+    def zip_all(self, *others: Observable, selector: Callable[..., Any] = None):
+        """ Creates a new observable from this and the other observables by combining their items in a strict
+        sequence; unlike chained `zip` calls, all observables are zipped by a single operator.
+
+        Can be called as `ObservableOp.zip_all(o1, o2, o3)` or as `o1.zip_all(o2, o3)`.
+
+        :param others: other observables
+        :param selector: (optional) a function that takes an item of each observable, by default tuples are emitted
+        :return: zipped observable
+        """
+
+        observable = ZipNObservable(sources=[self, *others], selector=selector)
+        return ObservableOp(observable)
@@ -27,7 +27,7 @@ class RepeatFirstObservable(Observable):
                                 if isinstance(ack, Continue):
                                     scheduler.schedule(action)
 
-                            ack.subscribe(_)
+                            ack.on_complete(_)
                             break
 
                 scheduler.schedule(action)
@@ -0,0 +1,170 @@
+import asyncio
+from typing import AsyncIterable
+
+from rx.concurrency.schedulerbase import SchedulerBase
+from rx.core import Disposable
+
+from rxbackpressure.ack import Continue, Stop
+from rxbackpressure.observable import Observable
+from rxbackpressure.observer import Observer
+
+
+class AsyncIteratorAsObservable(Observable):
+    """ Emits the items of an async iterator. The next item is only pulled once the previous item is acknowledged.
+
+    The items are pulled by a single task on the event loop. As long as the observer acknowledges synchronously,
+    the task pulls the items in a loop and yields to the event loop only when the execution model starts a new
+    frame.
+    """
+
+    def __init__(self, async_iterable: AsyncIterable, loop: asyncio.AbstractEventLoop = None,
+                 batch_size: int = None):
+        """
+        :param async_iterable: an async iterable or async iterator, e.g. an async generator
+        :param loop: (optional) event loop on which the items are pulled, by default the event loop running in the
+        thread that subscribes
+        :param batch_size: (optional) if set, the items are sent in batches of up to this size by `on_next_batch`,
+        a batch is sent early when the next item is not immediately available
+        """
+
+        self.async_iterable = async_iterable
+        self.loop = loop
+        self.batch_size = batch_size
+
+    async def next_batch(self, iterator, pending: list):
+        """ Waits for the first item of a batch and adds the items that are immediately available afterwards, an item
+        that is not yet available is kept pending for the next batch
+
+        :param iterator:
+        :param pending: one-element list holding the task that pulls the next item, or None
+        :return:
+        """
+
+        batch = []
+        try:
+            while len(batch) < self.batch_size:
+                if pending[0] is None:
+                    pending[0] = asyncio.ensure_future(iterator.__anext__())
+                task = pending[0]
+
+                if not task.done():
+                    if batch:
+                        # do not hold back the pulled items while the iterator waits
+                        await asyncio.sleep(0)
+                        if not task.done():
+                            break
+                    else:
+                        await asyncio.wait([task])
+
+                pending[0] = None
+                batch.append(task.result())
+        except StopAsyncIteration:
+            if not batch:
+                raise
+        return batch
+
+    async def wait_for(self, ack, loop):
+        future = loop.create_future()
+
+        def set_result(v):
+            if not future.done():
+                future.set_result(v)
+
+        def set_exception(err):
+            if not future.done():
+                future.set_exception(err)
+
+        # the acknowledgment can be completed on any thread
+        ack.on_complete(lambda v: loop.call_soon_threadsafe(set_result, v),
+                        on_error=lambda err: loop.call_soon_threadsafe(set_exception, err))
+        return await future
+
+    async def pull_loop(self, observer: Observer, scheduler: SchedulerBase, loop):
+        iterator = self.async_iterable.__aiter__()
+        em = scheduler.get_execution_model().create_loop_state()
+        send_next = observer.on_next if self.batch_size is None else observer.on_next_batch
+        sync_index = 0
+        pending = [None]
+
+        try:
+            while True:
+                try:
+                    if self.batch_size is None:
+                        item = await iterator.__anext__()
+                    else:
+                        item = await self.next_batch(iterator, pending)
+                except StopAsyncIteration:
+                    observer.on_completed()
+                    return
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    observer.on_error(e)
+                    return
+
+                try:
+                    ack = send_next(item)
+                except Exception as e:
+                    # the pull loop runs in a task whose result nobody awaits, the exception would be lost
+                    observer.on_error(e)
+                    break
+
+                if isinstance(ack, Continue):
+                    sync_index = em.next_frame_index(sync_index)
+
+                    # give other tasks a chance to run
+                    if sync_index == 0:
+                        await asyncio.sleep(0)
+                elif isinstance(ack, Stop):
+                    break
+                else:
+                    try:
+                        next = await self.wait_for(ack, loop)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        scheduler.report_failure(e)
+                        break
+
+                    if not isinstance(next, Continue):
+                        break
+                    sync_index = 0
+        except asyncio.CancelledError:
+            pass
+
+        if pending[0] is not None:
+            pending[0].cancel()
+            try:
+                await pending[0]
+            except (asyncio.CancelledError, Exception):
+                pass
+
+        # the downstream stopped early, release the resources of an async generator
+        aclose = getattr(iterator, 'aclose', None)
+        if aclose is not None:
+            await aclose()
+
+    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
+                         subscribe_scheduler: SchedulerBase):
+        loop = self.loop
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise Exception('No event loop is running in this thread, so the loop on which the items are '
+                                'pulled needs to be given explicitly') from None
+
+        # the pull loop can be started from any thread
+        future = asyncio.run_coroutine_threadsafe(self.pull_loop(observer, scheduler, loop), loop)
+
+        def report_failure(f):
+            # e.g. an exception raised by `on_completed` or `on_error` of the observer
+            if not f.cancelled() and f.exception() is not None:
+                scheduler.report_failure(f.exception())
+
+        future.add_done_callback(report_failure)
+
+        def dispose():
+            future.cancel()
+
+        return Disposable.create(dispose)
@@ -0,0 +1,201 @@
+from typing import Callable, Any
+
+import numpy as np
+from rx import config
+from rx.disposables import CompositeDisposable
+
+from rxbackpressure.ack import Ack, Continue, Stop, continue_ack, stop_ack
+from rxbackpressure.observable import Observable
+from rxbackpressure.observer import Observer
+from rxbackpressure.scheduler import Scheduler
+from rxbackpressure.timevaluechunk import TimeValueChunk
+
+
+def align_chunks(left: TimeValueChunk, right: TimeValueChunk):
+    """ matches the samples of two chunks with equal timestamps
+
+    A right sample is matched with the first left sample of the same timestamp; a left sample can be matched with
+    several right samples. Samples that can still be matched by the next chunk of the other side are carried over.
+
+    :return: the indices of the matched left and right samples and the carried left and right tails
+    """
+
+    left_ts = left.timestamps
+    right_ts = right.timestamps
+
+    # right samples up to the last left timestamp are resolved by this left chunk
+    n_right = np.searchsorted(right_ts, left_ts[-1], side='right')
+
+    # left samples before the last right timestamp can not be matched by later right samples
+    n_left = np.searchsorted(left_ts, right_ts[-1], side='left')
+
+    idx = np.searchsorted(left_ts, right_ts[:n_right], side='left')
+    is_matched = left_ts[np.minimum(idx, len(left_ts) - 1)] == right_ts[:n_right]
+    right_idx = np.flatnonzero(is_matched)
+    left_idx = idx[right_idx]
+
+    return left_idx, right_idx, left[n_left:], right[n_right:]
+
+
+class ControlledZipChunksObservable(Observable):
+    """ Aligns two streams of `TimeValueChunk` by their timestamps; it is the vectorized counterpart of
+    `ControlledZipObservable` with `is_lower=lambda l, r: r < l` and `is_higher=lambda l, r: l < r`.
+
+    The samples are matched with `searchsorted` for the whole chunks. The unmatched tail of a chunk is kept until
+    the next chunk of the other side arrives, the side whose chunk is fully processed is requested next.
+    """
+
+    def __init__(self, left: Observable, right: Observable,
+                 selector: Callable[[Any, Any], Any] = None):
+        """
+        :param left: observable emitting chunks with ascending timestamps
+        :param right: observable emitting chunks with ascending timestamps
+        :param selector: (optional) vectorized function that takes the matched left and right values and returns
+        the values of the emitted chunk; by default a pair of aligned left and right chunks is emitted
+        """
+
+        self.left = left
+        self.right = right
+        self.selector = selector
+
+    def unsafe_subscribe(self, observer: Observer, scheduler: Scheduler, subscribe_scheduler: Scheduler):
+        lock = config['concurrency'].RLock()
+
+        # the unprocessed chunk and its acknowledgment, index 0 is left, index 1 is right
+        chunks = [None, None]
+        acks = [None, None]
+        is_completed = [False, False]
+        is_done = [False]
+
+        def signal_completed():
+            with lock:
+                if is_done[0]:
+                    return
+                is_done[0] = True
+
+            observer.on_completed()
+
+        def stop_pending(own_ack: Ack):
+            """ stops the side that is waiting with an unprocessed chunk
+            """
+
+            for ack in acks:
+                if ack is not None and ack is not own_ack:
+                    ack.on_next(stop_ack)
+                    ack.on_completed()
+
+        def emit(left: TimeValueChunk, right: TimeValueChunk, left_idx, right_idx):
+            timestamps = right.timestamps[right_idx]
+            left_values = left.values[left_idx]
+            right_values = right.values[right_idx]
+
+            if self.selector is None:
+                return observer.on_next((TimeValueChunk(timestamps, left_values),
+                                         TimeValueChunk(timestamps, right_values)))
+            else:
+                return observer.on_next(TimeValueChunk(timestamps, self.selector(left_values, right_values)))
+
+        def on_next(idx: int, chunk: TimeValueChunk):
+            if len(chunk) == 0:
+                return continue_ack
+
+            own_ack = Ack()
+
+            with lock:
+                if is_done[0]:
+                    return stop_ack
+
+                chunks[idx] = chunk
+                acks[idx] = own_ack
+                has_other = chunks[1 - idx] is not None
+
+            if not has_other:
+                return own_ack
+
+            left, right = chunks
+            left_idx, right_idx, left_tail, right_tail = align_chunks(left, right)
+
+            if len(right_idx):
+                ack = emit(left, right, left_idx, right_idx)
+            else:
+                ack = continue_ack
+
+            if isinstance(ack, Stop):
+                with lock:
+                    is_done[0] = True
+                stop_pending(own_ack)
+                return stop_ack
+
+            # at least one side is fully processed, it is requested next
+            consumed = 1 if len(right_tail) == 0 else 0
+            tail = left_tail if consumed == 1 else right_tail
+            requested = [consumed] if len(tail) else [0, 1]
+
+            with lock:
+                chunks[1 - consumed] = tail if len(tail) else None
+                requested_acks = []
+                for i in requested:
+                    chunks[i] = None
+                    requested_acks.append(acks[i])
+                    acks[i] = None
+
+                complete_observer = any(is_completed[i] for i in requested)
+
+            if complete_observer:
+                # no more samples can be matched
+                stop_pending(own_ack)
+                for requested_ack in requested_acks:
+                    if requested_ack is not own_ack:
+                        requested_ack.on_next(stop_ack)
+                        requested_ack.on_completed()
+
+                if isinstance(ack, Continue):
+                    signal_completed()
+                else:
+                    ack.on_complete(lambda _: signal_completed(), on_error=lambda err: signal_completed())
+                return stop_ack
+
+            for requested_ack in requested_acks:
+                if requested_ack is not own_ack:
+                    ack.connect_ack(requested_ack)
+
+            if own_ack in requested_acks:
+                return ack
+            else:
+                return own_ack
+
+        def on_completed(idx: int):
+            with lock:
+                is_completed[idx] = True
+                complete_observer = chunks[idx] is None
+
+            if complete_observer:
+                stop_pending(None)
+                signal_completed()
+
+        def on_error(exc):
+            with lock:
+                if is_done[0]:
+                    return
+                is_done[0] = True
+
+            stop_pending(None)
+            observer.on_error(exc)
+
+        class ChunkObserver(Observer):
+            def __init__(self, idx):
+                self.idx = idx
+
+            def on_next(self, v):
+                return on_next(self.idx, v)
+
+            def on_error(self, exc):
+                on_error(exc)
+
+            def on_completed(self):
+                on_completed(self.idx)
+
+        d1 = self.left.unsafe_subscribe(ChunkObserver(0), scheduler, subscribe_scheduler)
+        d2 = self.right.unsafe_subscribe(ChunkObserver(1), scheduler, subscribe_scheduler)
+
+        return CompositeDisposable(d1, d2)
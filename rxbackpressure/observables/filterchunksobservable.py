@@ -0,0 +1,67 @@
+from typing import Callable, Any
+
+from rx.concurrency.schedulerbase import SchedulerBase
+
+from rxbackpressure.ack import continue_ack
+from rxbackpressure.observable import Observable
+from rxbackpressure.observables.fusedobservable import partial_stage, skip
+from rxbackpressure.observer import Observer
+
+
+class FilterChunksObservable(Observable):
+    """ Filters the elements of array chunks (e.g. NumPy arrays) by a boolean mask computed for the whole chunk.
+    Chunks without any remaining element are dropped.
+    """
+
+    def __init__(self, source: Observable, mask_fn: Callable[[Any], Any]):
+        """
+        :param source: observable emitting array chunks
+        :param mask_fn: a function that takes a chunk and returns a boolean mask of the same length
+        """
+
+        self.source = source
+        self.mask_fn = mask_fn
+
+    def create_stage(self):
+        return partial_stage, self.filter_chunk
+
+    def filter_chunk(self, chunk):
+        filtered = chunk[self.mask_fn(chunk)]
+        if len(filtered):
+            return filtered
+        else:
+            return skip
+
+    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
+                         subscribe_scheduler: SchedulerBase):
+        filter_chunk = self.filter_chunk
+
+        def on_next(chunk):
+            filtered = filter_chunk(chunk)
+            if filtered is skip:
+                return continue_ack
+            else:
+                return observer.on_next(filtered)
+
+        def on_next_batch(chunks):
+            filtered = [r for r in map(filter_chunk, chunks) if r is not skip]
+            if filtered:
+                return observer.on_next_batch(filtered)
+            else:
+                return continue_ack
+
+        class FilterChunksObserver(Observer):
+            def on_next(self, v):
+                return on_next(v)
+
+            def on_next_batch(self, items):
+                return on_next_batch(items)
+
+            def on_error(self, exc):
+                return observer.on_error(exc)
+
+            def on_completed(self):
+                return observer.on_completed()
+
+        filter_observer = FilterChunksObserver()
+        return self.source.unsafe_subscribe(filter_observer, scheduler, subscribe_scheduler)
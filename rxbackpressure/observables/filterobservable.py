@@ -2,8 +2,9 @@ from typing import Callable, Any
 
 from rx.concurrency.schedulerbase import SchedulerBase
 
-from rxbackpressure.ack import Continue
+from rxbackpressure.ack import Continue, continue_ack
 from rxbackpressure.observable import Observable
+from rxbackpressure.observables.fusedobservable import filter_stage
 from rxbackpressure.observer import Observer
 
 
@@ -12,6 +13,9 @@ class FilterObservable(Observable):
         self.source = source
         self.predicate = predicate
 
+    def create_stage(self):
+        return filter_stage, self.predicate
+
     def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
                          subscribe_scheduler: SchedulerBase):
         def on_next(v):
@@ -21,10 +25,21 @@ class FilterObservable(Observable):
             else:
                 return Continue()
 
+        def on_next_batch(items):
+            predicate = self.predicate
+            filtered = [v for v in items if predicate(v)]
+            if filtered:
+                return observer.on_next_batch(filtered)
+            else:
+                return continue_ack
+
         class FilterObserver(Observer):
             def on_next(self, v):
                 return on_next(v)
 
+            def on_next_batch(self, items):
+                return on_next_batch(items)
+
             def on_error(self, exc):
                 return observer.on_error(exc)
 
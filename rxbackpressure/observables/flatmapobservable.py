@@ -85,7 +85,7 @@ class FlatMapObservable(Observable):
                     state[0] = WaitOnNextChild(ack)
 
                 if isinstance(current_state, WaitOnNextChild) or isinstance(current_state, Active):
-                    ack.subscribe(self.async_upstream_ack)
+                    ack.connect_ack(self.async_upstream_ack)
                 elif isinstance(current_state, Cancelled):
                     ack.on_next(Stop())
                     ack.on_completed()
@@ -113,7 +113,7 @@ class FlatMapObservable(Observable):
                     def _(v):
                         if isinstance(v, Stop):
                             self.on_stop_or_failure_ref()
-                    ack.subscribe(_)
+                    ack.on_complete(_)
 
                 return ack
 
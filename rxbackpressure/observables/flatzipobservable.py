@@ -5,6 +5,7 @@ from rx.concurrency import CurrentThreadScheduler
 from rx.disposables import CompositeDisposable, MultipleAssignmentDisposable
 
 from rxbackpressure.ack import Continue, Stop, Ack, stop_ack
+from rxbackpressure.internal.nolock import no_lock
 from rxbackpressure.observable import Observable
 from rxbackpressure.observer import Observer
 
@@ -66,6 +67,8 @@ class FlatZipObservable(Observable):
         pass
 
     def unsafe_subscribe(self, observer, scheduler, subscribe_scheduler):
+        lock = no_lock if scheduler.is_single_threaded else self.lock
+
         state = [self.WaitForLeftOrRight()]
         inner_left_completed = [0]
         right_completed = [False]
@@ -76,7 +79,7 @@ class FlatZipObservable(Observable):
         def on_next_left(left_elem):
             ack = Ack()
 
-            with self.lock:
+            with lock:
                 if isinstance(state[0], self.WaitForLeftOrRight):
                     new_state = self.WaitForRightOrInner(left_ack=ack)
                 elif isinstance(state[0], self.WaitForLeft):
@@ -99,7 +102,7 @@ class FlatZipObservable(Observable):
                     has_right_elem = False
                     right_elem = None
 
-                    with source.lock:
+                    with lock:
                         if isinstance(state[0], source.WaitForRightOrInner):
                             # not much to do
                             state_typed: source.WaitForRightOrInner = state[0]
@@ -129,20 +132,20 @@ class FlatZipObservable(Observable):
                             typed_state.upper_ack = upper_ack
 
                         if isinstance(upper_ack, Stop):
-                            with source.lock:
+                            with lock:
                                 state[0] = source.Completed()
                         else:
                             def _(v):
                                 if isinstance(v, Stop):
-                                    with source.lock:
+                                    with lock:
                                         state[0] = source.Completed()
-                            upper_ack.observe_on(scheduler).subscribe(_)
+                            upper_ack.on_complete(_, scheduler=scheduler)
                         return upper_ack
                     else:
                         return ack
 
                 def on_error(self, err):
-                    with source.lock:
+                    with lock:
                         state[0] = source.Completed()
                         observer.on_error(err)
 
@@ -154,7 +157,7 @@ class FlatZipObservable(Observable):
                     upper_ack = None
                     complete_observer = False
 
-                    with source.lock:
+                    with lock:
                         if isinstance(state[0], source.Active):
                             # normal complete
 
@@ -187,10 +190,10 @@ class FlatZipObservable(Observable):
                     if back_pressure_left or back_pressure_right:
                         def _(v):
                             if isinstance(v, Stop):
-                                with source.lock:
+                                with lock:
                                     state[0] = source.Completed()
 
-                        upper_ack.subscribe(_)
+                        upper_ack.on_complete(_)
 
                     if back_pressure_left:
                         # upper_ack should not be Stop
@@ -198,14 +201,14 @@ class FlatZipObservable(Observable):
                             left_ack.on_next(upper_ack)
                             left_ack.on_completed()
                         else:
-                            upper_ack.observe_on(scheduler).subscribe(left_ack)
+                            upper_ack.connect_ack(left_ack, scheduler=scheduler)
 
                     if back_pressure_right:
                         if isinstance(upper_ack, Continue):
                             right_ack.on_next(upper_ack)
                             right_ack.on_completed()
                         else:
-                            upper_ack.observe_on(scheduler).subscribe(right_ack)
+                            upper_ack.connect_ack(right_ack, scheduler=scheduler)
 
             child = self.selector_inner(left_elem)
             child_observer = ChildObserver(observer, scheduler)
@@ -222,7 +225,7 @@ class FlatZipObservable(Observable):
             request_left_right = False
             request_right = False
 
-            with self.lock:
+            with lock:
                 if 0 < inner_left_completed[0]:
                     inner_left_completed[0] -= 1
                     request_right = True
@@ -258,12 +261,12 @@ class FlatZipObservable(Observable):
                 upper_ack = observer.on_next(zipped_elem)
 
                 if isinstance(upper_ack, Stop):
-                    with self.lock:
+                    with lock:
                         state[0] = self.Completed
                         return upper_ack
 
                 request_inner_elem = False
-                with self.lock:
+                with lock:
                     if 0 < inner_left_completed[0]:
                         # inner left completed, request new left and right
                         new_state = self.WaitForLeftOrRight()
@@ -280,26 +283,26 @@ class FlatZipObservable(Observable):
                         inner_left_ack.on_next(upper_ack)
                         inner_left_ack.on_completed()
                     else:
-                        upper_ack.observe_on(scheduler).subscribe(inner_left_ack)
+                        upper_ack.connect_ack(inner_left_ack, scheduler=scheduler)
 
                 if request_left_right:
                     if isinstance(upper_ack, Continue):
                         left_ack.on_next(upper_ack)
                         left_ack.on_completed()
                     else:
-                        upper_ack.observe_on(scheduler).subscribe(left_ack)
+                        upper_ack.connect_ack(left_ack, scheduler=scheduler)
 
             if request_left_right or request_right:
                 if isinstance(upper_ack, Continue):
                     ack.on_next(upper_ack)
                     ack.on_completed()
                 else:
-                    upper_ack.observe_on(scheduler).subscribe(ack)
+                    upper_ack.connect_ack(ack, scheduler=scheduler)
 
             return ack
 
         def on_completed_left():
-            with self.lock:
+            with lock:
                 if isinstance(state[0], self.Completed):
                     return
 
@@ -313,7 +316,7 @@ class FlatZipObservable(Observable):
                 return observer.on_completed()
 
         def on_completed_right():
-            with self.lock:
+            with lock:
                 if isinstance(state[0], self.Completed):
                     return
 
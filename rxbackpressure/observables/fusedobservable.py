@@ -0,0 +1,92 @@
+from typing import Callable, Any, List, Tuple
+
+from rx.concurrency.schedulerbase import SchedulerBase
+
+from rxbackpressure.ack import continue_ack
+from rxbackpressure.observable import Observable
+from rxbackpressure.observer import Observer
+
+# kinds of synchronous stages
+map_stage = 0       # the function maps an item
+filter_stage = 1    # the function is a predicate, items that do not pass are dropped
+partial_stage = 2   # the function maps an item or returns `skip` to drop it
+
+skip = object()
+
+Stage = Tuple[int, Callable[[Any], Any]]
+
+
+class FusedObservable(Observable):
+    """ Runs a chain of synchronous operators (e.g. map, filter, map_count and pairwise) in a single observer
+    instead of an observer per operator. Each operator provides a stage by `create_stage`, which is called once
+    per subscription so that stateful operators keep their state per subscription.
+    """
+
+    def __init__(self, source: Observable, operators: List[Any]):
+        """
+        :param source: the observable subscribed by the fused observer
+        :param operators: the fused operators ordered from upstream to downstream
+        """
+
+        self.source = source
+        self.operators = operators
+
+    @staticmethod
+    def compose(kind: int, func: Callable[[Any], Any], on_next: Callable[[Any], Any]):
+        if kind == map_stage:
+            def stage_on_next(v):
+                return on_next(func(v))
+        elif kind == filter_stage:
+            def stage_on_next(v):
+                if func(v):
+                    return on_next(v)
+                else:
+                    return continue_ack
+        else:
+            def stage_on_next(v):
+                result = func(v)
+                if result is skip:
+                    return continue_ack
+                else:
+                    return on_next(result)
+
+        return stage_on_next
+
+    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
+                         subscribe_scheduler: SchedulerBase):
+        stages: List[Stage] = [op.create_stage() for op in self.operators]
+
+        # compose the stages from downstream to upstream into a single function
+        on_next = observer.on_next
+        for kind, func in reversed(stages):
+            on_next = self.compose(kind, func, on_next)
+
+        def on_next_batch(items):
+            for kind, func in stages:
+                if kind == map_stage:
+                    items = [func(v) for v in items]
+                elif kind == filter_stage:
+                    items = [v for v in items if func(v)]
+                else:
+                    items = [r for r in map(func, items) if r is not skip]
+
+                if not items:
+                    return continue_ack
+
+            return observer.on_next_batch(items)
+
+        class FusedObserver(Observer):
+            def on_next(self, v):
+                return on_next(v)
+
+            def on_next_batch(self, items):
+                return on_next_batch(items)
+
+            def on_error(self, exc):
+                return observer.on_error(exc)
+
+            def on_completed(self):
+                return observer.on_completed()
+
+        fused_observer = FusedObserver()
+        return self.source.unsafe_subscribe(fused_observer, scheduler, subscribe_scheduler)
@@ -1,3 +1,4 @@
+import itertools
 from typing import Iterator
 
 from rx import config
@@ -6,24 +7,33 @@ from rx.core import Disposable
 from rx.disposables import BooleanDisposable
 
 from rxbackpressure.ack import Continue, Stop
+from rxbackpressure.internal.nolock import no_lock
 from rxbackpressure.observable import Observable
 from rxbackpressure.observer import Observer
 from rxbackpressure.scheduler import SchedulerBase, ExecutionModel
 
 
 class IteratorAsObservable(Observable):
-    def __init__(self, iterator: Iterator, on_finish: Disposable = Disposable.empty()):
-        self.iterator = iterator
+    def __init__(self, iterator: Iterator, on_finish: Disposable = Disposable.empty(), batch_size: int = None):
+        """
+        :param iterator:
+        :param on_finish:
+        :param batch_size: (optional) if set, the items are sent in batches of this size by `on_next_batch`
+        """
+
+        self.iterator = iterator if batch_size is None else self.iter_batches(iterator, batch_size)
         self.on_finish = on_finish
+        self.batch_size = batch_size
 
         self.lock = config['concurrency'].RLock()
 
     def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
                          subscribe_scheduler: SchedulerBase):
+        lock = no_lock if scheduler.is_single_threaded else self.lock
 
         try:
             # todo: is the lock necessary? lock only needed to verify that subscribed once...
-            with self.lock:
+            with lock:
                 item = next(self.iterator)
             has_next = True
         except StopIteration:
@@ -42,25 +52,33 @@ class IteratorAsObservable(Observable):
 
                 def action(_, __):
                     # start sending items
-                    self.fast_loop(item, observer, scheduler, disposable, scheduler.get_execution_model(),
-                                   sync_index=0)
+                    em = scheduler.get_execution_model().create_loop_state()
+                    self.fast_loop(item, observer, scheduler, disposable, em, sync_index=0, lock=lock)
 
                 subscribe_scheduler.schedule(action)
                 return disposable
         except:
             raise Exception('fatal error')
 
+    @staticmethod
+    def iter_batches(iterator: Iterator, batch_size: int):
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
     def trigger_cancel(self, scheduler: SchedulerBase):
         try:
             self.on_finish.dispose()
         except Exception as e:
             scheduler.report_failure(e)
 
-    def reschedule(self, ack, next_item, observer, scheduler: SchedulerBase, disposable, em: ExecutionModel):
+    def reschedule(self, ack, next_item, observer, scheduler: SchedulerBase, disposable, em: ExecutionModel, lock):
         def on_next(next):
             if isinstance(next, Continue):
                 try:
-                    self.fast_loop(next_item, observer, scheduler, disposable, em, sync_index=0)
+                    self.fast_loop(next_item, observer, scheduler, disposable, em, sync_index=0, lock=lock)
                 except Exception as e:
                     self.trigger_cancel(scheduler)
                     scheduler.report_failure(e)
@@ -71,13 +89,15 @@ class IteratorAsObservable(Observable):
             self.trigger_cancel(scheduler)
             scheduler.report_failure(err)
 
-        ack.observe_on(scheduler).subscribe(on_next=on_next, on_error=on_error)
+        ack.on_complete(on_next, scheduler=scheduler, on_error=on_error)
 
     def fast_loop(self, current_item, observer, scheduler: SchedulerBase,
-                  disposable: BooleanDisposable, em: ExecutionModel, sync_index: int):
+                  disposable: BooleanDisposable, em: ExecutionModel, sync_index: int, lock):
+        send_next = observer.on_next if self.batch_size is None else observer.on_next_batch
+
         while True:
             try:
-                with self.lock:
+                with lock:
                     next_item = next(self.iterator)
                 has_next = True
             except StopIteration:
@@ -92,7 +112,7 @@ class IteratorAsObservable(Observable):
                     scheduler.report_failure(e)
 
             try:
-                ack = observer.on_next(current_item)
+                ack = send_next(current_item)
 
                 if not has_next:
                     try:
@@ -114,7 +134,7 @@ class IteratorAsObservable(Observable):
                         current_item = next_item
                         sync_index = next_index
                     elif next_index == 0 and not disposable.is_disposed:
-                        self.reschedule(ack, next_item, observer, scheduler, disposable, em)
+                        self.reschedule(ack, next_item, observer, scheduler, disposable, em, lock)
                         break
                     else:
                         self.trigger_cancel(scheduler)
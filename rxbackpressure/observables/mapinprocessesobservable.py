@@ -0,0 +1,64 @@
+from concurrent.futures.process import ProcessPoolExecutor
+from typing import Callable, Any, List
+
+from rxbackpressure.observable import Observable
+from rxbackpressure.observables.orderedmapobservable import OrderedMapObservable
+from rxbackpressure.schedulers.processpoolscheduler import ProcessPoolScheduler
+
+
+def map_batch(selector: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    """ maps a batch of items in a worker process
+    """
+
+    return [selector(v) for v in items]
+
+
+class MapInProcessesObservable(OrderedMapObservable):
+    """ Maps the items in worker processes and emits the results in the order of the items.
+
+    Each item, or each batch of items sent by `on_next_batch`, is a task for a worker process; batches amortize
+    the cost of pickling. The source is back-pressured while `max_in_flight` tasks are running or waiting to be
+    emitted.
+
+    If no scheduler is given, each subscription starts its own process pool, which is shut down once the
+    subscription terminates.
+    """
+
+    def __init__(self, source: Observable, selector: Callable[[Any], Any], max_in_flight: int,
+                 scheduler: ProcessPoolScheduler = None, max_workers: int = None):
+        """
+        :param source:
+        :param selector: a function that can be pickled, e.g. a module-level function
+        :param max_in_flight: maximum number of tasks that are running or waiting to be emitted
+        :param scheduler: (optional) scheduler whose worker processes map the items, it is not shut down
+        :param max_workers: (optional) number of worker processes of the pool started per subscription if no
+        scheduler is given, by default the number of processors
+        """
+
+        super().__init__(source=source, selector=selector, max_in_flight=max_in_flight)
+
+        self.process_scheduler = scheduler
+        self.max_workers = max_workers
+
+    def open(self):
+        if self.process_scheduler is None:
+            executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            submit = executor.submit
+
+            def close():
+                executor.shutdown(wait=False)
+        else:
+            submit = self.process_scheduler.submit
+
+            def close():
+                pass
+
+        selector = self.selector
+
+        def submit_task(items, is_batch: bool):
+            if is_batch:
+                return submit(map_batch, selector, items)
+            else:
+                return submit(selector, items)
+
+        return submit_task, close
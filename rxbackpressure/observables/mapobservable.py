@@ -3,6 +3,7 @@ from typing import Callable, Any
 from rx.concurrency.schedulerbase import SchedulerBase
 
 from rxbackpressure.observable import Observable
+from rxbackpressure.observables.fusedobservable import map_stage
 from rxbackpressure.observer import Observer
 
 
@@ -11,16 +12,26 @@ class MapObservable(Observable):
         self.source = source
         self.func = selector
 
+    def create_stage(self):
+        return map_stage, self.func
+
     def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
                          subscribe_scheduler: SchedulerBase):
         def on_next(v):
             result = self.func(v)
             return observer.on_next(result)
 
+        def on_next_batch(items):
+            func = self.func
+            return observer.on_next_batch([func(v) for v in items])
+
         class MapObserver(Observer):
             def on_next(self, v):
                 return on_next(v)
 
+            def on_next_batch(self, items):
+                return on_next_batch(items)
+
             def on_error(self, exc):
                 return observer.on_error(exc)
 
@@ -0,0 +1,65 @@
+from concurrent.futures import Future
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import Callable, Any
+
+from rxbackpressure.observable import Observable
+from rxbackpressure.observables.orderedmapobservable import OrderedMapObservable
+from rxbackpressure.scheduler import SchedulerBase
+
+
+class MapParallelObservable(OrderedMapObservable):
+    """ Maps up to `concurrency` items at once on a scheduler (e.g. a thread pool) and emits the results in the
+    order of the items. An item is acknowledged as soon as a slot is free.
+
+    A batch of items sent by `on_next_batch` is mapped by a single task. If no scheduler is given, each
+    subscription starts its own pool of `concurrency` threads, which is shut down once the subscription terminates.
+    """
+
+    def __init__(self, source: Observable, selector: Callable[[Any], Any], concurrency: int,
+                 scheduler: SchedulerBase = None):
+        """
+        :param source:
+        :param selector: function that defines the mapping
+        :param concurrency: maximum number of items that are mapped or waiting to be emitted
+        :param scheduler: (optional) scheduler on which the items are mapped, it is not shut down
+        """
+
+        super().__init__(source=source, selector=selector, max_in_flight=concurrency)
+
+        self.scheduler = scheduler
+
+    def open(self):
+        selector = self.selector
+
+        def map_items(items, is_batch: bool):
+            if is_batch:
+                return [selector(v) for v in items]
+            else:
+                return selector(items)
+
+        if self.scheduler is None:
+            executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+
+            def close():
+                executor.shutdown(wait=False)
+
+            return lambda items, is_batch: executor.submit(map_items, items, is_batch), close
+
+        def submit_task(items, is_batch: bool):
+            future = Future()
+
+            def action(_, __):
+                try:
+                    result = map_items(items, is_batch)
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+
+            self.scheduler.schedule(action)
+            return future
+
+        def close():
+            pass
+
+        return submit_task, close
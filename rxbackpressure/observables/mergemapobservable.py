@@ -0,0 +1,98 @@
+from typing import Callable, Any
+
+from rx import config
+from rx.concurrency.schedulerbase import SchedulerBase
+
+from rxbackpressure.ack import Ack, continue_ack, stop_ack
+from rxbackpressure.internal.mergeserializer import MergeSerializer
+from rxbackpressure.observable import Observable
+from rxbackpressure.observer import Observer
+
+
+class MergeMapObservable(Observable):
+    """ Applies a function to each item of the source and merges the items of the returned inner observables.
+    Up to `max_concurrent` inner observables are subscribed at once; the source is back-pressured while all of
+    them are active.
+    """
+
+    def __init__(self, source: Observable, selector: Callable[[Any], Observable], max_concurrent: int):
+        """
+        :param source:
+        :param selector: function that returns an inner observable for an item
+        :param max_concurrent: maximum number of active inner observables
+        """
+
+        self.source = source
+        self.selector = selector
+        self.max_concurrent = max_concurrent
+
+    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
+                         subscribe_scheduler: SchedulerBase):
+        selector = self.selector
+        max_concurrent = self.max_concurrent
+        lock = config['concurrency'].RLock()
+
+        n_active = [0]
+
+        # acknowledgment returned to the source while all inner observables are active
+        back_pressured = [None]
+
+        def complete_back_pressured(value):
+            with lock:
+                ack = back_pressured[0]
+                back_pressured[0] = None
+
+            if ack is not None:
+                ack.on_next(value)
+                ack.on_completed()
+
+        serializer = MergeSerializer(observer, scheduler, on_stop=lambda: complete_back_pressured(stop_ack))
+
+        # the source is completed like an inner observable
+        serializer.add_source()
+
+        class InnerObserver(Observer):
+            def on_next(self, v):
+                return serializer.send(v)
+
+            def on_next_batch(self, items):
+                return serializer.send(items, is_batch=True)
+
+            def on_error(self, exc):
+                serializer.on_error(exc)
+                complete_back_pressured(stop_ack)
+
+            def on_completed(self):
+                with lock:
+                    n_active[0] -= 1
+
+                # a slot is free
+                complete_back_pressured(continue_ack)
+                serializer.complete_source()
+
+        class MergeMapObserver(Observer):
+            def on_next(self, elem):
+                if serializer.is_done or serializer.is_stopped:
+                    return stop_ack
+
+                child = selector(elem)
+                serializer.add_source()
+
+                with lock:
+                    n_active[0] += 1
+                    if n_active[0] < max_concurrent:
+                        ack = continue_ack
+                    else:
+                        ack = Ack()
+                        back_pressured[0] = ack
+
+                child.subscribe(InnerObserver(), scheduler, subscribe_scheduler)
+                return ack
+
+            def on_error(self, exc):
+                serializer.on_error(exc)
+
+            def on_completed(self):
+                serializer.complete_source()
+
+        return self.source.unsafe_subscribe(MergeMapObserver(), scheduler, subscribe_scheduler)
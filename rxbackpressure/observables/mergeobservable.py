@@ -0,0 +1,41 @@
+from typing import List
+
+from rx.concurrency.schedulerbase import SchedulerBase
+from rx.disposables import CompositeDisposable
+
+from rxbackpressure.internal.mergeserializer import MergeSerializer
+from rxbackpressure.observable import Observable
+from rxbackpressure.observer import Observer
+
+
+class MergeObservable(Observable):
+    """ Forwards the items of all sources as they arrive. Each source is back-pressured by the acknowledgments of
+    its own items, a source waiting for the observer does not hold back the other sources.
+    """
+
+    def __init__(self, sources: List[Observable]):
+        self.sources = sources
+
+    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
+                         subscribe_scheduler: SchedulerBase):
+        serializer = MergeSerializer(observer, scheduler)
+
+        for _ in self.sources:
+            serializer.add_source()
+
+        class MergeObserver(Observer):
+            def on_next(self, v):
+                return serializer.send(v)
+
+            def on_next_batch(self, items):
+                return serializer.send(items, is_batch=True)
+
+            def on_error(self, exc):
+                serializer.on_error(exc)
+
+            def on_completed(self):
+                serializer.complete_source()
+
+        disposables = [source.unsafe_subscribe(MergeObserver(), scheduler, subscribe_scheduler)
+                       for source in self.sources]
+        return CompositeDisposable([d for d in disposables if d is not None])
@@ -0,0 +1,195 @@
+import heapq
+from typing import Callable, Any, List
+
+from rx import config
+from rx.concurrency.schedulerbase import SchedulerBase
+from rx.disposables import CompositeDisposable
+
+from rxbackpressure.ack import Ack, Continue, Stop, stop_ack
+from rxbackpressure.observable import Observable
+from rxbackpressure.observer import Observer
+
+
+class MergeSortedObservable(Observable):
+    """ Merges observables that emit their items in ascending order into a single observable emitting all items
+    in ascending order.
+
+    Each source holds at most one pending item, its head. The heads are kept in a heap; the lowest head is
+    emitted once every source that is not completed has a head, and only the source of the emitted head is
+    acknowledged. Equal items are emitted in the order of the sources.
+    """
+
+    def __init__(self, sources: List[Observable], key: Callable[[Any], Any] = None):
+        """
+        :param sources: observables emitting their items in ascending order
+        :param key: (optional) function that returns the sort key of an item, by default the item itself
+        """
+
+        self.sources = sources
+        self.key = key
+
+    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
+                         subscribe_scheduler: SchedulerBase):
+        key = self.key or (lambda v: v)
+        lock = config['concurrency'].RLock()
+
+        # heap of (key, source index, item)
+        heap = []
+        acks = [None] * len(self.sources)
+        is_completed = [False] * len(self.sources)
+
+        # number of sources that are not completed and have no head
+        n_waiting = [len(self.sources)]
+        is_done = [False]
+
+        # set while a thread emits the heads
+        emitting = [False]
+
+        def signal_completed():
+            with lock:
+                if is_done[0]:
+                    return
+                is_done[0] = True
+
+            observer.on_completed()
+
+        def stop_all():
+            with lock:
+                is_done[0] = True
+                pending = [ack for ack in acks if ack is not None]
+                for idx in range(len(acks)):
+                    acks[idx] = None
+
+            for ack in pending:
+                ack.on_next(stop_ack)
+                ack.on_completed()
+
+        def emit_heads(caller: int = None, is_emitting: bool = False):
+            """ emits the lowest heads as long as every source that is not completed has a head; only one thread
+            emits at a time
+
+            :param caller: index of the source that calls, the acknowledgment of its head is returned
+            :param is_emitting: True if the calling thread already emits
+            :return: the acknowledgment for the caller, or None if the head of the caller is not emitted
+            """
+
+            while True:
+                with lock:
+                    if not is_emitting:
+                        if emitting[0]:
+                            return None
+                        emitting[0] = is_emitting = True
+
+                    if 0 < n_waiting[0] or is_done[0]:
+                        emitting[0] = False
+                        return None
+
+                    if not heap:
+                        complete_observer = True
+                    else:
+                        complete_observer = False
+                        _, idx, item = heapq.heappop(heap)
+                        source_ack = acks[idx]
+                        acks[idx] = None
+                        if not is_completed[idx]:
+                            n_waiting[0] += 1
+
+                if complete_observer:
+                    signal_completed()
+                    return None
+
+                ack = observer.on_next(item)
+
+                if isinstance(ack, Stop):
+                    if source_ack is not None:
+                        source_ack.on_next(stop_ack)
+                        source_ack.on_completed()
+                    stop_all()
+                    return stop_ack
+
+                if idx == caller:
+                    # the caller sends its next item after the acknowledgment
+                    if isinstance(ack, Continue):
+                        with lock:
+                            emitting[0] = False
+                    else:
+                        wait_for(ack)
+                    return ack
+
+                if source_ack is not None:
+                    ack.connect_ack(source_ack)
+
+                if isinstance(ack, Continue):
+                    continue
+
+                wait_for(ack)
+                return None
+
+        def wait_for(ack: Ack):
+            """ keeps the emitting state until the acknowledgment completes, such that neither a new head nor the
+            completion of a source emits the next head before; then continues emitting, or stops the other sources
+            if the observer stops
+            """
+
+            def on_next(next):
+                if not isinstance(next, Continue):
+                    stop_all()
+                else:
+                    emit_heads(is_emitting=True)
+
+            ack.on_complete(on_next, scheduler=scheduler, on_error=lambda err: stop_all())
+
+        def on_next(idx: int, v):
+            with lock:
+                if is_done[0]:
+                    return stop_ack
+
+                heapq.heappush(heap, (key(v), idx, v))
+                own_ack = acks[idx] = Ack()
+                n_waiting[0] -= 1
+
+            ack = emit_heads(caller=idx)
+
+            if ack is None:
+                return own_ack
+            else:
+                return ack
+
+        def on_completed(idx: int):
+            with lock:
+                is_completed[idx] = True
+
+                # a source can complete before its head is emitted
+                if not any(i == idx for _, i, _ in heap):
+                    n_waiting[0] -= 1
+
+            emit_heads()
+
+        def on_error(exc):
+            with lock:
+                if is_done[0]:
+                    return
+                is_done[0] = True
+
+            stop_all()
+            observer.on_error(exc)
+
+        class MergeSortedObserver(Observer):
+            def __init__(self, idx):
+                self.idx = idx
+
+            def on_next(self, v):
+                return on_next(self.idx, v)
+
+            def on_error(self, exc):
+                on_error(exc)
+
+            def on_completed(self):
+                on_completed(self.idx)
+
+        if not self.sources:
+            observer.on_completed()
+
+        disposables = [source.unsafe_subscribe(MergeSortedObserver(idx), scheduler, subscribe_scheduler)
+                       for idx, source in enumerate(self.sources)]
+        return CompositeDisposable([d for d in disposables if d is not None])
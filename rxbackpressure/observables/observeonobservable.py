@@ -2,19 +2,37 @@ from rx.concurrency.schedulerbase import SchedulerBase
 
 from rxbackpressure.ack import Continue, Stop, Ack
 from rxbackpressure.observers.anonymousobserver import AnonymousObserver
+from rxbackpressure.observers.demandobserver import DemandObserver
+from rxbackpressure.observers.requestingsubscriber import RequestingSubscriber
 from rxbackpressure.observable import Observable
 from rxbackpressure.observer import Observer
 
 
 class ObserveOnObservable(Observable):
-    def __init__(self, source: Observable, scheduler: SchedulerBase):
+    def __init__(self, source: Observable, scheduler: SchedulerBase, request_size: int = None,
+                 low_watermark: int = None):
         self.source = source
         self.scheduler = scheduler
+        self.request_size = request_size
+        self.low_watermark = low_watermark
 
     def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase, subscribe_scheduler: SchedulerBase):
+        if self.request_size is not None:
+            # demand mode: items are requested in advance instead of acknowledging each item on the scheduler
+            subscriber = RequestingSubscriber(observer, self.scheduler, self.request_size, self.low_watermark)
+            return self.source.unsafe_subscribe(DemandObserver(subscriber), scheduler, subscribe_scheduler)
+
         def on_next(v):
+            return schedule_on_next(observer.on_next, v)
+
+        def on_next_batch(items):
+            return schedule_on_next(observer.on_next_batch, items)
+
+        def schedule_on_next(send_next, v):
+            ack = Ack()
+
             def action(_, __):
-                inner_ack = observer.on_next(v)
+                inner_ack = send_next(v)
 
                 if isinstance(inner_ack, Continue):
                     ack.on_next(inner_ack)
@@ -23,11 +41,9 @@ class ObserveOnObservable(Observable):
                     ack.on_next(inner_ack)
                     ack.on_completed()
                 else:
-                    inner_ack.unsafe_subscribe(ack)
+                    inner_ack.connect_ack(ack)
 
             self.scheduler.schedule(action)
-
-            ack = Ack()
             return ack
 
         def on_error(exc):
@@ -43,5 +59,5 @@ class ObserveOnObservable(Observable):
             self.scheduler.schedule(action)
 
         observe_on_observer = AnonymousObserver(on_next=on_next, on_error=on_error,
-                                     on_completed=on_completed)
+                                                on_completed=on_completed, on_next_batch=on_next_batch)
         return self.source.unsafe_subscribe(observe_on_observer, scheduler, subscribe_scheduler)
@@ -0,0 +1,219 @@
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Any, Tuple
+
+from rx import config
+from rx.concurrency import EventLoopScheduler
+from rx.concurrency.schedulerbase import SchedulerBase
+from rx.core import Disposable
+from rx.disposables import CompositeDisposable
+
+from rxbackpressure.ack import Ack, Continue, Stop, continue_ack, stop_ack
+from rxbackpressure.observable import Observable
+from rxbackpressure.observer import Observer
+from rxbackpressure.schedulers.trampolinescheduler import TrampolineScheduler
+
+
+class OrderedMapObservable(Observable):
+    """ Maps the items by tasks that run concurrently and emits the results in the order of the items. The source
+    is back-pressured while `max_in_flight` tasks are running or waiting to be emitted.
+
+    The results are emitted on the scheduler of the subscription. The completion of a task hops to that scheduler,
+    unless it executes the actions on the calling thread (e.g. a trampoline), in which case the results are emitted
+    on a thread of the subscription instead of the worker that completed the task.
+
+    Subclasses define how the tasks are run by `open`, which is called once per subscription.
+    """
+
+    def __init__(self, source: Observable, selector: Callable[[Any], Any], max_in_flight: int):
+        """
+        :param source:
+        :param selector: function that defines the mapping
+        :param max_in_flight: maximum number of tasks that are running or waiting to be emitted
+        """
+
+        self.source = source
+        self.selector = selector
+        self.max_in_flight = max_in_flight
+
+    def open(self) -> Tuple[Callable[[Any, bool], Future], Callable[[], None]]:
+        """ acquires the resources that run the tasks of a subscription (e.g. a pool of workers)
+
+        :return: a function `submit(items, is_batch)` that starts a task mapping an item, or a batch of items if
+        `is_batch` is True, and returns a future of the result; and a function that releases the resources, it is
+        called once the subscription completes, fails, stops or is disposed
+        """
+
+        raise NotImplementedError
+
+    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
+                         subscribe_scheduler: SchedulerBase):
+        max_in_flight = self.max_in_flight
+        em = scheduler.get_execution_model().create_loop_state()
+        lock = config['concurrency'].RLock()
+
+        # a trampoline would emit on the worker thread that completes a task; the thread exits once it is idle
+        if isinstance(scheduler, TrampolineScheduler):
+            emit_scheduler = EventLoopScheduler(thread_factory=lambda target: threading.Thread(target=target, daemon=True),
+                                                exit_if_empty=True)
+        else:
+            emit_scheduler = scheduler
+
+        submit_task, close_tasks = self.open()
+        is_closed = [False]
+
+        def close():
+            with lock:
+                if is_closed[0]:
+                    return
+                is_closed[0] = True
+
+            close_tasks()
+
+        # the tasks in the order of the items; a task is a pair of a future and a flag if it maps a batch
+        in_flight = deque()
+
+        back_pressured = [None]
+        is_emitting = [False]
+        is_stopped = [False]
+        upstream_is_complete = [False]
+        error_thrown = [None]
+
+        def schedule_emit(_=None):
+            with lock:
+                if is_emitting[0] or is_stopped[0]:
+                    return
+                is_emitting[0] = True
+
+            def action(_, __):
+                emit_loop()
+
+            emit_scheduler.schedule(action)
+
+        def stop():
+            with lock:
+                is_stopped[0] = True
+                tasks = list(in_flight)
+                in_flight.clear()
+                ack = back_pressured[0]
+                back_pressured[0] = None
+
+            for future, _ in tasks:
+                future.cancel()
+            close()
+
+            if ack is not None:
+                ack.on_next(stop_ack)
+                ack.on_completed()
+
+        def emit_loop():
+            frame_index = em.next_frame_index(0)
+
+            while True:
+                with lock:
+                    if not in_flight or not in_flight[0][0].done():
+                        is_emitting[0] = False
+                        is_complete = not in_flight and upstream_is_complete[0] and not is_stopped[0]
+                        if is_complete:
+                            is_stopped[0] = True
+                        break
+
+                    future, is_batch = in_flight.popleft()
+
+                    # a slot is free
+                    ack = back_pressured[0]
+                    back_pressured[0] = None
+
+                if ack is not None:
+                    ack.on_next(continue_ack)
+                    ack.on_completed()
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    stop()
+                    observer.on_error(e)
+                    return
+
+                if is_batch:
+                    ack = observer.on_next_batch(result)
+                else:
+                    ack = observer.on_next(result)
+
+                if isinstance(ack, Continue):
+                    frame_index = em.next_frame_index(frame_index)
+
+                    if frame_index == 0:
+                        def action(_, __):
+                            emit_loop()
+
+                        scheduler.schedule(action)
+                        return
+                elif isinstance(ack, Stop):
+                    stop()
+                    return
+                else:
+                    def on_next(v):
+                        if isinstance(v, Continue):
+                            emit_loop()
+                        else:
+                            stop()
+
+                    def on_error(err):
+                        stop()
+
+                    ack.on_complete(on_next, scheduler=scheduler, on_error=on_error)
+                    return
+
+            if is_complete:
+                close()
+                if error_thrown[0] is None:
+                    observer.on_completed()
+                else:
+                    observer.on_error(error_thrown[0])
+
+        def submit(items, is_batch):
+            if is_stopped[0]:
+                return stop_ack
+
+            with lock:
+                if is_stopped[0]:
+                    return stop_ack
+
+                # the task is submitted under the lock, so that a concurrent dispose does not release the resources
+                # in between
+                future = submit_task(items, is_batch)
+                in_flight.append((future, is_batch))
+
+                if len(in_flight) < max_in_flight:
+                    ack = continue_ack
+                else:
+                    ack = Ack()
+                    back_pressured[0] = ack
+
+            # the callback is called by the thread completing the task, or directly if the task is already done;
+            # either way the emission is scheduled
+            future.add_done_callback(schedule_emit)
+            return ack
+
+        def on_completed():
+            upstream_is_complete[0] = True
+            schedule_emit()
+
+        class OrderedMapObserver(Observer):
+            def on_next(self, v):
+                return submit(v, False)
+
+            def on_next_batch(self, items):
+                return submit(items, True)
+
+            def on_error(self, exc):
+                error_thrown[0] = exc
+                on_completed()
+
+            def on_completed(self):
+                on_completed()
+
+        disposable = self.source.unsafe_subscribe(OrderedMapObserver(), scheduler, subscribe_scheduler)
+        return CompositeDisposable([d for d in (disposable, Disposable.create(stop)) if d is not None])
@@ -2,8 +2,8 @@ from typing import Callable, Any
 
 from rx.concurrency.schedulerbase import SchedulerBase
 
-from rxbackpressure.ack import Continue
 from rxbackpressure.observable import Observable
+from rxbackpressure.observables.fusedobservable import partial_stage, skip, FusedObservable
 from rxbackpressure.observer import Observer
 
 
@@ -12,32 +12,24 @@ class PairwiseObservable(Observable):
         self.source = source
         self.selector = selector or (lambda v1, v2: (v1, v2))
 
-    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
-                         subscribe_scheduler: SchedulerBase):
-
+    def create_stage(self):
         is_first = [True]
         last_elem = [None]
 
-        def on_next(v):
+        def stage(v):
             if is_first[0]:
                 is_first[0] = False
                 last_elem[0] = v
-                return Continue()
+                return skip
             else:
                 new = self.selector(last_elem[0], v)
                 last_elem[0] = v
-                ack = observer.on_next(new)
-                return ack
-
-        class PairwiseObserver(Observer):
-            def on_next(self, v):
-                return on_next(v)
+                return new
 
-            def on_error(self, exc):
-                return observer.on_error(exc)
+        return partial_stage, stage
 
-            def on_completed(self):
-                return observer.on_completed()
-
-        map_observer = PairwiseObserver()
-        self.source.unsafe_subscribe(map_observer, scheduler, subscribe_scheduler)
\ No newline at end of file
+    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
+                         subscribe_scheduler: SchedulerBase):
+        # the observer is built from the stage, also if pairwise is not fused with other operators
+        fused = FusedObservable(self.source, [self])
+        return fused.unsafe_subscribe(observer, scheduler, subscribe_scheduler)
@@ -0,0 +1,273 @@
+from typing import Callable, Any, List
+
+from rx import config
+from rx.disposables import CompositeDisposable
+
+from rxbackpressure.ack import Ack, Continue, Stop, continue_ack, stop_ack
+from rxbackpressure.observable import Observable
+from rxbackpressure.observables.fusedobservable import skip
+from rxbackpressure.observer import Observer
+from rxbackpressure.scheduler import Scheduler
+from rxbackpressure.timevaluechunk import TimeValueChunk
+
+
+def concat_chunks(chunks: List[Any]):
+    """ concatenates the parts of a window; a window within a single chunk is returned as it is, i.e. as a view
+    """
+
+    if len(chunks) == 1:
+        return chunks[0]
+
+    # NumPy is only required if a window spans several chunks
+    import numpy as np
+
+    if isinstance(chunks[0], TimeValueChunk):
+        return TimeValueChunk(np.concatenate([c.timestamps for c in chunks]),
+                              np.concatenate([c.values for c in chunks]))
+    else:
+        return np.concatenate(chunks)
+
+
+class WindowToChunksObservable(Observable):
+    """ Emits each item of the left observable together with the items of the right observable that fall into its
+    window, i.e. that are neither lower nor higher than the left item. Unlike `window`, no inner observable is
+    created, the window is collected and emitted as a whole.
+
+    If the right observable emits chunks (e.g. NumPy arrays or `TimeValueChunk`), `is_lower` and `is_higher`
+    are evaluated once per chunk and return boolean masks; the window boundaries are the number of lower items at
+    the beginning and the number of higher items at the end of the chunk. A window within a single chunk is a
+    slice of that chunk, the window is None if the right observable completes before sending any chunk.
+    """
+
+    def __init__(self, left: Observable, right: Observable,
+                 is_lower: Callable[[Any, Any], Any],
+                 is_higher: Callable[[Any, Any], Any],
+                 is_chunked: bool = False):
+        """
+        :param left: observable emitting the items that define the windows
+        :param right: observable emitting the items (or chunks) that are collected into the windows
+        :param is_lower: if right is lower than left, right is dropped
+        :param is_higher: if right is higher than left, the window of left is complete
+        :param is_chunked: if True, the right observable emits chunks and the windows are chunks
+        """
+
+        self.left = left
+        self.right = right
+        self.is_lower = is_lower
+        self.is_higher = is_higher
+        self.is_chunked = is_chunked
+
+    def split_item(self, left, right):
+        """ :return: the part of right that is in the window of left and the part of right that is higher than
+        left, `skip` stands for nothing
+        """
+
+        if self.is_lower(left, right):
+            return skip, skip
+        elif self.is_higher(left, right):
+            return skip, right
+        else:
+            return right, skip
+
+    def split_chunk(self, left, right):
+        n = len(right)
+
+        # the right chunk is sorted, the lower items are at the beginning and the higher items at the end
+        start = int(self.is_lower(left, right).sum())
+        end = max(start, n - int(self.is_higher(left, right).sum()))
+
+        # the part is kept even if empty, so that an empty window is an empty chunk
+        tail = right[end:] if end < n else skip
+        return right[start:end], tail
+
+    def unsafe_subscribe(self, observer: Observer, scheduler: Scheduler, subscribe_scheduler: Scheduler):
+        split = self.split_chunk if self.is_chunked else self.split_item
+        lock = config['concurrency'].RLock()
+
+        # the unprocessed left item, right item (or tail of a chunk) and their acknowledgments
+        left_elem = [None]
+        has_left_elem = [False]
+        left_ack = [None]
+        right_elem = [None]
+        has_right_elem = [False]
+        right_ack = [None]
+
+        # items of the current window
+        collected = []
+
+        left_completed = [False]
+        right_completed = [False]
+        is_done = [False]
+
+        def stop_pending():
+            for ack in (left_ack, right_ack):
+                if ack[0] is not None:
+                    ack[0].on_next(stop_ack)
+                    ack[0].on_completed()
+                    ack[0] = None
+
+        def signal_completed(ack=continue_ack):
+            def complete():
+                with lock:
+                    if is_done[0]:
+                        return
+                    is_done[0] = True
+
+                stop_pending()
+                observer.on_completed()
+
+            if isinstance(ack, Continue) or isinstance(ack, Stop):
+                complete()
+            else:
+                ack.on_complete(lambda _: complete(), on_error=lambda err: complete())
+
+        def emit_window(left):
+            if self.is_chunked:
+                window = concat_chunks(collected) if collected else None
+            else:
+                window = list(collected)
+            collected.clear()
+
+            return observer.on_next((left, window))
+
+        def finish():
+            """ the right observable is completed and processed, the window of the current left item is the last
+            """
+
+            if has_left_elem[0]:
+                has_left_elem[0] = False
+                ack = emit_window(left_elem[0])
+            else:
+                ack = continue_ack
+
+            signal_completed(ack)
+
+        def process():
+            """ processes the current left and right item; either the right item is consumed, or the window of
+            the left item is complete and the left item is consumed
+
+            :return: True if the right item is consumed, and the acknowledgment for the consumed item
+            """
+
+            left = left_elem[0]
+            part, tail = split(left, right_elem[0])
+
+            if part is not skip:
+                collected.append(part)
+
+            if tail is skip:
+                with lock:
+                    has_right_elem[0] = False
+                    right_elem[0] = None
+                return True, continue_ack
+
+            right_elem[0] = tail
+            ack = emit_window(left)
+
+            with lock:
+                has_left_elem[0] = False
+                left_elem[0] = None
+            return False, ack
+
+        def on_next_left(left):
+            if is_done[0]:
+                return stop_ack
+
+            with lock:
+                left_elem[0] = left
+                has_left_elem[0] = True
+                if not has_right_elem[0]:
+                    left_ack[0] = Ack()
+                    return left_ack[0]
+
+            is_right_consumed, ack = process()
+
+            if is_right_consumed:
+                # the right item is requested next, the left item waits for the next right item
+                with lock:
+                    own_ack = left_ack[0] = Ack()
+                    other_ack = right_ack[0]
+                    right_ack[0] = None
+                    is_finished = right_completed[0]
+
+                other_ack.on_next(continue_ack)
+                other_ack.on_completed()
+
+                if is_finished:
+                    finish()
+                return own_ack
+
+            return ack
+
+        def on_next_right(right):
+            if is_done[0]:
+                return stop_ack
+
+            with lock:
+                right_elem[0] = right
+                has_right_elem[0] = True
+                if not has_left_elem[0]:
+                    right_ack[0] = Ack()
+                    return right_ack[0]
+
+            is_right_consumed, ack = process()
+
+            if is_right_consumed:
+                return ack
+
+            # the window is complete, the left item is requested next and the right item waits for it
+            with lock:
+                own_ack = right_ack[0] = Ack()
+                other_ack = left_ack[0]
+                left_ack[0] = None
+                is_finished = left_completed[0]
+
+            if is_finished:
+                signal_completed(ack)
+            else:
+                ack.connect_ack(other_ack)
+            return own_ack
+
+        class LeftObserver(Observer):
+            def on_next(self, v):
+                return on_next_left(v)
+
+            def on_error(self, exc):
+                on_error(exc)
+
+            def on_completed(self):
+                with lock:
+                    left_completed[0] = True
+                    is_finished = not has_left_elem[0]
+
+                if is_finished:
+                    signal_completed()
+
+        class RightObserver(Observer):
+            def on_next(self, v):
+                return on_next_right(v)
+
+            def on_error(self, exc):
+                on_error(exc)
+
+            def on_completed(self):
+                with lock:
+                    right_completed[0] = True
+                    is_finished = not has_right_elem[0]
+
+                if is_finished:
+                    finish()
+
+        def on_error(exc):
+            with lock:
+                if is_done[0]:
+                    return
+                is_done[0] = True
+
+            stop_pending()
+            observer.on_error(exc)
+
+        d1 = self.left.unsafe_subscribe(LeftObserver(), scheduler, subscribe_scheduler)
+        d2 = self.right.unsafe_subscribe(RightObserver(), scheduler, subscribe_scheduler)
+
+        return CompositeDisposable(d1, d2)
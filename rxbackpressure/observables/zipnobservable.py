@@ -0,0 +1,184 @@
+from typing import Callable, Any, List
+
+from rx import config
+from rx.disposables import CompositeDisposable
+
+from rxbackpressure.ack import Continue, Stop, Ack, stop_ack, continue_ack
+from rxbackpressure.internal.nolock import no_lock
+from rxbackpressure.observable import Observable
+from rxbackpressure.observer import Observer
+
+
+class ZipNObservable(Observable):
+    """ Zips the items of any number of observables. Unlike nested `Zip2Observable`, the items of all inputs are
+    zipped under a single lock by a single selector call per zipped item.
+    """
+
+    def __init__(self, sources: List[Observable], selector: Callable[..., Any] = None):
+        """
+        :param sources: the observables to zip
+        :param selector: (optional) function that takes an item of each input, by default the items are zipped
+        into a tuple
+        """
+
+        self.sources = sources
+        self.selector = selector
+
+        self.lock = config['concurrency'].RLock()
+
+    def unsafe_subscribe(self, observer, scheduler, subscribe_scheduler):
+        lock = no_lock if scheduler.is_single_threaded else self.lock
+        selector = self.selector
+        n_sources = len(self.sources)
+
+        is_done = [False]
+        last_ack = [continue_ack]
+
+        # items received by each input that are not zipped yet
+        elems = [None] * n_sources
+        is_batch = [False] * n_sources
+
+        # acknowledgment returned to an input that waits for the other inputs
+        wait_acks = [None] * n_sources
+
+        # an input has completed, but some of its items are not zipped yet
+        complete_with_next = [False] * n_sources
+
+        def raw_on_next():
+            n = min(len(e) for e in elems)
+
+            try:
+                if selector is None:
+                    zipped = list(zip(*elems))
+                else:
+                    zipped = [selector(*values) for values in zip(*elems)]
+            except Exception as ex:
+                is_done[0] = True
+                observer.on_error(ex)
+                return stop_ack
+
+            for i in range(n_sources):
+                elems[i] = elems[i][n:] or None
+
+            if any(is_batch):
+                return observer.on_next_batch(zipped)
+            else:
+                return observer.on_next(zipped[0])
+
+        def signal_on_next(idx: int):
+            """ zips the items of all inputs and returns the acknowledgment of input `idx`
+            """
+
+            if isinstance(last_ack[0], Stop):
+                return stop_ack
+
+            ack = raw_on_next()
+            last_ack[0] = ack
+
+            if isinstance(ack, Stop):
+                is_done[0] = True
+                signal_wait_acks(stop_ack)
+                return stop_ack
+
+            # the other inputs whose items are zipped receive the next items after the acknowledgment
+            for i in range(n_sources):
+                if i != idx and elems[i] is None:
+                    wait_ack = wait_acks[i]
+                    wait_acks[i] = None
+                    ack.connect_ack(wait_ack)
+
+            is_completed = any(complete_with_next[i] and elems[i] is None for i in range(n_sources))
+            if is_completed:
+                signal_on_complete()
+
+            if elems[idx] is None:
+                return ack
+            elif is_completed:
+                return stop_ack
+            else:
+                # the remaining items are zipped with the next items of the other inputs
+                wait_ack = Ack()
+                wait_acks[idx] = wait_ack
+                return wait_ack
+
+        def signal_wait_acks(ack: Ack):
+            for idx in range(n_sources):
+                wait_ack = wait_acks[idx]
+                if wait_ack is not None:
+                    wait_acks[idx] = None
+                    ack.connect_ack(wait_ack)
+
+        def signal_on_error(ex):
+            with lock:
+                if not is_done[0]:
+                    is_done[0] = True
+                    observer.on_error(ex)
+                    last_ack[0] = stop_ack
+                    signal_wait_acks(stop_ack)
+
+        def signal_on_complete():
+            def raw_on_completed():
+                if not is_done[0]:
+                    is_done[0] = True
+                    observer.on_completed()
+
+            with lock:
+                if isinstance(last_ack[0], Continue):
+                    raw_on_completed()
+                elif isinstance(last_ack[0], Stop):
+                    pass
+                else:
+                    def _(v):
+                        if isinstance(v, Continue):
+                            with lock:
+                                raw_on_completed()
+
+                    last_ack[0].on_complete(_, scheduler=scheduler)
+
+                last_ack[0] = stop_ack
+                signal_wait_acks(stop_ack)
+
+        def on_next(idx: int, items, batch: bool):
+            with lock:
+                if is_done[0]:
+                    return stop_ack
+
+                elems[idx] = items
+                is_batch[idx] = batch
+
+                if None in elems:
+                    wait_ack = Ack()
+                    wait_acks[idx] = wait_ack
+                    return wait_ack
+                else:
+                    return signal_on_next(idx)
+
+        def on_completed(idx: int):
+            with lock:
+                if is_done[0]:
+                    return
+
+                if elems[idx] is None:
+                    signal_on_complete()
+                else:
+                    complete_with_next[idx] = True
+
+        class ZipObserver(Observer):
+            def __init__(self, idx: int):
+                self.idx = idx
+
+            def on_next(self, elem):
+                return on_next(self.idx, [elem], False)
+
+            def on_next_batch(self, items):
+                return on_next(self.idx, list(items), True)
+
+            def on_error(self, ex):
+                signal_on_error(ex)
+
+            def on_completed(self):
+                on_completed(self.idx)
+
+        disposables = [source.unsafe_subscribe(ZipObserver(idx), scheduler, subscribe_scheduler)
+                       for idx, source in enumerate(self.sources)]
+        return CompositeDisposable([d for d in disposables if d is not None])
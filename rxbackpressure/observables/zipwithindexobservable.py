@@ -3,6 +3,7 @@ from typing import Callable, Any
 from rx.concurrency.schedulerbase import SchedulerBase
 
 from rxbackpressure.observable import Observable
+from rxbackpressure.observables.fusedobservable import map_stage, FusedObservable
 from rxbackpressure.observer import Observer
 
 
@@ -11,24 +12,18 @@ class ZipWithIndexObservable(Observable):
         self.source = source
         self.func = (lambda v, i: (v, i)) if selector is None else selector
 
-    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
-                         subscribe_scheduler: SchedulerBase):
+    def create_stage(self):
         count = [0]
 
-        def on_next(v):
+        def stage(v):
             result = self.func(v, count[0])
             count[0] += 1
-            return observer.on_next(result)
-
-        class ZipCountObserver(Observer):
-            def on_next(self, v):
-                return on_next(v)
+            return result
 
-            def on_error(self, exc):
-                return observer.on_error(exc)
+        return map_stage, stage
 
-            def on_completed(self):
-                return observer.on_completed()
-
-        map_observer = ZipCountObserver()
-        self.source.unsafe_subscribe(map_observer, scheduler, subscribe_scheduler)
\ No newline at end of file
+    def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase,
+                         subscribe_scheduler: SchedulerBase):
+        # the observer is built from the stage, also if map_count is not fused with other operators
+        fused = FusedObservable(self.source, [self])
+        return fused.unsafe_subscribe(observer, scheduler, subscribe_scheduler)
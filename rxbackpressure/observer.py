@@ -1,9 +1,51 @@
+from typing import Iterator, Any, List
+
+from rxbackpressure.ack import Ack, Continue, Stop, continue_ack
+
+
 class Observer:
     def on_next(self, v):
         raise NotImplementedError
 
+    def on_next_batch(self, items: List[Any]) -> Ack:
+        """ Sends a batch of items and returns a single acknowledgment for the whole batch. Observers that only
+        implement `on_next` receive the items one by one.
+
+        :param items: a non-empty list of items
+        """
+
+        return unbatch(self, iter(items))
+
     def on_error(self, err):
         raise NotImplementedError
 
     def on_completed(self):
         raise NotImplementedError
+
+
+def unbatch(observer: Observer, iterator: Iterator) -> Ack:
+    """ Sends the items of a batch one by one to `on_next`, the next item is sent after the acknowledgment of the
+    previous one
+    """
+
+    for item in iterator:
+        ack = observer.on_next(item)
+
+        if isinstance(ack, Continue):
+            continue
+        elif isinstance(ack, Stop):
+            return ack
+        else:
+            batch_ack = Ack()
+
+            def on_next(v):
+                if isinstance(v, Continue):
+                    unbatch(observer, iterator).connect_ack(batch_ack)
+                else:
+                    batch_ack.on_next(v)
+                    batch_ack.on_completed()
+
+            ack.on_complete(on_next, on_error=batch_ack.on_error)
+            return batch_ack
+
+    return continue_ack
@@ -2,16 +2,23 @@ from rxbackpressure.observer import Observer
 
 
 class AnonymousObserver(Observer):
-    def __init__(self, on_next, on_error, on_completed):
+    def __init__(self, on_next, on_error, on_completed, on_next_batch=None):
         self._on_next = on_next
         self._on_error = on_error
         self._on_completed = on_completed
+        self._on_next_batch = on_next_batch
 
     def on_next(self, value):
         return self._on_next(value)
 
+    def on_next_batch(self, items):
+        if self._on_next_batch is None:
+            return super().on_next_batch(items)
+        else:
+            return self._on_next_batch(items)
+
     def on_error(self, error):
         return self._on_error(error)
 
     def on_completed(self):
-        return self._on_completed()
+        return self._on_completed()
\ No newline at end of file
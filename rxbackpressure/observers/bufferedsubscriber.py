@@ -1,190 +1,394 @@
-from optparse import Option
-from queue import Queue
+import sys
+from collections import deque
+from typing import Callable, Any
 
 from rx import config
 
-from rxbackpressure.ack import Stop, Continue, Ack, continue_ack
+from rxbackpressure.ack import Stop, Continue, Ack, continue_ack, stop_ack
 from rxbackpressure.observer import Observer
+from rxbackpressure.overflowstrategy import OverflowStrategy, BackPressure, DropNew, DropOld, KeepLatest, \
+    BufferOverflowException
 from rxbackpressure.scheduler import SchedulerBase
 
 
 class BufferedSubscriber(Observer):
-    def __init__(self, observer: Observer, scheduler: SchedulerBase, buffer_size: int):
+    """ Buffers the items of a producer that does not respect back-pressure (e.g. an rx observable) and sends them
+    to the observer on a scheduler. The items that are buffered when the consumer runs are drained as one batch.
+
+    The buffer level counts the items (or their estimated bytes) that are received but not yet acknowledged by the
+    observer. Producers that can be throttled are paused once the level reaches the high watermark and resumed
+    once it drops to the low watermark.
+    """
+
+    def __init__(self, observer: Observer, scheduler: SchedulerBase, buffer_size: int = None,
+                 overflow_strategy: OverflowStrategy = None, max_bytes: int = None,
+                 size_of: Callable[[Any], int] = None, pause: Callable[[], None] = None,
+                 resume: Callable[[], None] = None, high_watermark: int = None, low_watermark: int = None):
+        """
+        :param observer: downstream observer
+        :param scheduler: scheduler on which the observer receives the items
+        :param buffer_size: (optional) number of buffered items after which the overflow strategy applies
+        :param overflow_strategy: (optional) what to do with new items once the buffer is full, by default the
+        producer is back-pressured
+        :param max_bytes: (optional) estimated number of buffered bytes after which the overflow strategy applies
+        :param size_of: (optional) function that estimates the size of an item, by default `sys.getsizeof`
+        :param pause: (optional) called once the buffer level reaches the high watermark, usually on the producer
+        thread
+        :param resume: (optional) called once the buffer level drops to the low watermark, usually on the scheduler;
+        `pause` and `resume` are called alternately and never concurrently, they are called outside of the lock and
+        may push items, but should return quickly as they hold up the calling thread
+        :param high_watermark: (optional) in bytes if `max_bytes` is set, otherwise in items; by default the buffer
+        size
+        :param low_watermark: (optional) by default half of the high watermark
+        """
+
+        assert buffer_size is not None or max_bytes is not None, 'either buffer size or max bytes must be set'
+        assert (pause is None) == (resume is None), 'pause and resume must be set together'
+
         self.observer = observer
         self.scheduler = scheduler
-        self.em = scheduler.get_execution_model()
+        self.em = scheduler.get_execution_model().create_loop_state()
         self.buffer_size = buffer_size
+        self.overflow_strategy = overflow_strategy or BackPressure()
+        self.max_bytes = max_bytes
+        self.size_of = size_of or sys.getsizeof
+
+        self.pause = pause
+        self.resume = resume
+        self.high_watermark = high_watermark or (max_bytes if max_bytes is not None else buffer_size)
+        self.low_watermark = self.high_watermark // 2 if low_watermark is None else low_watermark
+        self.is_paused = False
+
+        # state of the producer as last signaled by a callback, and whether a thread is invoking a callback
+        self.producer_is_paused = False
+        self.is_signaling = False
 
-        self.queue = Queue()
+        # the queue is only shared by a single producer and the consumer; deque appends and pops are thread-safe
+        self.queue = deque()
 
-        self.last_iteration_ack = None
+        # received items and bytes, only updated by the producer
+        self.items_in = 0
+        self.bytes_in = 0
 
+        # acknowledged items and bytes, only updated by the consumer
+        self.items_out = 0
+        self.bytes_out = 0
+
+        self.is_running = False
         self.upstream_is_complete = False
         self.downstream_is_complete = False
 
-        self.items_to_push = 0
         self.back_pressured = None
         self.error_thrown = None
 
         self.lock = config['concurrency'].RLock()
 
-    def push_on_next(self, elem, last_to_push: int = None):
-        if self.upstream_is_complete or self.downstream_is_complete:
-            return Stop()
+    class Batch:
+        """ A queue entry holding a batch of items that is sent with a single `on_next_batch` call
+        """
+
+        def __init__(self, items):
+            self.items = items
+
+    @staticmethod
+    def entry_size(entry) -> int:
+        if isinstance(entry, BufferedSubscriber.Batch):
+            return len(entry.items)
         else:
-            if last_to_push is None:
-                with self.lock:
-                    to_push =  self.items_to_push
-                    self.items_to_push += 1
-            else:
-                to_push = last_to_push
+            return 1
+
+    def entry_bytes(self, entry) -> int:
+        if self.max_bytes is None:
+            return 0
+        elif isinstance(entry, BufferedSubscriber.Batch):
+            return sum(self.size_of(v) for v in entry.items)
+        else:
+            return self.size_of(entry)
+
+    def level(self) -> int:
+        """ number of items or bytes received but not yet acknowledged
+        """
+
+        if self.max_bytes is None:
+            return self.items_in - self.items_out
+        else:
+            return self.bytes_in - self.bytes_out
+
+    def is_full(self) -> bool:
+        return (self.buffer_size is not None and self.buffer_size <= self.items_in - self.items_out) or \
+               (self.max_bytes is not None and self.max_bytes <= self.bytes_in - self.bytes_out)
+
+    def append(self, entry, n_items: int, n_bytes: int):
+        self.queue.append(entry)
+        self.items_in += n_items
+        self.bytes_in += n_bytes
+
+    def drop_first(self):
+        """ drops the oldest entry in the queue
+        """
+
+        try:
+            entry = self.queue.popleft()
+        except IndexError:
+            # the consumer has taken the entry in the meantime
+            return
+
+        n_items = self.entry_size(entry)
+        self.items_in -= n_items
+        self.bytes_in -= self.entry_bytes(entry)
+        self.overflow_strategy.dropped += n_items
 
-            if self.back_pressured is None:
-                if to_push < self.buffer_size:
-                    self.queue.put(item=elem)
-                    self.push_to_consumer(to_push)
-                    return continue_ack
+    def check_pause(self):
+        """ pauses the producer once the buffer level reaches the high watermark
+        """
+
+        with self.lock:
+            if self.is_paused or self.level() < self.high_watermark:
+                return
+
+            self.is_paused = True
+
+            # the consumer could have drained the buffer without seeing the flag
+            if self.level() <= self.low_watermark:
+                self.is_paused = False
+                return
+
+        self.signal_producer()
+
+    def check_resume(self):
+        """ resumes the producer once the buffer level drops to the low watermark
+        """
+
+        with self.lock:
+            if not self.is_paused or self.low_watermark < self.level():
+                return
+
+            self.is_paused = False
+
+        self.signal_producer()
+
+    def signal_producer(self):
+        """ invokes `pause` or `resume` until the producer is in the state given by the `is_paused` flag
+
+        The flag is flipped under the lock, whereas the callbacks are invoked after releasing it. Only one thread at a
+        time invokes the callbacks; a state change requested in the meantime is signaled by that thread once the
+        running callback returns, so that a pause can not overtake the resume of a concurrently draining consumer.
+        """
+
+        while True:
+            with self.lock:
+                if self.is_signaling or self.is_paused == self.producer_is_paused:
+                    return
+
+                self.is_signaling = True
+                is_paused = self.is_paused
+                self.producer_is_paused = is_paused
+
+            try:
+                if is_paused:
+                    self.pause()
                 else:
-                    ack = Ack()
-                    with self.lock:
-                        self.back_pressured = ack
-                    self.queue.put(item=elem)
-                    self.push_to_consumer(to_push)
-                    return ack
-            else:
-                self.queue.put(item=elem)
-                self.push_to_consumer(to_push)
-                return self.back_pressured
+                    self.resume()
+            finally:
+                with self.lock:
+                    self.is_signaling = False
+
+    def push_on_next(self, elem):
+        if self.upstream_is_complete or self.downstream_is_complete:
+            return stop_ack
+
+        strategy = self.overflow_strategy
+        n_items = self.entry_size(elem)
+        n_bytes = self.entry_bytes(elem)
+        ack = continue_ack
+
+        if not self.is_full():
+            self.append(elem, n_items, n_bytes)
+        elif isinstance(strategy, BackPressure):
+            with self.lock:
+                if self.back_pressured is None:
+                    self.back_pressured = Ack()
+                ack = self.back_pressured
+            self.append(elem, n_items, n_bytes)
+        elif isinstance(strategy, DropNew):
+            strategy.dropped += n_items
+            return continue_ack
+        elif isinstance(strategy, DropOld):
+            while self.queue and self.is_full():
+                self.drop_first()
+
+            if self.is_full():
+                # the buffer is filled by items that are sent but not yet acknowledged, they can not be dropped
+                strategy.dropped += n_items
+                return continue_ack
+
+            self.append(elem, n_items, n_bytes)
+        elif isinstance(strategy, KeepLatest):
+            for _ in range(len(self.queue)):
+                self.drop_first()
+            self.append(elem, n_items, n_bytes)
+        else:
+            for _ in range(len(self.queue)):
+                self.drop_first()
+            strategy.dropped += n_items
+            self.push_complete(BufferOverflowException('buffer size exceeded'))
+            return stop_ack
+
+        # the unlocked check only skips the lock, the decision is taken under the lock
+        if self.pause is not None and not self.is_paused and self.high_watermark <= self.level():
+            self.check_pause()
+
+        self.schedule_consumer()
+        return ack
 
     def on_next(self, v):
-        return self.push_on_next(v, None)
+        return self.push_on_next(v)
+
+    def on_next_batch(self, items):
+        return self.push_on_next(self.Batch(items))
 
-    def push_complete(self, ex=None, to_push: int = None):
+    def push_complete(self, ex=None):
         if not self.upstream_is_complete and not self.downstream_is_complete:
             self.error_thrown = ex
             self.upstream_is_complete = True
-            if to_push is None:
-                with self.lock:
-                    nr = self.items_to_push
-                    self.items_to_push += 1
-            else:
-                nr = to_push
-
-            self.push_to_consumer(nr)
+            self.schedule_consumer()
 
     def on_error(self, ex):
-        self.push_complete(ex, None)
+        self.push_complete(ex)
 
     def on_completed(self):
-        self.push_complete(None, None)
+        self.push_complete(None)
 
-    def push_to_consumer(self, current_nr: int):
-        if current_nr == 0:
-            def action(_, __):
-                self.consumer_run_loop()
+    def schedule_consumer(self):
+        if self.is_running:
+            return
 
-            self.scheduler.schedule(action)
+        with self.lock:
+            if self.is_running:
+                return
+            self.is_running = True
 
-    def consumer_run_loop(self):
-        def signal_next(next):
-            try:
-                ack = self.observer.on_next(next)
-                return ack
-            except:
-                raise NotImplementedError
+        def action(_, __):
+            self.consumer_run_loop()
 
-        def signal_complete():
-            try:
-                self.observer.on_completed()
-            except:
-                raise NotImplementedError
+        self.scheduler.schedule(action)
+
+    def pop_items(self):
+        """ takes the entries from the queue and returns their items, at most the recommended batch size of the
+        execution model; the remainder of a batch exceeding the limit is put back to the front of the queue
+        """
 
-        def signal_error(ex):
+        queue = self.queue
+        max_items = self.em.recommended_batch_size
+        items = []
+        while len(items) < max_items:
             try:
-                self.observer.on_error(ex)
-            except:
-                raise NotImplementedError
-
-        def go_async(next, next_size: int, ack: Ack, processed: int):
-            def on_next(v):
-                if isinstance(v, Continue):
-                    next_ack = signal_next(next)
-                    is_sync = isinstance(ack, Continue) or isinstance(ack, Stop)
-                    next_frame = self.em.next_frame_index(0) if is_sync else 0
-                    fast_loop(next_ack, processed+next_size, next_frame)
-                elif isinstance(v, Stop):
-                    self.downstream_is_complete = True
+                entry = queue.popleft()
+            except IndexError:
+                break
+
+            if isinstance(entry, BufferedSubscriber.Batch):
+                n_free = max_items - len(items)
+                if n_free < len(entry.items):
+                    batch = list(entry.items)
+                    items.extend(batch[:n_free])
+                    queue.appendleft(BufferedSubscriber.Batch(batch[n_free:]))
+                    break
+
+                items.extend(entry.items)
+            else:
+                items.append(entry)
+        return items
 
-            ack.observe_on(self.scheduler).subscribe(on_next=on_next)
-
-        def fast_loop(prev_ack: Ack, last_processed:int, start_index: int):
-            def stop_streaming():
-                self.downstream_is_complete = True
-                pass
-
-            ack = continue_ack if prev_ack is None else prev_ack
-            is_first_iteration = isinstance(ack, Continue)
-            processed = last_processed
-            next_index = start_index
-
-            while not self.downstream_is_complete:
-                # fetch next
-                try:
-                    next = self.queue.get(block=False)
-                    has_next = True
-                except:
-                    has_next = False
-                # fetch size
-                next_size = 1
-
-                if has_next:
-                    if next_index > 0 or is_first_iteration:
-                        is_first_iteration = False
-
-                        if isinstance(ack, Continue):
-                            ack = signal_next(next)
-                            if isinstance(ack, Stop):
-                                self.downstream_is_complete = True
-                                return
-                            else:
-                                is_sync = isinstance(ack, Continue)
-                                next_index = self.em.next_frame_index(next_index) if is_sync else 0
-                                processed += next_size
-                        elif isinstance(ack, Stop):
-                            stop_streaming()
-                            return
-                        else:
-                            go_async(next, next_size, ack, processed)
-                            return
-                    else:
-                        go_async(next, next_size, ack, processed)
-                        return
-                elif self.upstream_is_complete:
-                    stop_streaming()
-                    with self.lock:
-                        self.items_to_push -= (processed + 1)
+    def signal_next(self, items):
+        if len(items) == 1:
+            return self.observer.on_next(items[0])
+        else:
+            return self.observer.on_next_batch(items)
+
+    def acknowledge(self, items):
+        """ removes the acknowledged items from the buffer level and resumes the producer if necessary
+        """
+
+        self.items_out += len(items)
+        if self.max_bytes is not None:
+            self.bytes_out += sum(self.size_of(v) for v in items)
+
+        if self.is_paused:
+            self.check_resume()
 
+    def stop_streaming(self):
+        self.downstream_is_complete = True
+        self.queue.clear()
+
+        with self.lock:
+            bp = self.back_pressured
+            self.back_pressured = None
+
+        if bp is not None:
+            bp.on_next(stop_ack)
+            bp.on_completed()
+
+    def consumer_run_loop(self):
+        frame_index = self.em.next_frame_index(0)
+
+        while not self.downstream_is_complete:
+            items = self.pop_items()
+
+            if not items:
+                if self.upstream_is_complete:
+                    # an item could have been pushed just before the completion
+                    if self.queue:
+                        continue
+
+                    self.downstream_is_complete = True
                     if self.error_thrown is None:
-                        signal_complete()
+                        self.observer.on_completed()
                     else:
-                        signal_error(self.error_thrown)
+                        self.observer.on_error(self.error_thrown)
                     return
-                else:
-                    self.last_iteration_ack = ack
-                    with self.lock:
-                        self.items_to_push -= 1
-                        remaining = self.items_to_push
-                    processed = 0
 
-                    if remaining == 0:
-                        with self.lock:
-                            bp = self.back_pressured
-                            self.back_pressured = None
-                        if bp is not None:
-                            bp.on_next(continue_ack)
-                            bp.on_completed()
-                        return
+                with self.lock:
+                    if self.queue:
+                        continue
+                    self.is_running = False
+                    bp = self.back_pressured
+                    self.back_pressured = None
+
+                if bp is not None:
+                    bp.on_next(continue_ack)
+                    bp.on_completed()
+
+                # the producer could have pushed an item before the consumer stopped running
+                if self.queue or self.upstream_is_complete:
+                    self.schedule_consumer()
+                return
+
+            ack = self.signal_next(items)
+
+            if isinstance(ack, Continue):
+                self.acknowledge(items)
+                frame_index = self.em.next_frame_index(frame_index)
 
-        fast_loop(prev_ack=self.last_iteration_ack, last_processed=0, start_index=0)
+                if frame_index == 0:
+                    def action(_, __):
+                        self.consumer_run_loop()
+
+                    self.scheduler.schedule(action)
+                    return
+            elif isinstance(ack, Stop):
+                self.stop_streaming()
+                return
+            else:
+                def on_next(v, items=items):
+                    if isinstance(v, Continue):
+                        self.acknowledge(items)
+                        self.consumer_run_loop()
+                    else:
+                        self.stop_streaming()
 
+                def on_error(err):
+                    self.stop_streaming()
 
+                ack.on_complete(on_next, scheduler=self.scheduler, on_error=on_error)
+                return
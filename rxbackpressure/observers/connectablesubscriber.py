@@ -1,7 +1,6 @@
-from queue import Queue
+import itertools
 from typing import Iterable
 
-import rx
 from rx import config
 
 from rxbackpressure.ack import Ack, Continue, Stop
@@ -24,7 +23,10 @@ class ConnectableSubscriber(Observer):
         self.scheduled_done = False
         self.schedule_error = None
         self.was_canceled = False
-        self.queue = Queue()
+
+        # the items pushed before connecting; a pushed iterable (e.g. a snapshot of a replay buffer) is kept as it
+        # is and iterated when connecting, instead of being copied item by item
+        self.first_items = []
         self.lock = config['concurrency'].RLock()
 
     def connect(self):
@@ -39,7 +41,7 @@ class ConnectableSubscriber(Observer):
                         self.root_ack.on_next(Continue())
                         self.root_ack.on_completed()
                         source.is_connected = True
-                        source.queue = None
+                        source.first_items = None
                         # source.connected_ack = None
                         # todo: fill in
                     elif isinstance(v, Stop):
@@ -47,7 +49,7 @@ class ConnectableSubscriber(Observer):
                     else:
                         raise NotImplementedError
 
-                buffer_was_drained.subscribe(on_next=on_next)
+                buffer_was_drained.on_complete(on_next)
 
                 source = self
 
@@ -64,7 +66,7 @@ class ConnectableSubscriber(Observer):
                                 buffer_was_drained.on_next(v)
                                 buffer_was_drained.on_completed()
 
-                        ack.subscribe(on_next=on_next)
+                        ack.on_complete(on_next)
 
                         return ack
 
@@ -82,17 +84,13 @@ class ConnectableSubscriber(Observer):
                                         buffer_was_drained.on_next(Continue())
                                         buffer_was_drained.on_completed()
 
-                                self.ack.subscribe(on_next)
+                                self.ack.on_complete(on_next)
                         elif source.schedule_error is not None:
                             raise NotImplementedError
                         else:
                             source.underlying.on_completed()
 
-                class EmptyObject:
-                    pass
-
-                self.queue.put(EmptyObject)
-                disposable = IteratorAsObservable(iter(self.queue.get, EmptyObject)) \
+                disposable = IteratorAsObservable(itertools.chain.from_iterable(self.first_items)) \
                     .subscribe(CustomObserver(), self.scheduler, CurrentThreadScheduler())
 
                 self.connected_ref = buffer_was_drained, disposable
@@ -104,7 +102,7 @@ class ConnectableSubscriber(Observer):
                 throw_exception = True
             elif not self.scheduled_done:
                 throw_exception = False
-                self.queue.put(elem, block=False)
+                self.first_items.append((elem,))
             else:
                 throw_exception = False
 
@@ -117,8 +115,7 @@ class ConnectableSubscriber(Observer):
                 throw_exception = True
             elif not self.scheduled_done:
                 throw_exception = False
-                for elem in cs:
-                    self.queue.put(elem, block=False)
+                self.first_items.append(cs)
             else:
                 throw_exception = False
 
@@ -154,23 +151,19 @@ class ConnectableSubscriber(Observer):
 
     def on_next(self, elem):
         if not self.is_connected:
-            def __(v, _):
+            new_ack = Ack()
+
+            def __(v):
                 if isinstance(v, Continue):
                     ack = self.underlying.on_next(elem)
-                    if isinstance(ack, Continue):
-                        return rx.Observable.just(ack)
-                    elif isinstance(ack, Stop):
+                    if isinstance(ack, Stop):
                         raise NotImplementedError
-                    else:
-                        return ack
+                    ack.connect_ack(new_ack)
                 else:
-                    return Stop()
+                    new_ack.on_next(Stop())
+                    new_ack.on_completed()
 
-            new_ack = Ack()
-            self.connected_ack \
-                .observe_on(self.scheduler) \
-                .flat_map(__) \
-                .subscribe(new_ack)
+            self.connected_ack.on_complete(__, scheduler=self.scheduler, on_error=new_ack.on_error)
             self.connected_ack = new_ack
             return self.connected_ack
         elif not self.was_canceled:
@@ -183,12 +176,10 @@ class ConnectableSubscriber(Observer):
         def on_next(v):
             if isinstance(v, Continue):
                 self.underlying.on_error(err)
-        self.connected_ack.observe_on(self.scheduler) \
-            .subscribe(on_next=on_next)
+        self.connected_ack.on_complete(on_next, scheduler=self.scheduler)
 
     def on_completed(self):
         def on_next(v):
             if isinstance(v, Continue):
                 self.underlying.on_completed()
-        self.connected_ack.observe_on(self.scheduler) \
-            .subscribe(on_next=on_next)
+        self.connected_ack.on_complete(on_next, scheduler=self.scheduler)
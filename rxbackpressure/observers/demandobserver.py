@@ -0,0 +1,111 @@
+from rx import config
+
+from rxbackpressure.ack import Ack, stop_ack, continue_ack
+from rxbackpressure.observer import Observer
+from rxbackpressure.subscriber import Subscriber, Subscription
+
+
+class DemandObserver(Observer, Subscription):
+    """ Adapter between an acknowledgment based source and a subscriber in demand mode. Each item is acknowledged
+    synchronously as long as the subscriber has outstanding demand; otherwise the source is back-pressured until
+    the subscriber requests more items.
+    """
+
+    def __init__(self, subscriber: Subscriber):
+        self.subscriber = subscriber
+
+        self.demand = 0
+        self.is_cancelled = False
+
+        # acknowledgment returned to the source once the demand is exhausted
+        self.back_pressured = None
+
+        # an item received without demand, and a completion received after it
+        self.pending = None
+        self.pending_complete = None
+
+        self.lock = config['concurrency'].RLock()
+
+        subscriber.on_subscribe(self)
+
+    def request(self, n: int):
+        with self.lock:
+            if self.is_cancelled:
+                return
+
+            self.demand += n
+            back_pressured = self.back_pressured
+            self.back_pressured = None
+            pending = self.pending
+
+        if back_pressured is not None:
+            if pending is None:
+                ack = continue_ack
+            else:
+                # send the item that was received before any demand
+                ack = self.on_next(pending[0])
+
+                with self.lock:
+                    self.pending = None
+                    pending_complete = self.pending_complete
+
+                if pending_complete is not None:
+                    self.signal_complete(*pending_complete)
+
+            ack.connect_ack(back_pressured)
+
+    def cancel(self):
+        with self.lock:
+            self.is_cancelled = True
+            back_pressured = self.back_pressured
+            self.back_pressured = None
+
+        if back_pressured is not None:
+            back_pressured.on_next(stop_ack)
+            back_pressured.on_completed()
+
+    def on_next(self, v):
+        with self.lock:
+            if self.is_cancelled:
+                return stop_ack
+            elif self.demand == 0:
+                self.pending = (v,)
+                ack = Ack()
+                self.back_pressured = ack
+                return ack
+
+            self.demand -= 1
+
+        self.subscriber.on_next(v)
+
+        with self.lock:
+            if self.is_cancelled:
+                return stop_ack
+            elif 0 < self.demand:
+                return continue_ack
+            else:
+                ack = Ack()
+                self.back_pressured = ack
+                return ack
+
+    def signal_complete(self, ex: Exception = None):
+        if ex is None:
+            self.subscriber.on_completed()
+        else:
+            self.subscriber.on_error(ex)
+
+    def on_error(self, err):
+        with self.lock:
+            if self.pending is not None:
+                self.pending_complete = (err,)
+                return
+
+        self.signal_complete(err)
+
+    def on_completed(self):
+        with self.lock:
+            if self.pending is not None:
+                self.pending_complete = (None,)
+                return
+
+        self.signal_complete()
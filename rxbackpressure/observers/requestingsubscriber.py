@@ -0,0 +1,137 @@
+from collections import deque
+
+from rx import config
+
+from rxbackpressure.ack import Continue, Stop
+from rxbackpressure.observer import Observer
+from rxbackpressure.scheduler import SchedulerBase
+from rxbackpressure.subscriber import Subscriber, Subscription
+
+
+class RequestingSubscriber(Subscriber):
+    """ Subscriber in demand mode that sends the received items to an acknowledgment based observer on a scheduler.
+
+    Up to `request_size` items are requested in advance. The received items are queued and drained on the
+    scheduler; each time the number of outstanding credits drops to `low_watermark`, the credits are topped up
+    again. Thereby, the producer is not synchronized with the consumer for every single item.
+    """
+
+    def __init__(self, observer: Observer, scheduler: SchedulerBase, request_size: int, low_watermark: int = None):
+        """
+        :param observer: downstream observer
+        :param scheduler: scheduler on which the observer receives the items
+        :param request_size: maximum number of items requested but not yet sent to the observer
+        :param low_watermark: (optional) number of outstanding credits at which new items are requested,
+        by default half of the request size
+        """
+
+        assert 0 < request_size, 'request size must be positive'
+
+        self.observer = observer
+        self.scheduler = scheduler
+        self.em = scheduler.get_execution_model().create_loop_state()
+        self.request_size = request_size
+        self.low_watermark = request_size // 2 if low_watermark is None else low_watermark
+
+        self.subscription = None
+        self.queue = deque()
+
+        # number of requested items that are not yet sent to the observer, only accessed by the drain loop
+        self.outstanding = 0
+
+        self.is_running = False
+        self.upstream_is_complete = False
+        self.downstream_is_complete = False
+        self.error_thrown = None
+
+        self.lock = config['concurrency'].RLock()
+
+    def on_subscribe(self, subscription: Subscription):
+        self.subscription = subscription
+        self.outstanding = self.request_size
+        subscription.request(self.request_size)
+
+    def on_next(self, v):
+        self.queue.append(v)
+        self.schedule_drain()
+
+    def on_error(self, err):
+        self.error_thrown = err
+        self.upstream_is_complete = True
+        self.schedule_drain()
+
+    def on_completed(self):
+        self.upstream_is_complete = True
+        self.schedule_drain()
+
+    def schedule_drain(self):
+        with self.lock:
+            if self.is_running:
+                return
+            self.is_running = True
+
+        def action(_, __):
+            self.drain()
+
+        self.scheduler.schedule(action)
+
+    def stop_streaming(self):
+        self.downstream_is_complete = True
+        self.queue.clear()
+        self.subscription.cancel()
+
+    def drain(self):
+        frame_index = self.em.next_frame_index(0)
+
+        while not self.downstream_is_complete:
+            try:
+                item = self.queue.popleft()
+            except IndexError:
+                if self.upstream_is_complete:
+                    self.downstream_is_complete = True
+                    if self.error_thrown is None:
+                        self.observer.on_completed()
+                    else:
+                        self.observer.on_error(self.error_thrown)
+                    return
+
+                with self.lock:
+                    # an item or a completion could have arrived since the last check
+                    if self.queue or self.upstream_is_complete:
+                        continue
+                    self.is_running = False
+                return
+
+            ack = self.observer.on_next(item)
+
+            self.outstanding -= 1
+            if self.outstanding <= self.low_watermark:
+                n = self.request_size - self.outstanding
+                self.outstanding += n
+                self.subscription.request(n)
+
+            if isinstance(ack, Continue):
+                frame_index = self.em.next_frame_index(frame_index)
+
+                if frame_index == 0:
+                    # give other tasks on the scheduler a chance to run
+                    def action(_, __):
+                        self.drain()
+
+                    self.scheduler.schedule(action)
+                    return
+            elif isinstance(ack, Stop):
+                self.stop_streaming()
+                return
+            else:
+                def on_next(v):
+                    if isinstance(v, Continue):
+                        self.drain()
+                    else:
+                        self.stop_streaming()
+
+                def on_error(err):
+                    self.stop_streaming()
+
+                ack.on_complete(on_next, scheduler=self.scheduler, on_error=on_error)
+                return
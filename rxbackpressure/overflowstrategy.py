@@ -0,0 +1,36 @@
+class BufferOverflowException(Exception):
+    pass
+
+
+class OverflowStrategy:
+    """ Defines what a buffer does with new items once it is full. Lossy strategies count the dropped items in
+    `dropped`; a strategy instance shared by several buffers counts the items dropped by all of them.
+    """
+
+    def __init__(self):
+        self.dropped = 0
+
+
+class BackPressure(OverflowStrategy):
+    """ The producer is back-pressured until the buffer is drained
+    """
+
+
+class DropNew(OverflowStrategy):
+    """ New items are dropped while the buffer is full
+    """
+
+
+class DropOld(OverflowStrategy):
+    """ The oldest item in the buffer is dropped to make room for a new item
+    """
+
+
+class KeepLatest(OverflowStrategy):
+    """ The buffer is cleared and only the new item is kept
+    """
+
+
+class FailFast(OverflowStrategy):
+    """ The buffered items are dropped and the stream terminates with a `BufferOverflowException`
+    """
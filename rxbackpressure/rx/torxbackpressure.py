@@ -1,3 +1,5 @@
+from typing import Callable, Any
+
 import rx
 
 from rx.internal import extensionmethod
@@ -5,16 +7,45 @@ from rx.internal import extensionmethod
 from rxbackpressure.observers.bufferedsubscriber import BufferedSubscriber
 from rxbackpressure.observable import Observable
 from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.overflowstrategy import OverflowStrategy
 
 
 @extensionmethod(rx.Observable, instancemethod=True)
-def to_rxbackpressure(self):
+def to_rxbackpressure(self, buffer_size: int = None, overflow_strategy: OverflowStrategy = None,
+                      max_bytes: int = None, size_of: Callable[[Any], int] = None,
+                      pause: Callable[[], None] = None, resume: Callable[[], None] = None,
+                      high_watermark: int = None, low_watermark: int = None):
+    """ Converts an rx observable into a back-pressured observable by buffering its items
+
+    An rx observable ignores the acknowledgment. A source that can be throttled (e.g. a socket or a file reader)
+    is slowed down by the `pause` and `resume` callbacks instead.
+
+    :param buffer_size: (optional) number of buffered items after which the overflow strategy applies, by default
+    1000 if `max_bytes` is not set
+    :param overflow_strategy: (optional) what to do with new items once the buffer is full; by default the items
+    are back-pressured, but as an rx observable ignores the acknowledgment, the buffer keeps growing
+    :param max_bytes: (optional) estimated number of buffered bytes after which the overflow strategy applies
+    :param size_of: (optional) function that estimates the size of an item, by default `sys.getsizeof`
+    :param pause: (optional) called once the buffer level reaches the high watermark
+    :param resume: (optional) called once the buffer level drops to the low watermark
+    :param high_watermark: (optional) in bytes if `max_bytes` is set, otherwise in items; by default the buffer
+    size
+    :param low_watermark: (optional) by default half of the high watermark
+    :return: back-pressured observable
+    """
+
+    if buffer_size is None and max_bytes is None:
+        buffer_size = 1000
+
     source = self
 
     class ToBackpressureObservable(Observable):
 
         def unsafe_subscribe(self, observer, scheduler, subscribe_scheduler):
-            subscriber = BufferedSubscriber(observer, scheduler, 1000)
+            subscriber = BufferedSubscriber(observer, scheduler, buffer_size=buffer_size,
+                                            overflow_strategy=overflow_strategy, max_bytes=max_bytes,
+                                            size_of=size_of, pause=pause, resume=resume,
+                                            high_watermark=high_watermark, low_watermark=low_watermark)
             disposable = source.subscribe(on_next=subscriber.on_next, on_error=subscriber.on_error,
                                           on_completed=subscriber.on_completed)
             return disposable
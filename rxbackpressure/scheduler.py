@@ -1,12 +1,25 @@
+import time
 from abc import ABC
 
 import rx
 
 
 class ExecutionModel:
+    # maximum number of items that a loop processes at once, e.g. in a single batch
+    recommended_batch_size = 256
+
     def next_frame_index(self, current: int) -> int:
         raise NotImplementedError
 
+    def create_loop_state(self) -> 'ExecutionModel':
+        """ creates the frame counter of a single run loop; execution models that measure the frames return a new
+        object holding the measurement of that loop, the others return themselves
+
+        :return: an object whose `next_frame_index` is called by the run loop
+        """
+
+        return self
+
 
 class BatchedExecution(ExecutionModel):
     def __init__(self, batch_size: int):
@@ -17,6 +30,104 @@ class BatchedExecution(ExecutionModel):
         return (current + 1) & self.batched_execution_modulus
 
 
+class AdaptiveExecution(ExecutionModel):
+    """ Adapts the number of items per frame such that a frame takes about `time_slice` seconds. Cheap items are
+    processed in large frames to amortize the rescheduling, expensive items in small frames so that other streams
+    on the same scheduler are not starved.
+
+    Each run loop measures its own frames in the state returned by `create_loop_state`; a frame starts when
+    `next_frame_index` is called with index 0 and is measured when it ends. Without a loop state, the frames have
+    `min_batch_size` items.
+    """
+
+    def __init__(self, time_slice: float = 0.001, min_batch_size: int = 16, max_batch_size: int = 4096):
+        """
+        :param time_slice: targeted duration of a frame in seconds
+        :param min_batch_size: minimum number of items per frame
+        :param max_batch_size: maximum number of items per frame
+        """
+
+        self.time_slice = time_slice
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+
+    class LoopState(ExecutionModel):
+        """ the frame size and the start of the current frame of a single run loop
+        """
+
+        def __init__(self, config: 'AdaptiveExecution'):
+            self.config = config
+            self.recommended_batch_size = config.min_batch_size
+            self.frame_start = 0.0
+
+        def next_frame_index(self, current: int) -> int:
+            if current == 0:
+                self.frame_start = time.perf_counter()
+                return 1
+
+            if current + 1 < self.recommended_batch_size:
+                return current + 1
+
+            elapsed = time.perf_counter() - self.frame_start
+            config = self.config
+
+            # a frame shorter than half the time slice doubles the frame size, a frame longer than the time slice
+            # halves it
+            if elapsed < config.time_slice / 2:
+                self.recommended_batch_size = min(2 * self.recommended_batch_size, config.max_batch_size)
+            elif config.time_slice < elapsed:
+                self.recommended_batch_size = max(self.recommended_batch_size // 2, config.min_batch_size)
+
+            return 0
+
+        def create_loop_state(self):
+            return self.config.create_loop_state()
+
+    def create_loop_state(self):
+        return self.LoopState(self)
+
+    def next_frame_index(self, current: int) -> int:
+        if current + 1 < self.min_batch_size:
+            return current + 1
+        else:
+            return 0
+
+
+class TimeBudgetExecution(ExecutionModel):
+    """ Ends a frame once it took `time_budget` seconds, such that a loop never blocks a scheduler longer than the
+    budget (plus the duration of a single item).
+
+    The deadline of a frame is the frame index itself, which is why loops running at the same time do not share
+    a frame.
+    """
+
+    def __init__(self, time_budget: float = 0.001):
+        """
+        :param time_budget: maximum duration of a frame in seconds
+        """
+
+        self.time_budget = time_budget
+        self.time_budget_ns = max(1, int(time_budget * 1e9))
+
+    def next_frame_index(self, current: int) -> int:
+        now = time.perf_counter_ns()
+
+        if current == 0:
+            return now + self.time_budget_ns
+        elif current <= now:
+            return 0
+        else:
+            return current
+
+
+class AlwaysAsyncExecution(ExecutionModel):
+    """ Ends a frame after every item, such that the next item is always rescheduled
+    """
+
+    def next_frame_index(self, current: int) -> int:
+        return 0
+
+
 class UncaughtExceptionReport:
     def report_failure(self, exc: Exception):
         raise exc
@@ -29,12 +140,22 @@ class Scheduler(rx.core.Scheduler, ABC):
     def get_execution_model(self) -> ExecutionModel:
         raise NotImplementedError
 
+    @property
+    def is_single_threaded(self) -> bool:
+        """ True if the pipeline running on this scheduler is confined to a single thread, in which case operators
+        replace their locks with no-op locks
+        """
+
+        return False
+
 
 class SchedulerBase(Scheduler):
-    def __init__(self, r: UncaughtExceptionReport = None, execution_model: ExecutionModel = None):
+    def __init__(self, r: UncaughtExceptionReport = None, execution_model: ExecutionModel = None,
+                 single_threaded: bool = False):
         super().__init__()
         self.r = r or UncaughtExceptionReport()
         self.execution_model = execution_model or BatchedExecution(256)
+        self.single_threaded = single_threaded
 
     def report_failure(self, exc: Exception):
         return self.r.report_failure(exc)
@@ -42,4 +163,8 @@ class SchedulerBase(Scheduler):
     def get_execution_model(self) -> ExecutionModel:
         return self.execution_model
 
+    @property
+    def is_single_threaded(self) -> bool:
+        return self.single_threaded
+
 
@@ -5,16 +5,44 @@ from typing import Union, Callable, Any
 
 from rx.core import Disposable
 
-from rxbackpressure.scheduler import SchedulerBase
+from rxbackpressure.scheduler import SchedulerBase, ExecutionModel
+
+
+def is_running_loop(loop: asyncio.AbstractEventLoop):
+    """ :return: True if the calling thread runs the loop
+    """
+
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
 
 
 class AsyncIOScheduler(SchedulerBase, Disposable):
-    def __init__(self, loop: asyncio.AbstractEventLoop = None, new_thread: bool = None):
-        super().__init__()
+    """ Schedules the actions on an asyncio event loop. Actions scheduled from the loop itself are added directly
+    to the loop, actions scheduled from other threads wake up the loop.
+
+    If the loop is not running yet, the scheduler runs it on a new thread; a scheduler created with a running loop,
+    e.g. from a coroutine, attaches to that loop and does not start a thread.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop = None, new_thread: bool = None,
+                 execution_model: ExecutionModel = None):
+        """
+        :param loop: (optional) the event loop, by default a new event loop
+        :param new_thread: (optional) if True, the loop is run on a new thread, if False, the loop is expected to
+        be run by the caller; by default a new thread is only started if the loop is not already running
+        :param execution_model: (optional) defines when the loops running on this scheduler yield to other tasks
+        """
+
+        super().__init__(execution_model=execution_model)
 
         self.loop: asyncio.AbstractEventLoop = loop or asyncio.new_event_loop()
 
-        if new_thread is None or new_thread is True:
+        if new_thread is None:
+            new_thread = not self.loop.is_running()
+
+        if new_thread:
             t = Thread(target=self.start_loop)
             t.setDaemon(True)
             t.start()
@@ -33,12 +61,12 @@ class AsyncIOScheduler(SchedulerBase, Disposable):
         def func():
             action(self, state)
 
-        handle = self.loop.call_soon_threadsafe(func)
-
-        def dispose():
-            handle.cancel()
+        if is_running_loop(self.loop):
+            handle = self.loop.call_soon(func)
+        else:
+            handle = self.loop.call_soon_threadsafe(func)
 
-        return Disposable.create(dispose)
+        return Disposable.create(handle.cancel)
 
     def schedule_relative(self,
                           duetime: Union[int, float],
@@ -47,22 +75,30 @@ class AsyncIOScheduler(SchedulerBase, Disposable):
 
         if isinstance(duetime, datetime.datetime):
             timespan = duetime - datetime.datetime.fromtimestamp(0)
-            timespan = int(timespan.total_seconds())
+            timespan = timespan.total_seconds()
         elif isinstance(duetime, datetime.timedelta):
-            timespan = int(duetime.total_seconds())
+            timespan = duetime.total_seconds()
         else:
             timespan = duetime
 
-        def _():
-            def func():
-                action(self, state)
+        def func():
+            action(self, state)
+
+        if is_running_loop(self.loop):
+            handle = self.loop.call_later(timespan, func)
+            return Disposable.create(handle.cancel)
 
-            self.loop.call_later(timespan, func)
+        timer_handle = [None]
+
+        def _():
+            timer_handle[0] = self.loop.call_later(timespan, func)
 
         handle = self.loop.call_soon_threadsafe(_)
 
         def dispose():
             handle.cancel()
+            if timer_handle[0] is not None:
+                timer_handle[0].cancel()
 
         return Disposable.create(dispose)
 
@@ -1,26 +1,10 @@
-from rx.concurrency import CurrentThreadScheduler as ParentCurrentThreadScheduler, \
-    current_thread_scheduler as parent_current_thread_scheduler
+from rxbackpressure.schedulers.trampolinescheduler import TrampolineScheduler, trampoline_scheduler
 
-from rxbackpressure.scheduler import SchedulerBase
 
+class CurrentThreadScheduler(TrampolineScheduler):
+    """ A trampoline scheduler with its own queue per instance, an action scheduled on a new instance is executed
+    immediately even if another trampoline is running on the current thread
+    """
 
-class CurrentThreadScheduler(SchedulerBase, ParentCurrentThreadScheduler):
-    pass
 
-
-class CurrentThreadSchedulerAdapter(SchedulerBase):
-    @property
-    def now(self):
-        return parent_current_thread_scheduler.now
-
-    def schedule(self, action, state=None):
-        return parent_current_thread_scheduler.schedule(action, state)
-
-    def schedule_relative(self, duetime, action, state=None):
-        return parent_current_thread_scheduler.schedule_relative(duetime, action, state)
-
-    def schedule_absolute(self, duetime, action, state=None):
-        return parent_current_thread_scheduler.schedule_absolute(duetime, action, state)
-
-
-current_thread_scheduler = CurrentThreadSchedulerAdapter()
\ No newline at end of file
+current_thread_scheduler = trampoline_scheduler
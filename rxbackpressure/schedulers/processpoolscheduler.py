@@ -0,0 +1,47 @@
+import os
+import asyncio
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import ProcessPoolExecutor
+from typing import Callable, Any
+
+from rxbackpressure.scheduler import ExecutionModel
+from rxbackpressure.schedulers.asyncioscheduler import AsyncIOScheduler
+
+
+class ProcessPoolScheduler(AsyncIOScheduler):
+    """ A scheduler with a pool of worker processes for CPU-bound functions. Scheduled actions are closures that
+    cannot be sent to other processes; they run on the event loop like on the `AsyncIOScheduler`. Functions and
+    arguments that can be pickled are sent to the worker processes by `submit`.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop = None, new_thread: bool = None, executor: Executor = None,
+                 max_workers: int = None, execution_model: ExecutionModel = None):
+        """
+        :param loop: (optional) the event loop, by default a new event loop
+        :param new_thread: (optional) if True, the loop is run on a new thread
+        :param executor: (optional) an executor, by default a process pool executor
+        :param max_workers: (optional) number of worker processes (also of a given executor), by default the number
+        of processors
+        :param execution_model: (optional) defines when the loops running on this scheduler yield to other tasks
+        """
+
+        self.executor = executor or ProcessPoolExecutor(max_workers=max_workers)
+
+        # the process pool executor uses the number of processors by default as well
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        super().__init__(loop, new_thread, execution_model=execution_model)
+
+    def submit(self, func: Callable[..., Any], *args) -> Future:
+        """ Calls a function in a worker process
+
+        :param func: a function that can be pickled, e.g. a module-level function
+        :param args: arguments that can be pickled
+        :return: a future of the result
+        """
+
+        return self.executor.submit(func, *args)
+
+    def dispose(self):
+        super().dispose()
+        self.executor.shutdown(wait=False)
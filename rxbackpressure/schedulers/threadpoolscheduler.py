@@ -9,20 +9,21 @@ from typing import Callable, Union, Any
 from rx.core import Disposable, Scheduler
 from rx.disposables import MultipleAssignmentDisposable, CompositeDisposable
 
+from rxbackpressure.scheduler import ExecutionModel
 from rxbackpressure.schedulers.asyncioscheduler import AsyncIOScheduler
 
 
 class ThreadPoolScheduler(AsyncIOScheduler):
 
     def __init__(self, loop: asyncio.AbstractEventLoop = None, new_thread=True, executor: Executor = None,
-                 max_workers = None):
+                 max_workers = None, execution_model: ExecutionModel = None):
         self.executor = executor or ThreadPoolExecutor(max_workers=max_workers)
         # terminate when main thread terminates
         # https://stackoverflow.com/questions/48350257/how-to-exit-a-script-after-threadpoolexecutor-has-timed-out
         atexit.unregister(concurrent.futures.thread._python_exit)
         self.executor.shutdown = lambda wait: None
 
-        super().__init__(loop, new_thread)
+        super().__init__(loop, new_thread, execution_model=execution_model)
 
     def schedule(self, action: Callable[[Scheduler, Any], None], state=None):
         def func():
@@ -0,0 +1,152 @@
+import datetime
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Callable, Any, Union
+
+from rxbackpressure.scheduler import SchedulerBase, ExecutionModel, UncaughtExceptionReport
+
+
+class ScheduledAction:
+    """ An action queued on a trampoline; it is its own disposable
+    """
+
+    __slots__ = ('action', 'state', 'is_disposed')
+
+    def __init__(self, action, state):
+        self.action = action
+        self.state = state
+        self.is_disposed = False
+
+    def dispose(self):
+        self.is_disposed = True
+
+
+class ExecutedAction:
+    """ Disposable of an action that is already executed
+    """
+
+    __slots__ = ()
+
+    def dispose(self):
+        pass
+
+
+executed_action = ExecutedAction()
+
+
+class TrampolineScheduler(SchedulerBase):
+    """ Executes the actions on the current thread. An action scheduled while the thread executes another action
+    of the same scheduler is queued and executed after it, which avoids deep recursion.
+
+    Delayed actions are kept in a heap ordered by their due time on the monotonic clock and executed once they are
+    due, such that a change of the system clock neither reorders nor stalls them; as in rx, the thread sleeps if
+    only delayed actions are left. Each thread has its own queues, so a single instance can be
+    shared by all threads.
+    """
+
+    def __init__(self, r: UncaughtExceptionReport = None, execution_model: ExecutionModel = None,
+                 single_threaded: bool = False):
+        super().__init__(r=r, execution_model=execution_model, single_threaded=single_threaded)
+
+        # queues of the trampoline running on a thread, `queue` is None if no trampoline is running
+        self.local = threading.local()
+
+        # tie breaker for delayed actions with the same due time (in seconds of the monotonic clock)
+        self.counter = itertools.count()
+
+    @property
+    def now(self) -> datetime.datetime:
+        """ the current UTC time as a naive datetime, as in rx; it is only used to convert absolute due times
+        """
+
+        return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def to_timedelta(duetime: Union[int, float, datetime.timedelta]) -> datetime.timedelta:
+        """ converts a relative due time into a timedelta; numbers are milliseconds as in rx
+        """
+
+        if isinstance(duetime, datetime.timedelta):
+            return duetime
+        else:
+            return datetime.timedelta(milliseconds=duetime)
+
+    def next_action(self, queue: deque, timers: list):
+        """ takes the next action, a delayed action that is due comes before the queued actions
+        """
+
+        if timers and (not queue or timers[0][0] <= time.monotonic()):
+            # do not schedule blocking work on a trampoline
+            delay = timers[0][0] - time.monotonic()
+            if 0 < delay:
+                time.sleep(delay)
+
+            return heapq.heappop(timers)[2]
+        else:
+            return queue.popleft()
+
+    def run_trampoline(self, queue: deque, timers: list):
+        try:
+            while queue or timers:
+                item = self.next_action(queue, timers) if timers else queue.popleft()
+                if item.is_disposed:
+                    continue
+
+                item.action(self, item.state)
+        finally:
+            self.local.queue = None
+            self.local.timers = None
+
+    def schedule(self, action: Callable[[SchedulerBase, Any], None], state=None):
+        queue = getattr(self.local, 'queue', None)
+
+        if queue is not None:
+            item = ScheduledAction(action, state)
+            queue.append(item)
+            return item
+
+        queue = deque()
+        timers = []
+        self.local.queue = queue
+        self.local.timers = timers
+        try:
+            action(self, state)
+        except:
+            self.local.queue = None
+            self.local.timers = None
+            raise
+
+        self.run_trampoline(queue, timers)
+        return executed_action
+
+    def schedule_relative(self, duetime, action: Callable[[SchedulerBase, Any], None], state=None):
+        timedelta = self.to_timedelta(duetime)
+        if timedelta <= datetime.timedelta(0):
+            return self.schedule(action, state)
+
+        item = ScheduledAction(action, state)
+        entry = (time.monotonic() + timedelta.total_seconds(), next(self.counter), item)
+
+        queue = getattr(self.local, 'queue', None)
+        if queue is not None:
+            heapq.heappush(self.local.timers, entry)
+            return item
+
+        queue = deque()
+        timers = [entry]
+        self.local.queue = queue
+        self.local.timers = timers
+        self.run_trampoline(queue, timers)
+        return item
+
+    def schedule_absolute(self, duetime: datetime.datetime, action: Callable[[SchedulerBase, Any], None],
+                          state=None):
+        return self.schedule_relative(duetime - self.now, action, state)
+
+
+# one trampoline per thread for the default subscriptions
+trampoline_scheduler = TrampolineScheduler()
+single_threaded_trampoline_scheduler = TrampolineScheduler(single_threaded=True)
@@ -1,8 +1,6 @@
 import math
 from typing import List
 
-import rx
-from rx import config
 from rx.core import Disposable
 from rx.core.notification import OnNext, OnCompleted, OnError, Notification
 from rx.disposables import BooleanDisposable
@@ -10,13 +8,14 @@ from rx.internal.concurrency import RLock
 
 from rxbackpressure.ack import Continue, Stop, Ack, stop_ack
 from rxbackpressure.observable import Observable
+from rxbackpressure.internal.nolock import create_lock
 from rxbackpressure.observer import Observer
 from rxbackpressure.scheduler import SchedulerBase, ExecutionModel, Scheduler
 
 
 class CachedServeFirstSubject(Observable, Observer):
 
-    def __init__(self, name=None, scheduler=None):
+    def __init__(self, name=None, scheduler=None, single_threaded: bool = False):
         super().__init__()
 
         self.name = name
@@ -32,47 +31,123 @@ class CachedServeFirstSubject(Observable, Observer):
 
         self.buffer = self.DequeuableBuffer()
 
+        # number of inner subscriptions per index, maintains the index of the slowest inner subscription
+        self.index_counter = self.IndexCounter()
+
         self.exception = None
         self.current_ack = None
 
         self.is_done = False
 
-        self.lock = config["concurrency"].RLock()
+        self.lock = create_lock(single_threaded)
 
     class DequeuableBuffer:
-        def __init__(self):
-            self.first_idx = 0
-            self.queue = []
+        """ Ring buffer of notifications addressed by a global index, with O(1) append and indexed get. Dequeued
+        items are released in bulk.
+        """
 
-            # self.lock = config["concurrency"].RLock()
+        def __init__(self, capacity: int = 16):
+            assert capacity & (capacity - 1) == 0, 'capacity must be a power of two'
+
+            self.first_idx = 0
+            self.size = 0
+            self.head = 0
+            self.queue = [None] * capacity
+            self.mask = capacity - 1
 
         @property
         def last_idx(self):
-            return self.first_idx + len(self.queue)
+            return self.first_idx + self.size
 
         def __len__(self):
-            return len(self.queue)
+            return self.size
 
         def has_element_at(self, idx):
             return idx < self.last_idx
 
+        def grow(self):
+            capacity = len(self.queue)
+            tail = self.queue[self.head:]
+            front = self.queue[:self.head]
+            self.queue = tail + front + [None] * capacity
+            self.head = 0
+            self.mask = 2 * capacity - 1
+
         def append(self, value):
-            self.queue.append(value)
+            if self.size == len(self.queue):
+                self.grow()
+
+            self.queue[(self.head + self.size) & self.mask] = value
+            self.size += 1
 
         def get(self, idx):
             if idx < self.first_idx:
                 raise Exception('index {} is smaller than first index {}'.format(idx, self.first_idx))
-            elif idx - self.first_idx >= len(self.queue):
+            elif idx - self.first_idx >= self.size:
                 raise Exception(
-                    'index {} is bigger or equal than length of queue {}'.format(idx - self.first_idx, len(self.queue)))
-            return self.queue[idx - self.first_idx]
+                    'index {} is bigger or equal than length of queue {}'.format(idx - self.first_idx, self.size))
+            return self.queue[(self.head + idx - self.first_idx) & self.mask]
 
         def dequeue(self, idx):
             # empty buffer up until some index
-            # with self.lock:
-            while self.first_idx <= idx and len(self.queue) > 0:
-                self.first_idx += 1
-                self.queue.pop(0)
+            n = min(idx - self.first_idx + 1, self.size)
+            if n <= 0:
+                return
+
+            # release references to the dequeued items
+            queue = self.queue
+            head = self.head
+            mask = self.mask
+            for i in range(head, head + n):
+                queue[i & mask] = None
+
+            self.head = (head + n) & mask
+            self.first_idx += n
+            self.size -= n
+
+    class IndexCounter:
+        """ Counts the inner subscriptions per buffer index to maintain the index of the slowest subscription
+        incrementally. As indices only increase, searching the next slowest index is amortized O(1).
+        """
+
+        def __init__(self):
+            self.counts = {}
+            self.min_idx = None
+
+        def add(self, idx: int):
+            self.counts[idx] = self.counts.get(idx, 0) + 1
+            if self.min_idx is None or idx < self.min_idx:
+                self.min_idx = idx
+
+        def remove(self, idx: int):
+            counts = self.counts
+            count = counts[idx] - 1
+            if 0 < count:
+                counts[idx] = count
+            else:
+                del counts[idx]
+
+                if idx == self.min_idx:
+                    if counts:
+                        min_idx = idx + 1
+                        while min_idx not in counts:
+                            min_idx += 1
+                        self.min_idx = min_idx
+                    else:
+                        self.min_idx = None
+
+        def move(self, old_idx: int, new_idx: int) -> bool:
+            """ moves a subscription to a higher index
+
+            :return: True if the index of the slowest subscription has changed
+            """
+
+            counts = self.counts
+            counts[new_idx] = counts.get(new_idx, 0) + 1
+
+            min_idx = self.min_idx
+            self.remove(old_idx)
+            return min_idx != self.min_idx
 
     class InnerSubscription:
         def __init__(self, source: 'CachedServeFirstSubject', observer: Observer,
@@ -87,9 +162,10 @@ class CachedServeFirstSubject(Observable, Observer):
 
             with self.source.lock:
                 # increase current index
-                self.source.current_index[self] += 1
-
-            current_index = self.source.current_index[self]
+                current_index = self.source.current_index[self] + 1
+                self.source.current_index[self] = current_index
+                if self.source.index_counter.move(current_index - 1, current_index):
+                    self.source.buffer.dequeue(self.source.index_counter.min_idx - 1)
 
             ack = self.observer.on_next(value)
 
@@ -127,7 +203,7 @@ class CachedServeFirstSubject(Observable, Observer):
                     inner_ack.on_next(v)
                     inner_ack.on_completed()
 
-                ack.observe_on(scheduler=self.scheduler).subscribe(_)
+                ack.on_complete(_, scheduler=self.scheduler)
                 return inner_ack
 
         def notify_on_completed(self):
@@ -138,8 +214,8 @@ class CachedServeFirstSubject(Observable, Observer):
 
         def signal_stop(self):
             with self.source.lock:
-                del self.source.current_index[self]
-                if len(self.source.current_ack) == 0:
+                self.source.index_counter.remove(self.source.current_index.pop(self))
+                if len(self.source.current_index) == 0:
                     self.source.is_done = True
 
         def fast_loop(self, current_idx: int, sync_index: int, disposable: BooleanDisposable):
@@ -153,9 +229,9 @@ class CachedServeFirstSubject(Observable, Observer):
                 with self.source.lock:
                     # is this subscription last?
                     self.source.current_index[self] = current_idx
-                    if min(self.source.current_index.values()) == current_idx:
+                    if self.source.index_counter.move(current_idx - 1, current_idx):
                         # dequeing is required
-                        self.source.buffer.dequeue(current_idx - 1)
+                        self.source.buffer.dequeue(self.source.index_counter.min_idx - 1)
 
                 try:
                     # if is_last:
@@ -204,7 +280,7 @@ class CachedServeFirstSubject(Observable, Observer):
                                         raise Exception('no recognized acknowledgment {}'.format(v))
 
 
-                                ack.observe_on(self.scheduler).subscribe(_)
+                                ack.on_complete(_, scheduler=self.scheduler)
 
                     if not has_next:
                         break
@@ -234,7 +310,7 @@ class CachedServeFirstSubject(Observable, Observer):
                                 self.signal_stop()
                                 self.observer.on_error(err)
 
-                            ack.observe_on(self.scheduler).subscribe(on_next=on_next, on_error=on_error)
+                            ack.on_complete(on_next, scheduler=self.scheduler, on_error=on_error)
                             break
                         else:
                             self.signal_stop()
@@ -245,7 +321,7 @@ class CachedServeFirstSubject(Observable, Observer):
     def unsafe_subscribe(self, observer, scheduler, subscribe_scheduler):
         # self.scheduler = self.scheduler or scheduler
         source = self
-        em = scheduler.get_execution_model()
+        em = scheduler.get_execution_model().create_loop_state()
 
         inner_subscription = self.InnerSubscription(source=self, observer=observer, scheduler=scheduler, em=em)
 
@@ -254,6 +330,7 @@ class CachedServeFirstSubject(Observable, Observer):
                 # get current buffer index
                 current_idx = self.buffer.last_idx - 1
                 self.current_index[inner_subscription] = current_idx
+                self.index_counter.add(current_idx)
                 self.inactive_subsriptions.append(inner_subscription)
                 return Disposable.empty()
 
@@ -304,7 +381,14 @@ class CachedServeFirstSubject(Observable, Observer):
             ack_list = [current_ack] + inner_ack_list
 
             upper_ack = Ack()
-            rx.Observable.merge(*ack_list).first().subscribe(upper_ack)
+
+            def on_next(v):
+                # the first completed acknowledgment wins
+                upper_ack.on_next(v)
+                upper_ack.on_completed()
+
+            for ack in ack_list:
+                ack.on_complete(on_next, on_error=upper_ack.on_error)
             return upper_ack
 
     def on_completed(self):
@@ -1,22 +1,27 @@
 from typing import Set, Tuple, List, Union
 
-from rx import config
 from rx.concurrency.schedulerbase import SchedulerBase
 from rx.core import Disposable
 
 from rxbackpressure.ack import Continue, stop_ack, continue_ack
 from rxbackpressure.observable import Observable
+from rxbackpressure.internal.nolock import create_lock
 from rxbackpressure.observer import Observer
 from rxbackpressure.internal.promisecounter import PromiseCounter
 
 
 class PublishSubject(Observable, Observer):
-    def __init__(self):
+    def __init__(self, single_threaded: bool = False):
+        """
+        :param single_threaded: (optional) if True, the subject does not lock, the subject, its source and its
+        observers must be confined to a single thread
+        """
+
         # self.subscribers = []
         # self.is_freezed = False
 
         self.state = self.State()
-        self.lock = config["concurrency"].RLock()
+        self.lock = create_lock(single_threaded)
 
     class Subscriber:
         def __init__(self, observer, scheduler):
@@ -161,7 +166,7 @@ class PublishSubject(Observable, Observer):
                         self.unsubscribe(observer)
                         result.countdown()
 
-                    ack.first().subscribe(on_next=on_next, on_error=on_error)
+                    ack.on_complete(on_next, on_error=on_error)
 
         if result is None:
             return Continue()
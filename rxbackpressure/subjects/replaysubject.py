@@ -1,4 +1,5 @@
-from typing import Iterable, Set, List
+import datetime
+from typing import Iterable, Set, Union, Callable, Any
 
 from rx import config
 from rx.concurrency.schedulerbase import SchedulerBase
@@ -10,41 +11,33 @@ from rxbackpressure.observables.iteratorasobservable import IteratorAsObservable
 from rxbackpressure.observable import Observable
 from rxbackpressure.observer import Observer
 from rxbackpressure.internal.promisecounter import PromiseCounter
+from rxbackpressure.internal.replaybuffer import ReplayBuffer
 from rxbackpressure.scheduler import SchedulerBase
-from rxbackpressure.schedulers.currentthreadscheduler import CurrentThreadScheduler
+from rxbackpressure.schedulers.currentthreadscheduler import CurrentThreadScheduler, current_thread_scheduler
 
 
 class ReplaySubject(Observable, Observer):
     class State:
         def __init__(self,
-                     buffer: List,
-                     capacity: int,
+                     buffer: ReplayBuffer,
                      subscribers: Set = set(),
-                     length : int = 0,
                      is_done: bool = False,
                      error_thrown: Exception = None):
             self.buffer = buffer
-            self.capacity = capacity
             self.subscribers = subscribers
-            self.length = length
             self.is_done = is_done
             self.error_thrown = error_thrown
 
-        def copy(self, buffer=None, length=None, subscribers=None):
-            return ReplaySubject.State(buffer=buffer if buffer is not None else self.buffer,
-                                       capacity=self.capacity,
+        def copy(self, subscribers=None):
+            return ReplaySubject.State(buffer=self.buffer,
                                        subscribers=subscribers if subscribers is not None else self.subscribers,
-                                       length=length if length is not None else self.length,
                                        is_done=self.is_done,
                                        error_thrown=self.error_thrown)
 
-        def append_elem(self, elem) -> 'ReplaySubject.State':
-            if self.capacity == 0:
-                return self.copy(buffer = self.buffer + [elem])
-            elif self.length >= self.capacity:
-                raise NotImplementedError
-            else:
-                return self.copy(buffer=self.buffer + [elem], length=self.length+1)
+        def append_elem(self, elem, now=None) -> 'ReplaySubject.State':
+            # the buffer is append-only; states and snapshots taken before remain valid
+            self.buffer.append(elem, now)
+            return self
 
         def add_new_subscriber(self, s):
             subscribers = self.subscribers.copy()
@@ -61,14 +54,38 @@ class ReplaySubject(Observable, Observer):
             return self.copy(subscribers=subscribers)
 
         def mark_done(self, ex: Exception):
-            return ReplaySubject.State(buffer=self.buffer, capacity=self.capacity, subscribers=set(),
-                                length=self.length, is_done=True, error_thrown=ex)
+            return ReplaySubject.State(buffer=self.buffer, subscribers=set(), is_done=True, error_thrown=ex)
+
+    def __init__(self, initial_state: State = None, buffer_size: int = None,
+                 window: Union[float, datetime.timedelta] = None, max_bytes: int = None,
+                 size_of: Callable[[Any], int] = None, scheduler: SchedulerBase = None):
+        """
+        :param initial_state: (optional)
+        :param buffer_size: (optional) maximum number of replayed items
+        :param window: (optional) maximum age of the replayed items, in seconds or as timedelta
+        :param max_bytes: (optional) maximum total size of the replayed items
+        :param size_of: (optional) function that returns the size of an item, by default `sys.getsizeof`
+        :param scheduler: (optional) scheduler whose clock defines the age of the items, by default the scheduler
+        of the first subscription, or the current thread scheduler if an item arrives before
+        """
 
-    def __init__(self, initial_state: State = None):
-        self.state: ReplaySubject.State = initial_state or ReplaySubject.State(buffer=[], capacity=0)
+        buffer = ReplayBuffer(buffer_size=buffer_size, window=window, max_bytes=max_bytes, size_of=size_of)
+        self.state: ReplaySubject.State = initial_state or ReplaySubject.State(buffer=buffer)
+        self.scheduler = scheduler
 
         self.lock = config["concurrency"].RLock()
 
+    def now(self):
+        if self.state.buffer.window is None:
+            return None
+
+        if self.scheduler is None:
+            # an item arrives before the first subscription, the clock is fixed such that all items are timed by
+            # the same clock
+            self.scheduler = current_thread_scheduler
+
+        return self.scheduler.now
+
     def unsafe_subscribe(self, observer: Observer, scheduler: SchedulerBase, subscribe_scheduler: SchedulerBase):
         """ Creates a new ConnectableSubscriber for each subscription, pushes the current buffer to the
         ConnectableSubscriber and connects it immediately
@@ -95,17 +112,21 @@ class ReplaySubject(Observable, Observer):
             return IteratorAsObservable(iter(buffer)) \
                 .subscribe(TObserver(), scheduler, CurrentThreadScheduler())
 
-        state = self.state
-        buffer = state.buffer
+        c = ConnectableSubscriber(observer, scheduler=scheduler)
+
+        with self.lock:
+            if self.scheduler is None:
+                self.scheduler = scheduler
+
+            state = self.state
+            buffer = state.buffer.snapshot(self.now())
+
+            if not state.is_done:
+                self.state = state.add_new_subscriber(c)
 
         if state.is_done:
             return stream_on_done(buffer, state.error_thrown)
         else:
-            c = ConnectableSubscriber(observer, scheduler=scheduler)
-            with self.lock:
-                new_state = self.state.add_new_subscriber(c)
-                self.state = new_state
-
             c.push_first_all(buffer)
             ack, disposable = c.connect()
 
@@ -115,7 +136,7 @@ class ReplaySubject(Observable, Observer):
                 def on_next(v):
                     if isinstance(v, Stop):
                         self.remove_subscriber(c)
-                ack.subscribe(on_next=on_next)
+                ack.on_complete(on_next)
 
             def _():
                 try:
@@ -149,7 +170,7 @@ class ReplaySubject(Observable, Observer):
         with self.lock:
             state = self.state
             if not state.is_done:
-                self.state = state.append_elem(elem)
+                self.state = state.append_elem(elem, self.now())
 
         iterator = iter(state.subscribers)
         result = None
@@ -160,7 +181,9 @@ class ReplaySubject(Observable, Observer):
             except:
                 raise NotImplementedError
 
-            if isinstance(ack, Stop):
+            if isinstance(ack, Continue):
+                pass
+            elif isinstance(ack, Stop):
                 self.remove_subscriber(obs)
             else:
                 if result is None:
@@ -174,7 +197,7 @@ class ReplaySubject(Observable, Observer):
                         self.remove_subscriber(obs)
                         result.countdown()
 
-                ack.observe_on(obs.scheduler).subscribe(on_next)
+                ack.on_complete(on_next, scheduler=obs.scheduler)
 
         if result is None:
             return Continue()
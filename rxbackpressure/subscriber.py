@@ -0,0 +1,28 @@
+class Subscription:
+    """ Handed to a `Subscriber` in demand mode; the subscriber grants credits by requesting items
+    """
+
+    def request(self, n: int):
+        raise NotImplementedError
+
+    def cancel(self):
+        raise NotImplementedError
+
+
+class Subscriber:
+    """ An observer in demand mode (in the style of Reactive Streams). Instead of acknowledging each item, the
+    subscriber requests a number of items through the subscription and the source emits at most that many items.
+    The return value of `on_next` is ignored.
+    """
+
+    def on_subscribe(self, subscription: Subscription):
+        raise NotImplementedError
+
+    def on_next(self, v):
+        raise NotImplementedError
+
+    def on_error(self, err):
+        raise NotImplementedError
+
+    def on_completed(self):
+        raise NotImplementedError
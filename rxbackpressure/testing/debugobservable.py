@@ -32,7 +32,7 @@ class DebugObservable(Observable):
             else:
                 if self.print_ack:
                     print('{}.on_raw_ack {}'.format(self.name, ack))
-                ack.subscribe(self.on_ack_msg)
+                ack.on_complete(self.on_ack_msg)
             return ack
 
         def on_completed():
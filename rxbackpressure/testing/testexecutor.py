@@ -0,0 +1,33 @@
+from concurrent.futures import Future, Executor
+
+
+class TestExecutor(Executor):
+    """ Collects the submitted tasks, which are completed by the test
+    """
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers
+        self.tasks = []
+        self.is_shutdown = False
+
+    def submit(self, func, *args, **kwargs):
+        future = Future()
+        self.tasks.append((future, func, args, kwargs))
+        return future
+
+    def complete(self, idx: int):
+        """ runs the task with the given index and completes its future with the result or the exception
+
+        :param idx: index of the task in the order of submission
+        """
+
+        future, func, args, kwargs = self.tasks[idx]
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def shutdown(self, wait=True):
+        self.is_shutdown = True
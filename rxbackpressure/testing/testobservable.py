@@ -12,6 +12,9 @@ class TestObservable(Observable):
     def on_next(self, val):
         return self.observer.on_next(val)
 
+    def on_next_batch(self, items):
+        return self.observer.on_next_batch(items)
+
     def on_error(self, exc):
         return self.observer.on_error(exc)
 
@@ -4,10 +4,10 @@ from rxbackpressure.scheduler import SchedulerBase, ExecutionModel, UncaughtExce
 
 
 class TestScheduler(SchedulerBase, VirtualTimeScheduler):
-    def __init__(self):
+    def __init__(self, execution_model: ExecutionModel = None):
         super().__init__()
         self.r = UncaughtExceptionReport()
-        self.execution_model = BatchedExecution(16)
+        self.execution_model = execution_model or BatchedExecution(16)
 
     def report_failure(self, exc: Exception):
         return self.r.report_failure(exc)
@@ -0,0 +1,23 @@
+class TimeValueChunk:
+    """ A chunk of time-stamped samples stored as two columns, an array of timestamps sorted in ascending order
+    and an array of values of the same length (e.g. NumPy arrays).
+
+    Slicing and boolean masks apply to both columns, e.g. `chunk[chunk.values > 0]`.
+    """
+
+    __slots__ = ('timestamps', 'values')
+
+    def __init__(self, timestamps, values):
+        assert len(timestamps) == len(values), 'timestamps and values must have the same length'
+
+        self.timestamps = timestamps
+        self.values = values
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, item):
+        return TimeValueChunk(self.timestamps[item], self.values[item])
+
+    def __repr__(self):
+        return 'TimeValueChunk({}, {})'.format(self.timestamps, self.values)
@@ -6,6 +6,7 @@ setup(
     packages=find_packages(
         exclude=[]),
     install_requires=['rx==1.6.1'],
+    extras_require={'numpy': ['numpy']},
     description='A rxpy extension with back-pressure',
     author='Michael Schneeberger',
     author_email='michael.schneeb@outlook.com',
@@ -0,0 +1,68 @@
+import unittest
+
+from rxbackpressure.ack import Ack, Continue, Stop, continue_ack, stop_ack
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestAck(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+
+    def test_callback_is_called_on_completion(self):
+        ack = Ack()
+        received = []
+        ack.on_complete(received.append)
+
+        ack.on_next(continue_ack)
+        self.assertFalse(ack.has_value)
+        self.assertListEqual(received, [])
+
+        ack.on_completed()
+        self.assertTrue(ack.has_value)
+        self.assertListEqual(received, [continue_ack])
+
+    def test_callback_on_completed_ack_is_called_immediately(self):
+        ack = Ack()
+        ack.on_next(stop_ack)
+        ack.on_completed()
+
+        received = []
+        ack.on_complete(received.append)
+        self.assertListEqual(received, [stop_ack])
+
+    def test_callback_is_scheduled(self):
+        received = []
+        continue_ack.on_complete(received.append, scheduler=self.scheduler)
+        self.assertListEqual(received, [])
+
+        self.scheduler.advance_by(1)
+        self.assertListEqual(received, [continue_ack])
+
+    def test_error_is_forwarded(self):
+        ack = Ack()
+        next_ack = Ack()
+        ack.connect_ack(next_ack)
+
+        dummy = Exception('dummy')
+        ack.on_error(dummy)
+        self.assertFalse(next_ack.has_value)
+        self.assertEqual(next_ack.exception, dummy)
+
+    def test_merge_ack_completes_after_both(self):
+        ack1 = Ack()
+        ack2 = Ack()
+        merged = ack1.merge_ack(ack2)
+
+        ack1.on_next(continue_ack)
+        ack1.on_completed()
+        self.assertFalse(merged.has_value)
+
+        ack2.on_next(stop_ack)
+        ack2.on_completed()
+        self.assertIsInstance(merged.value, Stop)
+
+    def test_synchronous_acks_are_singletons(self):
+        self.assertIs(Continue(), continue_ack)
+        self.assertIs(Stop(), stop_ack)
+        self.assertIs(continue_ack.value, continue_ack)
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from rxbackpressure.schedulers.asyncioscheduler import AsyncIOScheduler
+
+
+class TestAsyncIOScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        # a loop run on a new thread stops shortly after the scheduler is disposed
+        for _ in range(500):
+            if not self.loop.is_running():
+                break
+            time.sleep(0.01)
+
+        self.loop.close()
+
+    def test_same_loop_schedules_without_waking_up_the_loop(self):
+        scheduler = AsyncIOScheduler(loop=self.loop, new_thread=False)
+        executed = []
+
+        async def main():
+            with mock.patch.object(self.loop, 'call_soon_threadsafe', side_effect=AssertionError):
+                scheduler.schedule(lambda _, state: executed.append(state), 1)
+                scheduler.schedule_relative(0.001, lambda _, state: executed.append(state), 2)
+                await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(main())
+        self.assertListEqual(executed, [1, 2])
+
+    def test_same_loop_action_is_disposed(self):
+        scheduler = AsyncIOScheduler(loop=self.loop, new_thread=False)
+        executed = []
+
+        async def main():
+            scheduler.schedule(lambda _, __: executed.append(1)).dispose()
+            scheduler.schedule_relative(0.001, lambda _, __: executed.append(2)).dispose()
+            await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(main())
+        self.assertListEqual(executed, [])
+
+    def test_attaches_to_running_loop(self):
+        threads = []
+
+        async def main():
+            n_threads = threading.active_count()
+            scheduler = AsyncIOScheduler(loop=self.loop)
+            self.assertEqual(threading.active_count(), n_threads)
+
+            scheduler.schedule(lambda _, __: threads.append(threading.current_thread()))
+            await asyncio.sleep(0)
+
+        self.loop.run_until_complete(main())
+        self.assertListEqual(threads, [threading.current_thread()])
+
+    def test_other_thread_wakes_up_the_loop(self):
+        scheduler = AsyncIOScheduler(loop=self.loop)
+        threads = []
+        executed = threading.Event()
+
+        def action(_, __):
+            threads.append(threading.current_thread())
+            executed.set()
+
+        try:
+            scheduler.schedule(action)
+            self.assertTrue(executed.wait(timeout=5))
+
+            executed.clear()
+            scheduler.schedule_relative(0.001, action)
+            self.assertTrue(executed.wait(timeout=5))
+        finally:
+            scheduler.dispose()
+
+        self.assertEqual(len(threads), 2)
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertIs(threads[0], threads[1])
+
+    def test_other_thread_relative_action_is_disposed(self):
+        scheduler = AsyncIOScheduler(loop=self.loop)
+        executed = []
+        is_scheduled = threading.Event()
+
+        try:
+            disposable = scheduler.schedule_relative(0.05, lambda _, __: executed.append(1))
+
+            # the timer is created on the loop before it is disposed
+            scheduler.schedule(lambda _, __: is_scheduled.set())
+            self.assertTrue(is_scheduled.wait(timeout=5))
+            disposable.dispose()
+
+            is_scheduled.clear()
+            scheduler.schedule_relative(0.1, lambda _, __: is_scheduled.set())
+            self.assertTrue(is_scheduled.wait(timeout=5))
+        finally:
+            scheduler.dispose()
+
+        self.assertListEqual(executed, [])
@@ -0,0 +1,170 @@
+import asyncio
+import unittest
+
+from rxbackpressure.ack import continue_ack, stop_ack
+from rxbackpressure.observables.asynciteratorasobservable import AsyncIteratorAsObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestAsyncIteratorAsObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+        self.loop = asyncio.new_event_loop()
+        self.pulled = []
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_loop(self):
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+
+    async def gen(self, n):
+        for v in range(n):
+            self.pulled.append(v)
+            yield v
+
+    def subscribe(self, observable, observer):
+        return observable.unsafe_subscribe(observer, self.scheduler, self.scheduler)
+
+    def test_pulls_only_after_acknowledgment(self):
+        o1 = TestObserver()
+        o1.immediate_continue = 1
+        self.subscribe(AsyncIteratorAsObservable(self.gen(5), loop=self.loop), o1)
+
+        self.run_loop()
+        self.assertListEqual(o1.received, [0, 1])
+        self.assertListEqual(self.pulled, [0, 1])
+
+        o1.immediate_continue = 10
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.run_loop()
+
+        self.assertListEqual(o1.received, [0, 1, 2, 3, 4])
+        self.assertTrue(o1.is_completed)
+
+    def test_batches(self):
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.subscribe(AsyncIteratorAsObservable(self.gen(5), loop=self.loop, batch_size=2), o1)
+
+        self.run_loop()
+        self.assertListEqual(o1.received, [0, 1, 2, 3, 4])
+        self.assertTrue(o1.is_completed)
+
+    def test_stop_closes_generator(self):
+        o1 = TestObserver()
+        gen = self.gen(5)
+        self.subscribe(AsyncIteratorAsObservable(gen, loop=self.loop), o1)
+
+        self.run_loop()
+        o1.ack.on_next(stop_ack)
+        o1.ack.on_completed()
+        self.run_loop()
+
+        self.assertListEqual(o1.received, [0])
+        self.assertIsNone(gen.ag_frame)
+
+    def test_error(self):
+        async def gen():
+            yield 1
+            raise ValueError()
+
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.subscribe(AsyncIteratorAsObservable(gen(), loop=self.loop), o1)
+
+        self.run_loop()
+        self.assertListEqual(o1.received, [1])
+        self.assertIsInstance(o1.was_thrown, ValueError)
+
+    def test_observer_exception_is_sent_as_error(self):
+        class FailingObserver(TestObserver):
+            def on_next(self, v):
+                raise ValueError()
+
+        o1 = FailingObserver()
+        self.subscribe(AsyncIteratorAsObservable(self.gen(5), loop=self.loop), o1)
+
+        self.run_loop()
+        self.assertIsInstance(o1.was_thrown, ValueError)
+        self.assertListEqual(self.pulled, [0])
+
+    def test_failure_of_observer_is_reported(self):
+        failures = []
+
+        class Report:
+            def report_failure(self, exc):
+                failures.append(exc)
+
+        class FailingObserver(TestObserver):
+            def on_completed(self):
+                raise ValueError()
+
+        self.scheduler.r = Report()
+        o1 = FailingObserver()
+        o1.immediate_continue = 10
+        self.subscribe(AsyncIteratorAsObservable(self.gen(2), loop=self.loop), o1)
+
+        self.run_loop()
+        self.assertListEqual(o1.received, [0, 1])
+        self.assertEqual(len(failures), 1)
+        self.assertIsInstance(failures[0], ValueError)
+
+    def test_batch_is_sent_while_iterator_waits(self):
+        async def gen():
+            yield 0
+            yield 1
+            await asyncio.sleep(0.05)
+            yield 2
+
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.subscribe(AsyncIteratorAsObservable(gen(), loop=self.loop, batch_size=10), o1)
+
+        self.run_loop()
+        self.assertListEqual(o1.received, [0, 1])
+        self.assertFalse(o1.is_completed)
+
+        self.loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertListEqual(o1.received, [0, 1, 2])
+        self.assertTrue(o1.is_completed)
+
+    def test_dispose_cancels_pending_pull(self):
+        async def gen():
+            yield 0
+            yield 1
+            await asyncio.sleep(10)
+            yield 2
+
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        g = gen()
+        disposable = self.subscribe(AsyncIteratorAsObservable(g, loop=self.loop, batch_size=10), o1)
+
+        self.run_loop()
+        disposable.dispose()
+        self.run_loop()
+
+        self.assertListEqual(o1.received, [0, 1])
+        self.assertIsNone(g.ag_frame)
+
+    def test_running_loop_is_used_by_default(self):
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+
+        async def main():
+            self.subscribe(AsyncIteratorAsObservable(self.gen(3)), o1)
+            await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(main())
+        self.assertListEqual(o1.received, [0, 1, 2])
+        self.assertTrue(o1.is_completed)
+
+    def test_without_loop_raises(self):
+        o1 = TestObserver()
+
+        with self.assertRaises(Exception):
+            self.subscribe(AsyncIteratorAsObservable(self.gen(3)), o1)
@@ -0,0 +1,230 @@
+import threading
+import unittest
+
+from rxbackpressure.ack import Continue, Stop, continue_ack
+from rxbackpressure.observers.bufferedsubscriber import BufferedSubscriber
+from rxbackpressure.overflowstrategy import DropNew, DropOld, KeepLatest, FailFast, BufferOverflowException
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestBufferedSubscriber(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+
+    def push(self, subscriber, items):
+        return [subscriber.on_next(v) for v in items]
+
+    def test_buffered_items_are_drained_as_batch(self):
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=10)
+
+        self.push(s1, [1, 2, 3])
+        s1.on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertListEqual(o1.received, [1, 2, 3])
+        self.assertTrue(o1.is_completed)
+
+    def test_batches_are_limited_by_the_execution_model(self):
+        batch_sizes = []
+
+        class BatchObserver(TestObserver):
+            def on_next_batch(self, items):
+                batch_sizes.append(len(items))
+                self.received.extend(items)
+                return continue_ack
+
+        o1 = BatchObserver()
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=100)
+
+        s1.on_next_batch(list(range(10)))
+        s1.on_next_batch(list(range(10, 30)))
+        self.push(s1, [30, 31])
+        self.scheduler.advance_by(1)
+
+        # the test scheduler recommends batches of 16 items
+        self.assertListEqual(batch_sizes, [16, 16])
+        self.assertListEqual(o1.received, list(range(32)))
+
+    def test_back_pressure_until_drained(self):
+        o1 = TestObserver()
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=2)
+
+        acks = self.push(s1, [1, 2, 3])
+        self.assertIsInstance(acks[0], Continue)
+        self.assertIsInstance(acks[1], Continue)
+        self.assertFalse(acks[2].has_value)
+
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1])
+
+        o1.immediate_continue = 10
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertListEqual(o1.received, [1, 2, 3])
+        self.assertIsInstance(acks[2].value, Continue)
+
+    def test_drop_new(self):
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        strategy = DropNew()
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=2, overflow_strategy=strategy)
+
+        acks = self.push(s1, [1, 2, 3, 4])
+        self.scheduler.advance_by(1)
+
+        self.assertTrue(all(isinstance(ack, Continue) for ack in acks))
+        self.assertListEqual(o1.received, [1, 2])
+        self.assertEqual(strategy.dropped, 2)
+
+    def test_drop_old(self):
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        strategy = DropOld()
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=2, overflow_strategy=strategy)
+
+        self.push(s1, [1, 2, 3, 4])
+        self.scheduler.advance_by(1)
+
+        self.assertListEqual(o1.received, [3, 4])
+        self.assertEqual(strategy.dropped, 2)
+
+    def test_drop_old_does_not_exceed_buffer_size_with_items_in_flight(self):
+        o1 = TestObserver()
+        strategy = DropOld()
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=2, overflow_strategy=strategy)
+
+        # the first two items are sent and wait for their acknowledgment, the queue is empty
+        s1.on_next_batch([1, 2])
+        self.scheduler.advance_by(1)
+        self.assertFalse(s1.queue)
+
+        self.assertIsInstance(s1.on_next(3), Continue)
+        self.assertEqual(s1.level(), 2)
+        self.assertEqual(strategy.dropped, 1)
+
+    def test_keep_latest(self):
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        strategy = KeepLatest()
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=2, overflow_strategy=strategy)
+
+        self.push(s1, [1, 2, 3])
+        self.scheduler.advance_by(1)
+
+        self.assertListEqual(o1.received, [3])
+        self.assertEqual(strategy.dropped, 2)
+
+    def test_fail_fast(self):
+        o1 = TestObserver()
+        strategy = FailFast()
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=2, overflow_strategy=strategy)
+
+        acks = self.push(s1, [1, 2, 3])
+        self.scheduler.advance_by(1)
+
+        self.assertIsInstance(acks[2], Stop)
+        self.assertListEqual(o1.received, [])
+        self.assertIsInstance(o1.was_thrown, BufferOverflowException)
+        self.assertEqual(strategy.dropped, 3)
+
+    def test_drop_new_by_bytes(self):
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        strategy = DropNew()
+        s1 = BufferedSubscriber(o1, self.scheduler, max_bytes=5, size_of=len, overflow_strategy=strategy)
+
+        self.push(s1, ['ab', 'cde', 'f', 'gh'])
+        self.scheduler.advance_by(1)
+
+        self.assertListEqual(o1.received, ['ab', 'cde'])
+        self.assertEqual(strategy.dropped, 2)
+
+    def test_pause_and_resume_at_watermarks(self):
+        calls = []
+        o1 = TestObserver()
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=10, high_watermark=3, low_watermark=1,
+                                pause=lambda: calls.append('pause'), resume=lambda: calls.append('resume'))
+
+        self.push(s1, [1, 2])
+        self.assertListEqual(calls, [])
+
+        self.push(s1, [3])
+        self.assertListEqual(calls, ['pause'])
+
+        # the batch in flight still counts towards the buffer level
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1])
+        self.assertListEqual(calls, ['pause'])
+
+        o1.immediate_continue = 10
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1, 2, 3])
+        self.assertListEqual(calls, ['pause', 'resume'])
+
+    def test_resume_after_drain_during_pause(self):
+        calls = []
+        o1 = TestObserver()
+
+        def pause():
+            calls.append('pause')
+
+            # the consumer acknowledges all items before the producer is paused
+            s1.acknowledge(s1.pop_items())
+
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=10, high_watermark=2, low_watermark=1,
+                                pause=pause, resume=lambda: calls.append('resume'))
+
+        self.push(s1, [1, 2])
+        self.assertListEqual(calls, ['pause', 'resume'])
+        self.assertFalse(s1.is_paused)
+
+    def test_callbacks_are_invoked_outside_of_lock(self):
+        acquired = []
+        o1 = TestObserver()
+
+        def pause():
+            # e.g. a producer that waits for another thread touching the subscriber
+            def acquire():
+                acquired.append(s1.lock.acquire(timeout=1))
+                s1.lock.release()
+
+            t = threading.Thread(target=acquire)
+            t.start()
+            t.join()
+
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=10, high_watermark=2, low_watermark=1,
+                                pause=pause, resume=lambda: None)
+
+        self.push(s1, [1, 2])
+        self.assertListEqual(acquired, [True])
+        self.assertTrue(s1.is_paused)
+
+    def test_callback_pushing_items_does_not_reenter(self):
+        calls = []
+        o1 = TestObserver()
+
+        def pause():
+            calls.append('pause')
+
+            # the producer emits its remaining items while it is being paused
+            self.push(s1, [3, 4])
+            calls.append('paused')
+
+        s1 = BufferedSubscriber(o1, self.scheduler, buffer_size=10, high_watermark=2, low_watermark=1,
+                                pause=pause, resume=lambda: calls.append('resume'))
+
+        self.push(s1, [1, 2])
+        self.assertListEqual(calls, ['pause', 'paused'])
+
+        o1.immediate_continue = 10
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1, 2, 3, 4])
+        self.assertListEqual(calls, ['pause', 'paused', 'resume'])
@@ -99,3 +99,56 @@ class TestConnectableSubscriber(unittest.TestCase):
 
         self.assertListEqual(o1.received, [10, 20, 30, 40, 50, 60])
         self.assertListEqual(o2.received, [10, 20, 30, 40, 50, 60])
+
+    def test_buffer_is_dequeued_up_to_slowest_subscription(self):
+        s: TestScheduler = self.scheduler
+
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        o2 = TestObserver()
+
+        subject = CachedServeFirstSubject(scheduler=s)
+        subject.subscribe(o1, s, CurrentThreadScheduler())
+        subject.subscribe(o2, s, CurrentThreadScheduler())
+
+        for v in range(5):
+            subject.on_next(v)
+
+        self.assertListEqual(o2.received, [0])
+        self.assertEqual(subject.index_counter.min_idx, 0)
+        self.assertEqual(len(subject.buffer), 5)
+
+        o2.immediate_continue = 10
+        o2.ack.on_next(Continue())
+        o2.ack.on_completed()
+        s.advance_by(1)
+
+        self.assertListEqual(o2.received, [0, 1, 2, 3, 4])
+        self.assertEqual(subject.index_counter.min_idx, 4)
+        self.assertEqual(len(subject.buffer), 1)
+
+    def test_dequeuable_buffer_wraps_around_and_grows(self):
+        buffer = CachedServeFirstSubject.DequeuableBuffer(capacity=4)
+
+        for v in range(3):
+            buffer.append(v)
+        buffer.dequeue(1)
+        for v in range(3, 10):
+            buffer.append(v)
+
+        self.assertEqual(buffer.first_idx, 2)
+        self.assertEqual(buffer.last_idx, 10)
+        self.assertListEqual([buffer.get(idx) for idx in range(2, 10)], list(range(2, 10)))
+        self.assertRaises(Exception, buffer.get, 1)
+
+    def test_index_counter(self):
+        counter = CachedServeFirstSubject.IndexCounter()
+        counter.add(0)
+        counter.add(0)
+
+        self.assertFalse(counter.move(0, 2))
+        self.assertTrue(counter.move(0, 1))
+        self.assertEqual(counter.min_idx, 1)
+
+        counter.remove(1)
+        self.assertEqual(counter.min_idx, 2)
@@ -0,0 +1,56 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from rxbackpressure.ack import Continue
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.observables.filterchunksobservable import FilterChunksObservable
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+@unittest.skipIf(np is None, 'requires NumPy')
+class TestChunks(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+
+    def test_from_array_emits_views(self):
+        arr = np.arange(10)
+        chunks = list(ObservableOp.from_array(arr, chunk_size=4).to_iterable())
+
+        self.assertEqual([len(c) for c in chunks], [4, 4, 2])
+        self.assertTrue(all(np.shares_memory(c, arr) for c in chunks))
+        np.testing.assert_array_equal(np.concatenate(chunks), arr)
+
+    def test_map_chunks(self):
+        obs = ObservableOp.from_array(np.arange(6), chunk_size=3).map_chunks(lambda a: a * 2)
+        chunks = list(obs.to_iterable())
+
+        np.testing.assert_array_equal(np.concatenate(chunks), np.arange(6) * 2)
+
+    def test_filter_chunks_drops_empty_chunks(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        FilterChunksObservable(s1, lambda a: a % 2 == 0).unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        self.assertIsInstance(s1.on_next(np.array([1, 2, 3, 4])), Continue)
+        self.assertIsInstance(s1.on_next(np.array([1, 3])), Continue)
+        self.assertIsInstance(s1.on_next_batch([np.array([5, 6]), np.array([7])]), Continue)
+
+        self.assertEqual(len(o1.received), 2)
+        np.testing.assert_array_equal(o1.received[0], [2, 4])
+        np.testing.assert_array_equal(o1.received[1], [6])
+
+    def test_chunk_operators_are_fused(self):
+        obs = ObservableOp.from_array(np.arange(10), chunk_size=5) \
+            .map_chunks(lambda a: a + 1) \
+            .filter_chunks(lambda a: 5 < a)
+        chunks = list(obs.to_iterable())
+
+        np.testing.assert_array_equal(np.concatenate(chunks), np.arange(6, 11))
@@ -1,6 +1,7 @@
 import unittest
 
 from rxbackpressure.ack import Continue
+from rxbackpressure.internal.replaybuffer import ReplayBuffer
 from rxbackpressure.observers.connectablesubscriber import ConnectableSubscriber
 from rxbackpressure.observer import Observer
 from rxbackpressure.testing.testscheduler import TestScheduler
@@ -170,6 +171,42 @@ class TestConnectableSubscriber(unittest.TestCase):
         with self.assertRaises(Exception):
             down_stream.push_complete()
 
+    def test_push_first_all_iterates_snapshot_when_connected(self):
+        s: TestScheduler = self.scheduler
+
+        received = []
+
+        class TestObserver(Observer):
+            def on_next(self, v):
+                received.append(v)
+                return Continue()
+
+            def on_error(self, err):
+                pass
+
+            def on_completed(self):
+                pass
+
+        buffer = ReplayBuffer(chunk_size=4)
+        for v in range(10):
+            buffer.append(v)
+
+        pulled = []
+
+        def snapshot():
+            for v in buffer.snapshot():
+                pulled.append(v)
+                yield v
+
+        down_stream = ConnectableSubscriber(TestObserver(), scheduler=s)
+        down_stream.push_first_all(snapshot())
+        down_stream.push_first(10)
+        self.assertListEqual(pulled, [])
+
+        down_stream.connect()
+        s.advance_by(1)
+        self.assertListEqual(received, list(range(11)))
+
     # def test_should_schedule_push_error(self):
     #     s: TestScheduler = self.scheduler
     #
@@ -0,0 +1,103 @@
+import random
+import unittest
+
+from rxbackpressure.ack import Continue, continue_ack
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+from rxbackpressure.timevaluechunk import TimeValueChunk
+
+try:
+    import numpy as np
+    from rxbackpressure.observables.controlledzipchunksobservable import ControlledZipChunksObservable
+except ImportError:
+    np = None
+
+
+def to_chunks(timestamps, values, sizes):
+    chunks = []
+    start = 0
+    for size in sizes:
+        chunks.append(TimeValueChunk(timestamps[start:start + size], values[start:start + size]))
+        start += size
+    return chunks
+
+
+@unittest.skipIf(np is None, 'requires NumPy')
+class TestControlledZipChunksObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+
+    def chunk(self, timestamps):
+        return TimeValueChunk(np.array(timestamps), np.array(timestamps) * 10)
+
+    def test_tail_is_carried_to_next_chunk(self):
+        s1 = TestObservable()
+        s2 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        obs = ControlledZipChunksObservable(s1, s2, selector=lambda l, r: l + r)
+        obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        left_ack = s1.on_next(self.chunk([1, 2, 3, 4]))
+        self.assertFalse(left_ack.has_value)
+
+        # the right chunk is fully processed, the left tail [3, 4] is kept
+        self.assertIsInstance(s2.on_next(self.chunk([0, 2, 3])), Continue)
+        self.assertFalse(left_ack.has_value)
+
+        # the left chunk is fully processed, the right tail [6] is kept
+        right_ack = s2.on_next(self.chunk([4, 6]))
+        self.assertIsInstance(left_ack.value, Continue)
+        self.assertFalse(right_ack.has_value)
+
+        self.assertEqual(len(o1.received), 2)
+        np.testing.assert_array_equal(o1.received[0].timestamps, [2, 3])
+        np.testing.assert_array_equal(o1.received[0].values, [40, 60])
+        np.testing.assert_array_equal(o1.received[1].timestamps, [4])
+
+    def test_completes_when_no_more_samples_can_match(self):
+        s1 = TestObservable()
+        s2 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        obs = ControlledZipChunksObservable(s1, s2)
+        obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        s1.on_next(self.chunk([1, 2]))
+        s1.on_completed()
+        self.assertFalse(o1.is_completed)
+
+        s2.on_next(self.chunk([2, 5]))
+        self.assertTrue(o1.is_completed)
+
+        left, right = o1.received[0]
+        np.testing.assert_array_equal(left.values, [20])
+        np.testing.assert_array_equal(right.values, [20])
+
+    def test_matches_element_wise_alignment(self):
+        rnd = random.Random(42)
+
+        for _ in range(20):
+            left_ts = np.sort(np.array([rnd.randint(0, 100) for _ in range(80)]))
+            right_ts = np.sort(np.array([rnd.randint(0, 100) for _ in range(60)]))
+            left_values = np.arange(len(left_ts))
+            right_values = np.arange(len(right_ts))
+
+            def random_sizes(n):
+                sizes = []
+                while sum(sizes) < n:
+                    sizes.append(rnd.randint(1, 20))
+                return sizes
+
+            left = ObservableOp.from_(to_chunks(left_ts, left_values, random_sizes(len(left_ts))))
+            right = ObservableOp.from_(to_chunks(right_ts, right_values, random_sizes(len(right_ts))))
+            chunks = list(left.controlled_zip_chunks(right, selector=lambda l, r: np.stack([l, r], axis=1))
+                          .to_iterable())
+            result = [tuple(v) for c in chunks for v in c.values]
+
+            # each right sample is matched with the first left sample of the same timestamp
+            expected = [(int(np.searchsorted(left_ts, t)), i) for i, t in enumerate(right_ts) if t in left_ts]
+            self.assertListEqual(result, expected)
@@ -0,0 +1,107 @@
+import unittest
+
+from rxbackpressure.ack import Continue, Stop, continue_ack
+from rxbackpressure.observers.demandobserver import DemandObserver
+from rxbackpressure.observers.requestingsubscriber import RequestingSubscriber
+from rxbackpressure.subscriber import Subscriber
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestSubscriber(Subscriber):
+    def __init__(self):
+        self.subscription = None
+        self.received = []
+        self.is_completed = False
+
+    def on_subscribe(self, subscription):
+        self.subscription = subscription
+
+    def on_next(self, v):
+        self.received.append(v)
+
+    def on_error(self, err):
+        pass
+
+    def on_completed(self):
+        self.is_completed = True
+
+
+class TestDemandObserver(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+
+    def test_items_are_acknowledged_while_demand_remains(self):
+        s1 = TestSubscriber()
+        o1 = DemandObserver(s1)
+        s1.subscription.request(2)
+
+        ack = o1.on_next(1)
+        self.assertIsInstance(ack, Continue)
+
+        ack = o1.on_next(2)
+        self.assertFalse(ack.has_value)
+        self.assertListEqual(s1.received, [1, 2])
+
+        s1.subscription.request(1)
+        self.assertIsInstance(ack.value, Continue)
+
+    def test_item_without_demand_is_sent_on_request(self):
+        s1 = TestSubscriber()
+        o1 = DemandObserver(s1)
+
+        ack = o1.on_next(1)
+        o1.on_completed()
+        self.assertListEqual(s1.received, [])
+        self.assertFalse(s1.is_completed)
+
+        s1.subscription.request(1)
+        self.assertListEqual(s1.received, [1])
+        self.assertTrue(s1.is_completed)
+        self.assertFalse(ack.has_value)
+
+    def test_cancel_stops_source(self):
+        s1 = TestSubscriber()
+        o1 = DemandObserver(s1)
+        s1.subscription.request(1)
+
+        ack = o1.on_next(1)
+        s1.subscription.cancel()
+
+        self.assertIsInstance(ack.value, Stop)
+        self.assertIsInstance(o1.on_next(2), Stop)
+
+    def test_requesting_subscriber(self):
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        s1 = RequestingSubscriber(o1, self.scheduler, request_size=4)
+        d1 = DemandObserver(s1)
+
+        acks = [d1.on_next(v) for v in range(4)]
+        self.assertIsInstance(acks[2], Continue)
+        self.assertFalse(acks[3].has_value)
+        self.assertListEqual(o1.received, [])
+
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [0, 1, 2, 3])
+        self.assertIsInstance(acks[3].value, Continue)
+
+        d1.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertTrue(o1.is_completed)
+
+    def test_requesting_subscriber_waits_for_acknowledgment(self):
+        o1 = TestObserver()
+        s1 = RequestingSubscriber(o1, self.scheduler, request_size=2)
+        d1 = DemandObserver(s1)
+
+        d1.on_next(1)
+        d1.on_next(2)
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1])
+
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1, 2])
@@ -0,0 +1,108 @@
+import unittest
+
+from rxbackpressure.ack import continue_ack
+from rxbackpressure.observables.iteratorasobservable import IteratorAsObservable
+from rxbackpressure.observers.bufferedsubscriber import BufferedSubscriber
+from rxbackpressure.scheduler import AdaptiveExecution, TimeBudgetExecution, AlwaysAsyncExecution, ExecutionModel
+from rxbackpressure.subjects.cachedservefirstsubject import CachedServeFirstSubject
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class CountingScheduler(TestScheduler):
+    def __init__(self, execution_model: ExecutionModel):
+        super().__init__(execution_model=execution_model)
+        self.n_scheduled = 0
+
+    def schedule(self, action, state=None):
+        self.n_scheduled += 1
+        return super().schedule(action, state)
+
+
+class TestExecutionModel(unittest.TestCase):
+
+    def run_frame(self, em):
+        index = em.next_frame_index(0)
+        n_items = 1
+        while index != 0:
+            index = em.next_frame_index(index)
+            n_items += 1
+        return n_items
+
+    def test_adaptive_execution_grows_short_frames(self):
+        em = AdaptiveExecution(time_slice=60.0, min_batch_size=4, max_batch_size=16).create_loop_state()
+
+        self.assertListEqual([self.run_frame(em) for _ in range(4)], [4, 8, 16, 16])
+
+    def test_adaptive_execution_shrinks_long_frames(self):
+        em = AdaptiveExecution(time_slice=0.0, min_batch_size=4, max_batch_size=16).create_loop_state()
+        em.recommended_batch_size = 16
+
+        self.assertListEqual([self.run_frame(em) for _ in range(4)], [16, 8, 4, 4])
+
+    def test_adaptive_execution_measures_each_loop(self):
+        em = AdaptiveExecution(time_slice=60.0, min_batch_size=4, max_batch_size=16)
+        loop1 = em.create_loop_state()
+        loop2 = em.create_loop_state()
+
+        self.assertListEqual([self.run_frame(loop1) for _ in range(3)], [4, 8, 16])
+        self.assertEqual(self.run_frame(loop2), 4)
+
+        # the model itself only holds the configuration
+        self.assertListEqual([self.run_frame(em) for _ in range(2)], [4, 4])
+
+    def test_time_budget_execution(self):
+        em = TimeBudgetExecution(time_budget=60.0)
+        index = em.next_frame_index(0)
+        self.assertEqual(em.next_frame_index(index), index)
+
+        em = TimeBudgetExecution(time_budget=0.0)
+        index = em.next_frame_index(0)
+        self.assertEqual(em.next_frame_index(index), 0)
+
+    def test_iterator_reschedules_every_item(self):
+        s = CountingScheduler(AlwaysAsyncExecution())
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+
+        IteratorAsObservable(iter(range(4))).unsafe_subscribe(o1, s, s)
+        s.advance_by(1)
+
+        self.assertListEqual(o1.received, [0, 1, 2, 3])
+        # the subscription and three reschedules
+        self.assertEqual(s.n_scheduled, 4)
+
+    def test_buffered_subscriber_reschedules_every_batch(self):
+        s = CountingScheduler(AlwaysAsyncExecution())
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        s1 = BufferedSubscriber(o1, s, buffer_size=10)
+
+        s1.on_next(1)
+        s.advance_by(1)
+        s1.on_next(2)
+        s.advance_by(1)
+
+        self.assertListEqual(o1.received, [1, 2])
+        # a run of the consumer per item and a reschedule after each of them
+        self.assertEqual(s.n_scheduled, 4)
+
+    def test_cached_subject_reschedules_every_buffered_item(self):
+        s = CountingScheduler(AlwaysAsyncExecution())
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        o2 = TestObserver()
+
+        subject = CachedServeFirstSubject(scheduler=s)
+        subject.unsafe_subscribe(o1, s, s)
+        subject.unsafe_subscribe(o2, s, s)
+        for v in range(4):
+            subject.on_next(v)
+
+        o2.immediate_continue = 10
+        o2.ack.on_next(continue_ack)
+        o2.ack.on_completed()
+        s.advance_by(1)
+
+        self.assertListEqual(o2.received, [0, 1, 2, 3])
+        self.assertEqual(s.n_scheduled, 3)
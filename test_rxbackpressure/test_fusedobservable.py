@@ -0,0 +1,93 @@
+import unittest
+
+from rxbackpressure.ack import Continue, continue_ack
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.observables.fusedobservable import FusedObservable
+from rxbackpressure.observables.pairwiseobservable import PairwiseObservable
+from rxbackpressure.observables.zipwithindexobservable import ZipWithIndexObservable
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestFusedObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+
+    def chain(self, source):
+        return ObservableOp(source) \
+            .map(lambda v: v + 1) \
+            .filter(lambda v: v % 2 == 0) \
+            .map_count() \
+            .pairwise()
+
+    def test_operators_are_fused(self):
+        fused = self.chain(TestObservable()).fuse()
+
+        self.assertIsInstance(fused, FusedObservable)
+        self.assertEqual(len(fused.operators), 4)
+
+    def test_items_are_sent(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.chain(s1).unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        for v in range(5):
+            ack = s1.on_next(v)
+            self.assertIsInstance(ack, Continue)
+        s1.on_completed()
+
+        self.assertListEqual(o1.received, [((2, 0), (4, 1))])
+        self.assertTrue(o1.is_completed)
+
+    def test_acknowledgment_is_returned(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        self.chain(s1).unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        s1.on_next(1)
+        s1.on_next(2)
+        ack = s1.on_next(3)
+
+        self.assertIs(ack, o1.ack)
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.assertIsInstance(ack.value, Continue)
+
+    def test_batch_is_sent(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.chain(s1).unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        s1.on_next_batch([0, 1, 2])
+        s1.on_next_batch([3, 4])
+
+        self.assertListEqual(o1.received, [((2, 0), (4, 1))])
+
+    def test_state_per_subscription(self):
+        obs = self.chain(ObservableOp.from_(range(5)))
+
+        for _ in range(2):
+            o1 = TestObserver()
+            o1.immediate_continue = 10
+            obs.subscribe(o1, self.scheduler)
+            self.scheduler.advance_by(1)
+
+            self.assertListEqual(o1.received, [((2, 0), (4, 1))])
+
+    def test_unfused_operators_use_their_stage(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        obs = PairwiseObservable(ZipWithIndexObservable(s1, selector=None))
+        obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        s1.on_next('a')
+        s1.on_next_batch(['b', 'c'])
+        s1.on_completed()
+
+        self.assertListEqual(o1.received, [(('a', 0), ('b', 1)), (('b', 1), ('c', 2))])
+        self.assertTrue(o1.is_completed)
@@ -0,0 +1,193 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from rxbackpressure.ack import Continue
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.observables.mapinprocessesobservable import MapInProcessesObservable
+from rxbackpressure.schedulers.processpoolscheduler import ProcessPoolScheduler
+from rxbackpressure.schedulers.trampolinescheduler import trampoline_scheduler
+from rxbackpressure.testing.testexecutor import TestExecutor
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+def square(v):
+    return v * v
+
+
+class TestMapInProcessesObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+        self.executor = TestExecutor()
+        self.process_scheduler = ProcessPoolScheduler(new_thread=False, executor=self.executor)
+
+    def test_results_are_emitted_in_order(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        obs = MapInProcessesObservable(s1, square, scheduler=self.process_scheduler, max_in_flight=4)
+        obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        s1.on_next(1)
+        s1.on_next(2)
+        s1.on_completed()
+
+        self.executor.complete(1)
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [])
+
+        self.executor.complete(0)
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1, 4])
+        self.assertTrue(o1.is_completed)
+
+    def test_back_pressure_while_tasks_are_in_flight(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        obs = MapInProcessesObservable(s1, square, scheduler=self.process_scheduler, max_in_flight=2)
+        obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        ack1 = s1.on_next(1)
+        ack2 = s1.on_next(2)
+        self.assertIsInstance(ack1, Continue)
+        self.assertFalse(ack2.has_value)
+
+        self.executor.complete(0)
+        self.scheduler.advance_by(1)
+        self.assertIsInstance(ack2.value, Continue)
+
+    def test_batch_is_a_single_task(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        obs = MapInProcessesObservable(s1, square, scheduler=self.process_scheduler, max_in_flight=2)
+        obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        s1.on_next_batch([1, 2, 3])
+        self.assertEqual(len(self.executor.tasks), 1)
+
+        self.executor.complete(0)
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1, 4, 9])
+
+    def test_worker_processes(self):
+        scheduler = ProcessPoolScheduler(new_thread=False, max_workers=1)
+        try:
+            result = list(ObservableOp.from_(range(10), batch_size=3)
+                          .map_in_processes(square, scheduler=scheduler)
+                          .to_iterable())
+        finally:
+            scheduler.dispose()
+
+        self.assertListEqual(result, [v * v for v in range(10)])
+
+    def subscribe_with_pool(self, s1, max_workers=None, executor_class=TestExecutor):
+        executors = []
+
+        def create_executor(max_workers):
+            executors.append(executor_class(max_workers))
+            return executors[-1]
+
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        obs = MapInProcessesObservable(s1, square, max_in_flight=2, max_workers=max_workers)
+        with mock.patch('rxbackpressure.observables.mapinprocessesobservable.ProcessPoolExecutor', create_executor):
+            disposable = obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        self.assertEqual(len(executors), 1)
+        return o1, executors[0], disposable
+
+    def test_pool_per_subscription_is_shut_down_on_completion(self):
+        s1 = TestObservable()
+        o1, executor, _ = self.subscribe_with_pool(s1, max_workers=1)
+        self.assertEqual(executor.max_workers, 1)
+
+        s1.on_next(2)
+        s1.on_completed()
+        self.assertFalse(executor.is_shutdown)
+
+        executor.complete(0)
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [4])
+        self.assertTrue(o1.is_completed)
+        self.assertTrue(executor.is_shutdown)
+
+    def test_pool_per_subscription_is_shut_down_on_dispose(self):
+        _, executor, disposable = self.subscribe_with_pool(TestObservable())
+
+        disposable.dispose()
+        self.assertTrue(executor.is_shutdown)
+
+    def test_results_are_not_emitted_on_the_worker_thread(self):
+        threads = []
+        is_emitted = threading.Event()
+
+        class ThreadObserver(TestObserver):
+            def on_next(self, v):
+                threads.append(threading.current_thread())
+                is_emitted.set()
+                return super().on_next(v)
+
+        s1 = TestObservable()
+        o1 = ThreadObserver()
+        o1.immediate_continue = 10
+        obs = MapInProcessesObservable(s1, square, scheduler=self.process_scheduler, max_in_flight=2)
+        obs.unsafe_subscribe(o1, trampoline_scheduler, trampoline_scheduler)
+
+        s1.on_next(2)
+        worker = threading.Thread(target=self.executor.complete, args=(0,))
+        worker.start()
+        worker.join()
+
+        self.assertTrue(is_emitted.wait(timeout=5))
+        self.assertListEqual(o1.received, [4])
+        self.assertIsNot(threads[0], worker)
+
+    def test_dispose_does_not_shut_down_pool_during_submit(self):
+        calls = []
+        is_submitting = threading.Event()
+
+        class SlowExecutor(TestExecutor):
+            def submit(self, func, *args):
+                is_submitting.set()
+                time.sleep(0.05)
+                if self.is_shutdown:
+                    raise RuntimeError('cannot schedule new futures after shutdown')
+                calls.append('submit')
+                return super().submit(func, *args)
+
+            def shutdown(self, wait=True):
+                calls.append('shutdown')
+                super().shutdown(wait)
+
+        s1 = TestObservable()
+        _, _, disposable = self.subscribe_with_pool(s1, executor_class=SlowExecutor)
+
+        producer = threading.Thread(target=s1.on_next, args=(2,))
+        producer.start()
+        self.assertTrue(is_submitting.wait(timeout=5))
+        disposable.dispose()
+        producer.join()
+
+        self.assertListEqual(calls, ['submit', 'shutdown'])
+
+    def test_given_scheduler_is_not_shut_down(self):
+        s1 = TestObservable()
+        obs = MapInProcessesObservable(s1, square, scheduler=self.process_scheduler, max_in_flight=2)
+        obs.unsafe_subscribe(TestObserver(), self.scheduler, self.scheduler)
+
+        s1.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertFalse(self.executor.is_shutdown)
+
+    def test_worker_processes_per_subscription(self):
+        result = list(ObservableOp.from_(range(10), batch_size=3)
+                      .map_in_processes(square, max_workers=1)
+                      .to_iterable())
+
+        self.assertListEqual(result, [v * v for v in range(10)])
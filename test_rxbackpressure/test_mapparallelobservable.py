@@ -0,0 +1,139 @@
+import unittest
+from unittest import mock
+
+from rxbackpressure.ack import Continue
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.observables.mapparallelobservable import MapParallelObservable
+from rxbackpressure.testing.testexecutor import TestExecutor
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class ManualScheduler:
+    """ collects the scheduled actions, which are run by the test
+    """
+
+    def __init__(self):
+        self.actions = []
+
+    def schedule(self, action, state=None):
+        self.actions.append((action, state))
+
+    def run(self, idx):
+        action, state = self.actions[idx]
+        action(self, state)
+
+
+class TestMapParallelObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+        self.pool = ManualScheduler()
+
+    def subscribe(self, s1, concurrency, selector=lambda v: v * 2):
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        obs = MapParallelObservable(s1, selector, concurrency=concurrency, scheduler=self.pool)
+        obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+        return o1
+
+    def test_results_are_emitted_in_order(self):
+        s1 = TestObservable()
+        o1 = self.subscribe(s1, concurrency=4)
+
+        s1.on_next(1)
+        s1.on_next(2)
+        s1.on_next(3)
+        s1.on_completed()
+
+        self.pool.run(2)
+        self.pool.run(1)
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [])
+
+        self.pool.run(0)
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [2, 4, 6])
+        self.assertTrue(o1.is_completed)
+
+    def test_acknowledge_when_slot_is_free(self):
+        s1 = TestObservable()
+        o1 = self.subscribe(s1, concurrency=2)
+
+        self.assertIsInstance(s1.on_next(1), Continue)
+        ack = s1.on_next(2)
+        self.assertFalse(ack.has_value)
+
+        # a later item does not free a slot
+        self.pool.run(1)
+        self.scheduler.advance_by(1)
+        self.assertFalse(ack.has_value)
+
+        self.pool.run(0)
+        self.scheduler.advance_by(1)
+        self.assertIsInstance(ack.value, Continue)
+        self.assertListEqual(o1.received, [2, 4])
+
+    def test_error_in_selector(self):
+        s1 = TestObservable()
+        o1 = self.subscribe(s1, concurrency=2, selector=lambda v: 1 / v)
+
+        s1.on_next(0)
+        self.pool.run(0)
+        self.scheduler.advance_by(1)
+
+        self.assertIsInstance(o1.was_thrown, ZeroDivisionError)
+
+    def subscribe_with_pool(self, s1, concurrency):
+        executors = []
+
+        def create_executor(max_workers):
+            executors.append(TestExecutor(max_workers))
+            return executors[-1]
+
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        obs = MapParallelObservable(s1, lambda v: v * 2, concurrency=concurrency)
+        with mock.patch('rxbackpressure.observables.mapparallelobservable.ThreadPoolExecutor', create_executor):
+            disposable = obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+        return o1, executors[0], disposable
+
+    def test_pool_per_subscription_is_shut_down_on_completion(self):
+        s1 = TestObservable()
+        o1, executor, _ = self.subscribe_with_pool(s1, concurrency=3)
+        self.assertEqual(executor.max_workers, 3)
+
+        s1.on_next_batch([1, 2])
+        s1.on_completed()
+        self.assertFalse(executor.is_shutdown)
+
+        executor.complete(0)
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [2, 4])
+        self.assertTrue(o1.is_completed)
+        self.assertTrue(executor.is_shutdown)
+
+    def test_pool_per_subscription_is_shut_down_on_error(self):
+        s1 = TestObservable()
+        o1, executor, _ = self.subscribe_with_pool(s1, concurrency=2)
+
+        s1.on_error(ValueError())
+        self.scheduler.advance_by(1)
+        self.assertIsInstance(o1.was_thrown, ValueError)
+        self.assertTrue(executor.is_shutdown)
+
+    def test_pool_per_subscription_is_shut_down_on_dispose(self):
+        s1 = TestObservable()
+        _, executor, disposable = self.subscribe_with_pool(s1, concurrency=2)
+
+        disposable.dispose()
+        self.assertTrue(executor.is_shutdown)
+
+    def test_thread_pool_per_subscription(self):
+        result = list(ObservableOp.from_(range(10))
+                      .map_parallel(lambda v: v * 2, concurrency=2)
+                      .to_iterable())
+
+        self.assertListEqual(result, [v * 2 for v in range(10)])
@@ -0,0 +1,87 @@
+import unittest
+
+from rxbackpressure.ack import Continue, Stop, continue_ack, stop_ack
+from rxbackpressure.observables.mergemapobservable import MergeMapObservable
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestMergeMapObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+        self.inner = [TestObservable(), TestObservable(), TestObservable()]
+
+    def subscribe(self, s1, o1, max_concurrent):
+        obs = MergeMapObservable(s1, lambda v: self.inner[v], max_concurrent=max_concurrent)
+        obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+    def test_inner_items_are_interleaved(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.subscribe(s1, o1, max_concurrent=2)
+
+        s1.on_next(0)
+        s1.on_next(1)
+        self.scheduler.advance_by(1)
+        self.inner[0].on_next('a')
+        self.inner[1].on_next('b')
+        self.inner[0].on_next('c')
+
+        self.assertListEqual(o1.received, ['a', 'b', 'c'])
+
+    def test_source_is_back_pressured_while_slots_are_busy(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        self.subscribe(s1, o1, max_concurrent=2)
+
+        self.assertIsInstance(s1.on_next(0), Continue)
+        ack = s1.on_next(1)
+        self.scheduler.advance_by(1)
+        self.assertFalse(ack.has_value)
+
+        self.inner[0].on_completed()
+        self.assertIsInstance(ack.value, Continue)
+
+    def test_acknowledgments_are_routed_to_inner_observables(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        self.subscribe(s1, o1, max_concurrent=2)
+        s1.on_next(0)
+        s1.on_next(1)
+        self.scheduler.advance_by(1)
+
+        ack_a = self.inner[0].on_next('a')
+        ack_b = self.inner[1].on_next('b')
+        self.assertListEqual(o1.received, ['a'])
+        self.assertFalse(ack_b.has_value)
+
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertIsInstance(ack_a.value, Continue)
+        self.assertListEqual(o1.received, ['a', 'b'])
+        self.assertFalse(ack_b.has_value)
+
+        o1.ack.on_next(stop_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertIsInstance(ack_b.value, Stop)
+
+    def test_completes_after_source_and_inner_observables(self):
+        s1 = TestObservable()
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.subscribe(s1, o1, max_concurrent=2)
+
+        s1.on_next(0)
+        s1.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertFalse(o1.is_completed)
+
+        self.inner[0].on_next('a')
+        self.inner[0].on_completed()
+        self.assertTrue(o1.is_completed)
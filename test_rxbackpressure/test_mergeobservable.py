@@ -0,0 +1,107 @@
+import unittest
+
+from rxbackpressure.ack import Continue, Stop, continue_ack, stop_ack
+from rxbackpressure.observables.mergeobservable import MergeObservable
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestMergeObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+        self.sources = [TestObservable(), TestObservable(), TestObservable()]
+
+    def subscribe(self, o1):
+        obs = MergeObservable(self.sources)
+        obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+    def test_items_are_forwarded_as_they_arrive(self):
+        s1, s2, s3 = self.sources
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.subscribe(o1)
+
+        self.assertIsInstance(s1.on_next(1), Continue)
+        self.assertIsInstance(s3.on_next(3), Continue)
+        self.assertIsInstance(s2.on_next_batch([2, 2]), Continue)
+        self.assertIsInstance(s1.on_next(1), Continue)
+
+        self.assertListEqual(o1.received, [1, 3, 2, 2, 1])
+
+    def test_source_is_held_back_until_its_item_is_acknowledged(self):
+        s1, s2, _ = self.sources
+        o1 = TestObserver()
+        self.subscribe(o1)
+
+        ack1 = s1.on_next(1)
+        ack2 = s2.on_next(2)
+        self.assertFalse(ack1.has_value)
+        self.assertFalse(ack2.has_value)
+        self.assertListEqual(o1.received, [1])
+
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertIsInstance(ack1.value, Continue)
+        self.assertFalse(ack2.has_value)
+        self.assertListEqual(o1.received, [1, 2])
+
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertIsInstance(ack2.value, Continue)
+
+    def test_stop_is_forwarded_to_all_waiting_sources(self):
+        s1, s2, s3 = self.sources
+        o1 = TestObserver()
+        self.subscribe(o1)
+
+        ack1 = s1.on_next(1)
+        ack2 = s2.on_next(2)
+        ack3 = s3.on_next(3)
+
+        o1.ack.on_next(stop_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertIsInstance(ack1.value, Stop)
+        self.assertIsInstance(ack2.value, Stop)
+        self.assertIsInstance(ack3.value, Stop)
+        self.assertListEqual(o1.received, [1])
+
+    def test_completes_after_all_sources(self):
+        s1, s2, s3 = self.sources
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.subscribe(o1)
+
+        s1.on_completed()
+        s2.on_next(2)
+        s2.on_completed()
+        self.assertFalse(o1.is_completed)
+
+        s3.on_completed()
+        self.assertTrue(o1.is_completed)
+        self.assertListEqual(o1.received, [2])
+
+    def test_error_is_forwarded_after_pending_items(self):
+        s1, s2, _ = self.sources
+        o1 = TestObserver()
+        self.subscribe(o1)
+
+        s1.on_next(1)
+        s2.on_next(2)
+        s1.on_error(ValueError('e'))
+        self.assertFalse(o1.was_thrown)
+
+        for _ in range(2):
+            o1.ack.on_next(continue_ack)
+            o1.ack.on_completed()
+            self.scheduler.advance_by(1)
+
+        self.assertListEqual(o1.received, [1, 2])
+        self.assertTrue(o1.was_thrown)
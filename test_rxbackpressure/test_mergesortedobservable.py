@@ -0,0 +1,162 @@
+import random
+import unittest
+
+from rxbackpressure.ack import Continue, Stop, continue_ack, stop_ack
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.observables.mergesortedobservable import MergeSortedObservable
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestMergeSortedObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+        self.sources = [TestObservable(), TestObservable(), TestObservable()]
+
+    def subscribe(self, o1, key=None):
+        obs = MergeSortedObservable(self.sources, key=key)
+        obs.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+
+    def test_waits_for_a_head_of_each_source(self):
+        s1, s2, s3 = self.sources
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.subscribe(o1)
+
+        ack1 = s1.on_next(3)
+        ack2 = s2.on_next(1)
+        self.assertListEqual(o1.received, [])
+
+        # the lowest head is emitted and only its source is acknowledged
+        self.assertFalse(s3.on_next(2).has_value)
+        self.assertListEqual(o1.received, [1])
+        self.assertIsInstance(ack2.value, Continue)
+        self.assertFalse(ack1.has_value)
+
+    def test_caller_gets_acknowledgment_of_observer(self):
+        s1, s2, _ = self.sources
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        self.subscribe(o1)
+        self.sources[2].on_completed()
+
+        s1.on_next(5)
+        self.assertIsInstance(s2.on_next(1), Continue)
+        self.assertIsInstance(s2.on_next(2), Continue)
+        ack = s2.on_next(7)
+        self.assertFalse(ack.has_value)
+        self.assertListEqual(o1.received, [1, 2, 5])
+
+    def test_completed_sources_are_drained(self):
+        s1, s2, s3 = self.sources
+        o1 = TestObserver()
+        self.subscribe(o1, key=lambda v: -v)
+
+        s1.on_next(1)
+        s1.on_completed()
+        s2.on_next(3)
+        s2.on_completed()
+        s3.on_completed()
+        self.assertListEqual(o1.received, [3])
+
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [3, 1])
+        self.assertFalse(o1.is_completed)
+
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertTrue(o1.is_completed)
+
+    def test_stop_is_forwarded_to_all_sources(self):
+        s1, s2, s3 = self.sources
+        o1 = TestObserver()
+        self.subscribe(o1)
+
+        ack1 = s1.on_next(1)
+        ack2 = s2.on_next(2)
+        ack3 = s3.on_next(3)
+
+        o1.ack.on_next(stop_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertIsInstance(ack1.value, Stop)
+        self.assertIsInstance(ack2.value, Stop)
+        self.assertIsInstance(ack3.value, Stop)
+
+    def test_completion_during_pending_acknowledgment_waits_for_it(self):
+        s1, s2, s3 = self.sources
+        o1 = TestObserver()
+        self.subscribe(o1)
+        s3.on_completed()
+
+        s1.on_next(5)
+        ack2 = s2.on_next(1)
+        self.assertListEqual(o1.received, [1])
+        self.assertFalse(ack2.has_value)
+
+        # the completed source releases the head of s1, but the observer has not acknowledged 1 yet
+        s2.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1])
+
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1, 5])
+        self.assertFalse(o1.is_completed)
+
+        s1.on_completed()
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertTrue(o1.is_completed)
+
+    def test_iterables_wait_for_asynchronous_acknowledgments(self):
+        o1 = TestObserver()
+        ObservableOp.from_([5]).merge_sorted(ObservableOp.from_([1])) \
+            .subscribe(o1, self.scheduler, self.scheduler)
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1])
+
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertListEqual(o1.received, [1, 5])
+
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertTrue(o1.is_completed)
+
+    def test_error_is_forwarded_once(self):
+        s1, s2, s3 = self.sources
+        errors = []
+
+        class ErrorObserver(TestObserver):
+            def on_error(self, err):
+                errors.append(err)
+
+        o1 = ErrorObserver()
+        self.subscribe(o1)
+
+        ack1 = s1.on_next(1)
+        s2.on_error(ValueError())
+        s3.on_error(KeyError())
+
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertIsInstance(ack1.value, Stop)
+        self.assertIsInstance(s3.on_next(2), Stop)
+
+    def test_merges_sorted_iterables(self):
+        rnd = random.Random(7)
+        lists = [sorted(rnd.randint(0, 50) for _ in range(rnd.randint(0, 30))) for _ in range(5)]
+
+        obs = ObservableOp.merge_sorted(*[ObservableOp.from_(l) for l in lists])
+        self.assertListEqual(list(obs.to_iterable()), sorted(v for l in lists for v in l))
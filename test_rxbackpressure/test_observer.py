@@ -0,0 +1,44 @@
+import unittest
+
+from rxbackpressure.ack import Continue, Stop, continue_ack, stop_ack
+from rxbackpressure.testing.testobserver import TestObserver
+
+
+class TestObserverBatch(unittest.TestCase):
+
+    def test_unbatch_synchronous_observer(self):
+        o1 = TestObserver()
+        o1.immediate_continue = 3
+
+        ack = o1.on_next_batch([1, 2, 3])
+
+        self.assertIsInstance(ack, Continue)
+        self.assertListEqual(o1.received, [1, 2, 3])
+
+    def test_unbatch_asynchronous_observer(self):
+        o1 = TestObserver()
+
+        ack = o1.on_next_batch([1, 2, 3])
+        self.assertListEqual(o1.received, [1])
+        self.assertFalse(ack.has_value)
+
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.assertListEqual(o1.received, [1, 2])
+        self.assertFalse(ack.has_value)
+
+        o1.immediate_continue = 1
+        o1.ack.on_next(continue_ack)
+        o1.ack.on_completed()
+        self.assertListEqual(o1.received, [1, 2, 3])
+        self.assertIsInstance(ack.value, Continue)
+
+    def test_unbatch_stops_on_stop(self):
+        o1 = TestObserver()
+
+        ack = o1.on_next_batch([1, 2, 3])
+        o1.ack.on_next(stop_ack)
+        o1.ack.on_completed()
+
+        self.assertListEqual(o1.received, [1])
+        self.assertIsInstance(ack.value, Stop)
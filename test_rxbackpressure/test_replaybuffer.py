@@ -0,0 +1,37 @@
+import unittest
+
+from rxbackpressure.internal.replaybuffer import ReplayBuffer
+
+
+class TestReplayBuffer(unittest.TestCase):
+
+    def test_snapshot_is_not_affected_by_append_and_eviction(self):
+        buffer = ReplayBuffer(buffer_size=5, chunk_size=2)
+        for v in range(4):
+            buffer.append(v)
+
+        snapshot = buffer.snapshot()
+        for v in range(4, 10):
+            buffer.append(v)
+
+        self.assertListEqual(list(snapshot), [0, 1, 2, 3])
+        self.assertListEqual(list(buffer.snapshot()), [5, 6, 7, 8, 9])
+        self.assertEqual(len(buffer.chunks), 3)
+
+    def test_evict_by_age(self):
+        buffer = ReplayBuffer(window=2.0)
+        buffer.append(1, now=0.0)
+        buffer.append(2, now=1.0)
+        buffer.append(3, now=2.5)
+
+        self.assertListEqual(list(buffer.snapshot(now=2.5)), [2, 3])
+        self.assertListEqual(list(buffer.snapshot(now=4.0)), [3])
+
+    def test_evict_by_size(self):
+        buffer = ReplayBuffer(max_bytes=10, size_of=len)
+        buffer.append('abcd')
+        buffer.append('efgh')
+        buffer.append('ijkl')
+
+        self.assertListEqual(list(buffer.snapshot()), ['efgh', 'ijkl'])
+        self.assertEqual(buffer.n_bytes, 8)
@@ -1,5 +1,9 @@
+import time
 import unittest
 
+from rxbackpressure.ack import Continue
+from rxbackpressure.subjects.replaysubject import ReplaySubject
+from rxbackpressure.testing.testobserver import TestObserver
 from rxbackpressure.testing.testscheduler import TestScheduler
 
 
@@ -9,4 +13,52 @@ class TestReplaySubject(unittest.TestCase):
     def setUp(self):
         self.scheduler = TestScheduler()
 
+    def test_late_subscriber_receives_last_items(self):
+        subject = ReplaySubject(buffer_size=2)
 
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        subject.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+        self.scheduler.advance_by(1)
+
+        for v in range(5):
+            ack = subject.on_next(v)
+            self.assertIsInstance(ack, Continue)
+        self.assertListEqual(o1.received, [0, 1, 2, 3, 4])
+
+        o2 = TestObserver()
+        o2.immediate_continue = 10
+        subject.unsafe_subscribe(o2, self.scheduler, self.scheduler)
+        self.scheduler.advance_by(1)
+
+        self.assertListEqual(o2.received, [3, 4])
+
+    def test_items_older_than_window_are_evicted(self):
+        subject = ReplaySubject(window=1.0, scheduler=self.scheduler)
+
+        subject.on_next(1)
+        self.scheduler.advance_by(600)
+        subject.on_next(2)
+        self.scheduler.advance_by(600)
+
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        subject.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+        self.scheduler.advance_by(1)
+
+        self.assertListEqual(o1.received, [2])
+
+    def test_window_without_scheduler(self):
+        subject = ReplaySubject(window=0.05)
+
+        subject.on_next(1)
+        time.sleep(0.1)
+        subject.on_next(2)
+        subject.on_next(3)
+
+        o1 = TestObserver()
+        o1.immediate_continue = 10
+        subject.unsafe_subscribe(o1, self.scheduler, self.scheduler)
+        self.scheduler.advance_by(1)
+
+        self.assertListEqual(o1.received, [2, 3])
@@ -0,0 +1,42 @@
+import unittest
+
+from rxbackpressure.internal.nolock import NoLock, create_lock
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.schedulers.currentthreadscheduler import CurrentThreadScheduler
+
+
+class TestSingleThreaded(unittest.TestCase):
+
+    def test_scheduler_flag(self):
+        self.assertTrue(CurrentThreadScheduler(single_threaded=True).is_single_threaded)
+        self.assertFalse(CurrentThreadScheduler().is_single_threaded)
+
+    def test_zip(self):
+        received = []
+        ObservableOp.from_(range(100)).zip(ObservableOp.from_(range(100))) \
+            .subscribe_with(on_next=received.append, single_threaded=True)
+
+        self.assertListEqual(received, [(v, v) for v in range(100)])
+
+    def test_subject_uses_no_lock(self):
+        received = []
+        source = ObservableOp.from_(range(100))
+        shared = source.share(single_threaded=True)
+
+        shared.zip(shared.map(lambda v: v + 1)).subscribe_with(on_next=received.append, single_threaded=True)
+
+        self.assertListEqual(received, [(v, v + 1) for v in range(100)])
+        self.assertIsInstance(shared.observable.source.subject.lock, NoLock)
+
+    def test_subject_keeps_its_lock(self):
+        received = []
+        shared = ObservableOp.from_(range(10)).share()
+
+        shared.zip(shared).subscribe_with(on_next=received.append, single_threaded=True)
+
+        self.assertListEqual(received, [(v, v) for v in range(10)])
+        self.assertNotIsInstance(shared.observable.source.subject.lock, NoLock)
+
+    def test_create_lock(self):
+        self.assertIsInstance(create_lock(single_threaded=True), NoLock)
+        self.assertNotIsInstance(create_lock(), NoLock)
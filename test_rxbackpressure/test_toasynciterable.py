@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+
+from rx.core import Disposable
+
+from rxbackpressure.ack import Continue, Stop
+from rxbackpressure.asyncio.toasynciterable import to_async_iterable
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestToAsyncIterable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_loop(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_ack_is_completed_when_next_item_is_awaited(self):
+        s1 = TestObservable()
+        iterator = to_async_iterable(s1, self.scheduler)
+
+        # the observable is subscribed when the iteration starts
+        first = self.loop.create_task(iterator.__anext__())
+        self.run_loop(asyncio.sleep(0))
+
+        ack = s1.on_next(1)
+        self.assertEqual(self.run_loop(first), 1)
+        self.assertFalse(ack.has_value)
+
+        second = self.loop.create_task(iterator.__anext__())
+        self.run_loop(asyncio.sleep(0))
+        self.assertIsInstance(ack.value, Continue)
+
+        s1.on_completed()
+        self.assertRaises(StopAsyncIteration, self.run_loop, second)
+
+    def test_prefetch(self):
+        s1 = TestObservable()
+        iterator = to_async_iterable(s1, self.scheduler, prefetch=2)
+        self.loop.create_task(iterator.__anext__())
+        self.run_loop(asyncio.sleep(0))
+
+        acks = [s1.on_next(v) for v in range(1, 4)]
+        self.assertIsInstance(acks[0], Continue)
+        self.assertIsInstance(acks[1], Continue)
+        self.assertFalse(acks[2].has_value)
+
+    def test_error_is_raised_after_buffered_items(self):
+        s1 = TestObservable()
+        iterator = to_async_iterable(s1, self.scheduler, prefetch=2)
+        first = self.loop.create_task(iterator.__anext__())
+        self.run_loop(asyncio.sleep(0))
+
+        s1.on_next(1)
+        s1.on_error(ValueError())
+
+        self.assertEqual(self.run_loop(first), 1)
+        self.assertRaises(ValueError, self.run_loop, iterator.__anext__())
+
+    def test_closing_iterator_stops_source(self):
+        s1 = TestObservable()
+        iterator = to_async_iterable(s1, self.scheduler)
+        first = self.loop.create_task(iterator.__anext__())
+        self.run_loop(asyncio.sleep(0))
+
+        ack = s1.on_next(1)
+        self.assertEqual(self.run_loop(first), 1)
+
+        self.run_loop(iterator.aclose())
+        self.assertIsInstance(ack.value, Stop)
+
+    def test_closing_iterator_disposes_subscription(self):
+        disposed = []
+
+        class DisposableObservable(TestObservable):
+            def unsafe_subscribe(self, observer, scheduler, subscribe_scheduler):
+                super().unsafe_subscribe(observer, scheduler, subscribe_scheduler)
+                return Disposable.create(lambda: disposed.append(True))
+
+        s1 = DisposableObservable()
+        iterator = to_async_iterable(s1, self.scheduler)
+        first = self.loop.create_task(iterator.__anext__())
+        self.run_loop(asyncio.sleep(0))
+
+        s1.on_next(1)
+        self.assertEqual(self.run_loop(first), 1)
+        self.assertListEqual(disposed, [])
+
+        self.run_loop(iterator.aclose())
+        self.assertListEqual(disposed, [True])
+
+    def test_synchronous_source(self):
+        async def collect():
+            return [v async for v in ObservableOp.from_(range(100)).to_async_iterable(prefetch=10)]
+
+        self.assertListEqual(self.run_loop(collect()), list(range(100)))
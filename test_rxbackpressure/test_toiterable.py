@@ -0,0 +1,64 @@
+import unittest
+
+from rxbackpressure.ack import Continue, continue_ack
+from rxbackpressure.blocking.toiterable import to_iterable
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestToIterable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+
+    def test_back_pressure_until_items_are_taken(self):
+        s1 = TestObservable()
+        iterator = iter(to_iterable(s1, self.scheduler, prefetch=2))
+
+        ack1 = s1.on_next(1)
+        ack2 = s1.on_next(2)
+        self.assertIsInstance(ack1, Continue)
+        self.assertFalse(ack2.has_value)
+
+        self.assertEqual(next(iterator), 1)
+        self.assertIsInstance(ack2.value, Continue)
+
+        s1.on_completed()
+        self.assertListEqual(list(iterator), [2])
+
+    def test_error_is_raised_after_buffered_items(self):
+        s1 = TestObservable()
+        iterator = iter(to_iterable(s1, self.scheduler))
+
+        s1.on_next(1)
+        s1.on_error(ValueError())
+
+        self.assertEqual(next(iterator), 1)
+        self.assertRaises(ValueError, next, iterator)
+
+    def test_batches(self):
+        s1 = TestObservable()
+        iterator = iter(to_iterable(s1, self.scheduler, batch_size=2))
+
+        s1.on_next_batch([1, 2, 3])
+        s1.on_completed()
+
+        self.assertListEqual(list(iterator), [[1, 2], [3]])
+
+    def test_synchronous_source_is_pulled_by_consumer(self):
+        iterable = ObservableOp.from_(range(100)).to_iterable(prefetch=10)
+
+        self.assertListEqual(list(iterable), list(range(100)))
+
+    def test_zero_prefetch_hands_over_one_item_at_a_time(self):
+        s1 = TestObservable()
+        iterator = iter(to_iterable(s1, self.scheduler, prefetch=0))
+
+        ack1 = s1.on_next(1)
+        self.assertFalse(ack1.has_value)
+
+        self.assertEqual(next(iterator), 1)
+        self.assertIsInstance(ack1.value, Continue)
+
+        self.assertListEqual(list(ObservableOp.from_(range(10)).to_iterable(prefetch=0)), list(range(10)))
@@ -0,0 +1,103 @@
+import datetime
+import threading
+import time
+import unittest
+from unittest import mock
+
+from rxbackpressure.schedulers.trampolinescheduler import TrampolineScheduler
+
+
+class TestTrampolineScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TrampolineScheduler()
+
+    def test_nested_actions_are_queued(self):
+        executed = []
+
+        def inner(_, state):
+            executed.append(state)
+
+        def outer(scheduler, _):
+            scheduler.schedule(inner, 2)
+            scheduler.schedule(inner, 3)
+            executed.append(1)
+
+        self.scheduler.schedule(outer)
+        self.assertListEqual(executed, [1, 2, 3])
+
+    def test_disposed_action_is_not_executed(self):
+        executed = []
+
+        def outer(scheduler, _):
+            disposable = scheduler.schedule(lambda _, __: executed.append(2))
+            disposable.dispose()
+            executed.append(1)
+
+        self.scheduler.schedule(outer)
+        self.assertListEqual(executed, [1])
+
+    def test_queue_is_released_after_error(self):
+        def fail(_, __):
+            raise ValueError()
+
+        self.assertRaises(ValueError, self.scheduler.schedule, fail)
+
+        executed = []
+        self.scheduler.schedule(lambda _, __: executed.append(1))
+        self.assertListEqual(executed, [1])
+
+    def test_each_thread_has_its_own_queue(self):
+        executed = []
+
+        def other_thread(_, __):
+            executed.append('other')
+
+        def outer(scheduler, _):
+            # the trampoline of the current thread does not defer an action scheduled on another thread
+            thread = threading.Thread(target=lambda: scheduler.schedule(other_thread))
+            thread.start()
+            thread.join()
+            executed.append('current')
+
+        self.scheduler.schedule(outer)
+        self.assertListEqual(executed, ['other', 'current'])
+
+    def test_delayed_actions_are_executed_by_due_time(self):
+        executed = []
+
+        def outer(scheduler, _):
+            scheduler.schedule_relative(200, lambda _, __: executed.append('200ms'))
+            scheduler.schedule_relative(10, lambda _, __: executed.append('10ms'))
+            scheduler.schedule(lambda _, __: executed.append('now'))
+
+        self.scheduler.schedule(outer)
+        self.assertListEqual(executed, ['now', '10ms', '200ms'])
+
+    def test_schedule_absolute_uses_now(self):
+        executed = []
+
+        now = self.scheduler.now
+        self.assertIsInstance(now, datetime.datetime)
+
+        self.scheduler.schedule_absolute(now + datetime.timedelta(milliseconds=20),
+                                         lambda scheduler, _: executed.append(scheduler.now))
+        self.assertEqual(len(executed), 1)
+        self.assertLessEqual(now + datetime.timedelta(milliseconds=20), executed[0])
+
+    def test_delayed_actions_do_not_depend_on_wall_clock(self):
+        executed = []
+        clock = iter([datetime.datetime(2030, 1, 1), datetime.datetime(2000, 1, 1)] * 10)
+
+        def outer(scheduler, _):
+            scheduler.schedule_relative(20, lambda _, __: executed.append('20ms'))
+            scheduler.schedule_relative(10, lambda _, __: executed.append('10ms'))
+
+        # the system clock jumps back and forth while the actions are delayed
+        with mock.patch.object(TrampolineScheduler, 'now', new_callable=mock.PropertyMock,
+                               side_effect=lambda: next(clock)):
+            start = time.monotonic()
+            self.scheduler.schedule(outer)
+
+        self.assertListEqual(executed, ['10ms', '20ms'])
+        self.assertLess(time.monotonic() - start, 1.0)
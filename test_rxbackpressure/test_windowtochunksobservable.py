@@ -0,0 +1,126 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from rxbackpressure.ack import Continue
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.observables.windowtochunksobservable import WindowToChunksObservable
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+from rxbackpressure.timevaluechunk import TimeValueChunk
+
+
+class TestWindowToChunksObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+        self.left = TestObservable()
+        self.right = TestObservable()
+        self.observer = TestObserver()
+
+    def subscribe(self, is_chunked=False):
+        if is_chunked:
+            obs = WindowToChunksObservable(self.left, self.right, lambda l, r: r < l, lambda l, r: l + 1 < r,
+                                           is_chunked=True)
+        else:
+            obs = WindowToChunksObservable(self.left, self.right, lambda l, r: r < l, lambda l, r: l + 1 < r)
+        obs.unsafe_subscribe(self.observer, self.scheduler, self.scheduler)
+
+    def test_collects_items_of_each_window(self):
+        self.observer.immediate_continue = 10
+        self.subscribe()
+
+        left_ack = self.left.on_next(2)
+        self.assertIsInstance(self.right.on_next(1), Continue)
+        self.assertIsInstance(self.right.on_next(2), Continue)
+        self.assertIsInstance(self.right.on_next(3), Continue)
+        self.assertFalse(left_ack.has_value)
+
+        right_ack = self.right.on_next(5)
+        self.assertIsInstance(left_ack.value, Continue)
+        self.assertFalse(right_ack.has_value)
+        self.assertListEqual(self.observer.received, [(2, [2, 3])])
+
+        # the right item 5 is in the window of 4
+        left_ack = self.left.on_next(4)
+        self.assertIsInstance(right_ack.value, Continue)
+        self.assertFalse(left_ack.has_value)
+
+        self.right.on_next(9)
+        self.assertIsInstance(left_ack.value, Continue)
+        self.assertListEqual(self.observer.received, [(2, [2, 3]), (4, [5])])
+
+    def test_left_is_back_pressured_by_observer(self):
+        self.subscribe()
+
+        left_ack = self.left.on_next(1)
+        self.right.on_next(1)
+        right_ack = self.right.on_next(5)
+        self.assertListEqual(self.observer.received, [(1, [1])])
+        self.assertFalse(left_ack.has_value)
+        self.assertFalse(right_ack.has_value)
+
+        self.observer.ack.on_next(Continue())
+        self.observer.ack.on_completed()
+        self.assertIsInstance(left_ack.value, Continue)
+
+        left_ack = self.left.on_next(4)
+        self.assertIsInstance(right_ack.value, Continue)
+        self.assertFalse(left_ack.has_value)
+
+    def test_last_window_is_emitted_on_completion(self):
+        self.observer.immediate_continue = 10
+        self.subscribe()
+
+        self.left.on_next(1)
+        self.right.on_next(1)
+        self.right.on_completed()
+
+        self.assertListEqual(self.observer.received, [(1, [1])])
+        self.assertTrue(self.observer.is_completed)
+
+    @unittest.skipIf(np is None, 'requires NumPy')
+    def test_chunked_windows_are_views(self):
+        self.observer.immediate_continue = 10
+        self.subscribe(is_chunked=True)
+
+        chunk = np.arange(10)
+        self.left.on_next(2)
+        self.assertFalse(self.right.on_next(chunk).has_value)
+        self.left.on_next(4)
+        self.left.on_next(6)
+
+        windows = [w for _, w in self.observer.received]
+        np.testing.assert_array_equal(windows[0], [2, 3])
+        np.testing.assert_array_equal(windows[1], [4, 5])
+        np.testing.assert_array_equal(windows[2], [6, 7])
+        self.assertTrue(all(np.shares_memory(w, chunk) for w in windows))
+
+    @unittest.skipIf(np is None, 'requires NumPy')
+    def test_chunked_matches_item_windows(self):
+        timestamps = np.sort(np.random.RandomState(0).randint(0, 1000, 500))
+        lefts = list(range(0, 1000, 7))
+
+        def is_lower(l, r):
+            return r < l
+
+        def is_higher(l, r):
+            return l + 7 <= r
+
+        items = list(ObservableOp.from_(lefts).window_to_chunks(ObservableOp.from_(list(timestamps)),
+                                                                 is_lower, is_higher).to_iterable())
+
+        chunks = [TimeValueChunk(timestamps[i:i + 64], timestamps[i:i + 64]) for i in range(0, 500, 64)]
+        windows = list(ObservableOp.from_(lefts).window_to_chunks(
+            ObservableOp.from_(chunks),
+            lambda l, c: is_lower(l, c.timestamps), lambda l, c: is_higher(l, c.timestamps),
+            is_chunked=True).to_iterable())
+
+        self.assertEqual(len(items), len(windows))
+        for (l1, w1), (l2, w2) in zip(items, windows):
+            self.assertEqual(l1, l2)
+            self.assertListEqual(list(w1), list(w2.values))
@@ -78,3 +78,43 @@ class TestConnectableSubscriber(unittest.TestCase):
         self.scheduler.advance_by(1)
         self.assertEqual(self.o.received, [])
         self.assertIsInstance(ack.value, Stop)
+
+    def test_zip_batches_of_different_size(self):
+        Zip2Observable(self.s1, self.s2) \
+            .subscribe(self.o, self.scheduler)
+
+        self.o.immediate_continue = 2
+
+        ack1 = self.s1.on_next_batch([1, 2, 3])
+        self.assertFalse(ack1.has_value)
+        ack2 = self.s2.on_next_batch([4, 5])
+        self.assertListEqual(self.o.received, [(1, 4), (2, 5)])
+        self.assertIsInstance(ack2, Continue)
+        self.assertFalse(ack1.has_value)
+
+        ack2 = self.s2.on_next_batch([6, 7])
+        self.assertListEqual(self.o.received, [(1, 4), (2, 5), (3, 6)])
+        self.assertFalse(ack1.has_value)
+        self.assertFalse(ack2.has_value)
+
+        self.o.ack.on_next(Continue())
+        self.o.ack.on_completed()
+        self.assertIsInstance(ack1.value, Continue)
+        self.assertFalse(ack2.has_value)
+
+    def test_zip_batch_with_single_items(self):
+        Zip2Observable(self.s1, self.s2) \
+            .subscribe(self.o, self.scheduler)
+
+        self.o.immediate_continue = 2
+
+        ack1 = self.s1.on_next_batch([1, 2])
+        ack2 = self.s2.on_next(3)
+        self.assertIsInstance(ack2, Continue)
+        ack2 = self.s2.on_next(4)
+        self.assertIsInstance(ack2, Continue)
+        self.assertIsInstance(ack1.value, Continue)
+        self.assertListEqual(self.o.received, [(1, 3), (2, 4)])
+
+        self.s1.on_completed()
+        self.assertTrue(self.o.is_completed)
@@ -0,0 +1,101 @@
+import unittest
+
+from rxbackpressure.ack import Continue, Stop, continue_ack, stop_ack
+from rxbackpressure.observableop import ObservableOp
+from rxbackpressure.observables.zipnobservable import ZipNObservable
+from rxbackpressure.testing.testobservable import TestObservable
+from rxbackpressure.testing.testobserver import TestObserver
+from rxbackpressure.testing.testscheduler import TestScheduler
+
+
+class TestZipNObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TestScheduler()
+        self.sources = [TestObservable(), TestObservable(), TestObservable()]
+        self.o = TestObserver()
+
+    def subscribe(self, selector=None):
+        ZipNObservable(self.sources, selector=selector) \
+            .subscribe(self.o, self.scheduler)
+        self.scheduler.advance_by(1)
+
+    def test_zips_once_all_inputs_have_an_item(self):
+        s1, s2, s3 = self.sources
+        self.o.immediate_continue = 10
+        self.subscribe()
+
+        ack1 = s1.on_next(1)
+        ack3 = s3.on_next(3)
+        self.assertListEqual(self.o.received, [])
+
+        self.assertIsInstance(s2.on_next(2), Continue)
+        self.assertListEqual(self.o.received, [(1, 2, 3)])
+        self.assertIsInstance(ack1.value, Continue)
+        self.assertIsInstance(ack3.value, Continue)
+
+    def test_selector_takes_an_item_of_each_input(self):
+        s1, s2, s3 = self.sources
+        self.o.immediate_continue = 10
+        self.subscribe(selector=lambda a, b, c: a + b + c)
+
+        s1.on_next_batch([1, 2])
+        ack2 = s2.on_next_batch([10, 20, 30])
+        self.assertIsInstance(s3.on_next_batch([100, 200]), Continue)
+        self.assertListEqual(self.o.received, [111, 222])
+
+        # the remaining item of the second input waits for the other inputs
+        self.assertFalse(ack2.has_value)
+        s1.on_next(3)
+        s3.on_next(300)
+        self.assertListEqual(self.o.received, [111, 222, 333])
+        self.assertIsInstance(ack2.value, Continue)
+
+    def test_inputs_wait_for_acknowledgment(self):
+        s1, s2, s3 = self.sources
+        self.subscribe()
+
+        ack1 = s1.on_next(1)
+        ack2 = s2.on_next(2)
+        ack3 = s3.on_next(3)
+        self.assertFalse(ack1.has_value)
+        self.assertFalse(ack3.has_value)
+
+        self.o.ack.on_next(continue_ack)
+        self.o.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertIsInstance(ack1.value, Continue)
+        self.assertIsInstance(ack2.value, Continue)
+        self.assertIsInstance(ack3.value, Continue)
+
+    def test_stop_is_forwarded_to_all_inputs(self):
+        s1, s2, s3 = self.sources
+        self.subscribe()
+
+        ack1 = s1.on_next(1)
+        ack2 = s2.on_next(2)
+        ack3 = s3.on_next(3)
+
+        self.o.ack.on_next(stop_ack)
+        self.o.ack.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertIsInstance(ack1.value, Stop)
+        self.assertIsInstance(ack2.value, Stop)
+        self.assertIsInstance(ack3.value, Stop)
+
+    def test_completes_with_shortest_input(self):
+        s1, s2, s3 = self.sources
+        self.o.immediate_continue = 10
+        self.subscribe()
+
+        s1.on_next(1)
+        s2.on_next(2)
+        s3.on_next(3)
+        s2.on_completed()
+        self.scheduler.advance_by(1)
+        self.assertTrue(self.o.is_completed)
+
+    def test_zip_all(self):
+        sources = [ObservableOp.from_(range(i, i + 5)) for i in range(8)]
+        received = list(ObservableOp.zip_all(*sources, selector=lambda *v: sum(v)).to_iterable())
+        self.assertListEqual(received, [sum(range(i, i + 8)) for i in range(5)])